@@ -0,0 +1,68 @@
+"""
+Throughput, memory and false-positive benchmark of the event deduplicator.
+
+Feeds `--ids` random event ids, spread over matches of `--events-per-match` ids each, through
+``EventDeduplicator`` with `--resend` of them re-delivered. Every match is closed once all
+of its events have arrived, so re-deliveries of earlier matches are caught by the Bloom filter.
+It then probes the filter with ids that were never seen to measure its false-positive rate, and
+compares the filter size with an exact set holding every id.
+
+Usage:
+    poetry run python scripts/benchmarks/bench_dedup.py --ids 2000000 --error-rate 1e-4
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+import uuid
+from football_stream_processor.stream.dedup import EventDeduplicator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark event id deduplication.")
+    parser.add_argument("--ids", type=int, default=2000000, help="Number of distinct event ids.")
+    parser.add_argument("--events-per-match", type=int, default=3500, help="Event ids per match.")
+    parser.add_argument("--resend", type=float, default=0.05, help="Fraction of events delivered twice.")
+    parser.add_argument("--error-rate", type=float, default=1e-4, help="Target false-positive rate of the filter.")
+    parser.add_argument("--probes", type=int, default=200000, help="Unseen ids used to measure the false-positive rate.")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    ids = [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(args.ids)]
+    dedup = EventDeduplicator(capacity=args.ids, error_rate=args.error_rate)
+
+    resent = 0
+    start = time.perf_counter()
+    for match_start in range(0, args.ids, args.events_per_match):
+        match_id = match_start // args.events_per_match
+        for event_id in ids[match_start:match_start + args.events_per_match]:
+            dedup.is_duplicate({"id": event_id}, match_id)
+        dedup.close_match(match_id)
+        # Re-deliver a sample of every earlier id range, as a replay after a crash would
+        for event_id in rng.sample(ids[:match_start + args.events_per_match],
+                                   int(args.resend * min(args.events_per_match, args.ids - match_start))):
+            resent += dedup.is_duplicate({"id": event_id}, match_id)
+    elapsed = time.perf_counter() - start
+
+    probes = [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(args.probes)]
+    false_positives = sum(probe in dedup.filter for probe in probes)
+
+    tracemalloc.start()
+    exact = set(ids)
+    exact_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del exact
+
+    stats = dedup.stats()
+    print(f"Checked {stats['checked']} events in {elapsed:.2f}s ({stats['checked'] / elapsed:.0f} events/s)")
+    print(f"Re-deliveries suppressed: {resent}, exact hits {stats['exact_hits']}, filter hits {stats['filter_hits']}")
+    print(f"False positives on live matches: {stats['false_positives']}")
+    print(f"Probe false-positive rate: {false_positives / args.probes:.2e} "
+          f"(target {args.error_rate:.0e}, expected {stats['expected_error_rate']:.2e})")
+    print(f"Filter: {stats['filter_bytes'] / 1e6:.1f} MB for {stats['filter_ids']} ids, "
+          f"exact set: {exact_bytes / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
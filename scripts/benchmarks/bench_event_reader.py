@@ -0,0 +1,73 @@
+"""
+Benchmark the streaming event reader against ``json.load`` on real match files.
+
+For each file the script measures wall time and peak Python heap usage (tracemalloc) of:
+- ``json.load`` of the whole file,
+- ``iter_events`` over all events,
+- ``iter_events`` keeping only passes.
+
+Usage:
+    poetry run python scripts/benchmarks/bench_event_reader.py --limit 20
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from football_stream_processor.config import DATA_DIR
+from football_stream_processor.utils.event_reader import iter_events
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def json_load(path):
+    with open(path, "r") as f:
+        events = json.load(f)
+    return sum(1 for e in events if e.get("type", {}).get("name") == "Pass")
+
+
+def stream_all(path):
+    return sum(1 for e in iter_events(path) if e.get("type", {}).get("name") == "Pass")
+
+
+def stream_passes(path):
+    return sum(1 for _ in iter_events(path, event_types={"Pass"}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare iter_events with json.load on StatsBomb event files.")
+    parser.add_argument("--events-dir", type=Path, default=Path(DATA_DIR) / "events", help="Directory of event JSON files.")
+    parser.add_argument("--limit", type=int, default=20, help="Number of event files to benchmark.")
+    args = parser.parse_args()
+
+    files = sorted(args.events_dir.glob("*.json"))[:args.limit]
+    if not files:
+        print(f"No event files found in {args.events_dir}")
+        return
+
+    readers = {"json.load": json_load, "iter_events": stream_all, "iter_events(Pass)": stream_passes}
+    totals = {name: [0.0, 0] for name in readers}
+    for path in files:
+        for name, reader in readers.items():
+            elapsed, peak = measure(lambda: reader(path))
+            totals[name][0] += elapsed
+            totals[name][1] = max(totals[name][1], peak)
+
+    size_mb = sum(path.stat().st_size for path in files) / 1e6
+    print(f"{len(files)} files, {size_mb:.1f} MB")
+    print(f"{'reader':<20}{'total (s)':>12}{'ms/file':>12}{'peak heap (MB)':>18}")
+    for name, (elapsed, peak) in totals.items():
+        print(f"{name:<20}{elapsed:>12.3f}{elapsed / len(files) * 1000:>12.1f}{peak / 1e6:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
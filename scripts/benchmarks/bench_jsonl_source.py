@@ -0,0 +1,68 @@
+"""
+Throughput and latency benchmark of the JSON Lines ingestion source.
+
+Writes a synthetic feed (events of the open-data files, repeated until `--events` lines)
+to a temporary JSON Lines file and ingests it with ``JsonLinesSource`` for several batch
+sizes. Reports sustained events/sec and the p50/p99 time from parsing an event to handing
+out its micro-batch.
+
+Usage:
+    poetry run python scripts/benchmarks/bench_jsonl_source.py --events 200000 --batch-sizes 1 10 100 1000
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from itertools import cycle, islice
+from pathlib import Path
+import numpy as np
+from football_stream_processor.config import DATA_DIR
+from football_stream_processor.stream.jsonl_source import JsonLinesSource, tail_lines
+from football_stream_processor.utils.event_reader import iter_events
+
+
+def write_feed(path: Path, events_dir: Path, n_events: int) -> None:
+    files = sorted(events_dir.glob("*.json"))[:5]
+    source = (event for json_file in cycle(files) for event in iter_events(json_file))
+    with open(path, "w") as f:
+        for event in islice(source, n_events):
+            f.write(json.dumps(event, separators=(",", ":")))
+            f.write("\n")
+
+
+async def ingest(path: Path, batch_size: int) -> tuple[JsonLinesSource, float]:
+    source = JsonLinesSource(tail_lines(path, follow=False), batch_size=batch_size, max_delay=0.01)
+    start = time.perf_counter()
+    async for _ in source.iter_batches():
+        pass
+    return source, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON Lines ingestion.")
+    parser.add_argument("--events-dir", type=Path, default=Path(DATA_DIR) / "events", help="Directory of event JSON files.")
+    parser.add_argument("--events", type=int, default=200000, help="Number of lines in the synthetic feed.")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 10, 100, 1000], help="Micro-batch sizes.")
+    args = parser.parse_args()
+
+    if not any(args.events_dir.glob("*.json")):
+        print(f"No events found in {args.events_dir}")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "feed.jsonl"
+        write_feed(path, args.events_dir, args.events)
+        size_mb = path.stat().st_size / 1e6
+        print(f"Feed: {args.events} events, {size_mb:.1f} MB")
+        print(f"{'batch':>8}{'events/s':>12}{'MB/s':>8}{'p50 ms':>9}{'p99 ms':>9}")
+        for batch_size in args.batch_sizes:
+            source, elapsed = asyncio.run(ingest(path, batch_size))
+            latencies = np.asarray(source.latencies) * 1000
+            print(f"{batch_size:>8}{source.events / elapsed:>12.0f}{size_mb / elapsed:>8.1f}"
+                  f"{np.percentile(latencies, 50):>9.2f}{np.percentile(latencies, 99):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark of ``summarize_events`` on a real match and on a synthetic match of N times its size.
+
+The synthetic match repeats the real events with fresh ids (related_events are remapped to
+the copy they belong to), so it has the same mix of pressures and related events. A linear
+summary takes about N times longer on it; the script exits with status 1 when the slowdown
+exceeds ``--max-ratio``, which catches a quadratic lookup coming back.
+
+Usage:
+    poetry run python scripts/benchmarks/bench_match_summary.py --file open-data/data/events/22912.json --scale 10
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from football_stream_processor.config import DATA_DIR
+from football_stream_processor.match.match_summary import summarize_events
+from football_stream_processor.utils.event_reader import iter_events
+
+
+def scale_events(events, scale):
+    scaled = []
+    for copy in range(scale):
+        for event in events:
+            event = dict(event)
+            if "id" in event:
+                event["id"] = f"{event['id']}-{copy}"
+            if "related_events" in event:
+                event["related_events"] = [f"{rel_id}-{copy}" for rel_id in event["related_events"]]
+            scaled.append(event)
+    return scaled
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the match summary on a real and a scaled match.")
+    parser.add_argument("--file", type=Path, default=None, help="Event JSON file. Defaults to the first file in the events directory.")
+    parser.add_argument("--scale", type=int, default=10, help="Size multiplier of the synthetic match.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timing repetitions.")
+    parser.add_argument("--max-ratio", type=float, default=20.0, help="Fail if synthetic/real runtime exceeds this.")
+    args = parser.parse_args()
+
+    path = args.file or next(iter(sorted((Path(DATA_DIR) / "events").glob("*.json"))), None)
+    if path is None:
+        print(f"No events found in {Path(DATA_DIR) / 'events'}")
+        return
+    events = list(iter_events(path))
+    scaled = scale_events(events, args.scale)
+
+    timings = {}
+    for name, data in (("real", events), (f"synthetic x{args.scale}", scaled)):
+        timings[name] = min(timeit.repeat(lambda: summarize_events(data), number=1, repeat=args.repeat))
+        print(f"{name:<16}{len(data):>10} events{timings[name] * 1000:>10.2f} ms"
+              f"{timings[name] / len(data) * 1e6:>8.2f} us/event")
+
+    ratio = timings[f"synthetic x{args.scale}"] / timings["real"]
+    print(f"Slowdown for {args.scale}x the events: {ratio:.1f}x")
+    if ratio > args.max_ratio:
+        print(f"[WARN] Slowdown exceeds {args.max_ratio}x; the summary is no longer linear in the number of events")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
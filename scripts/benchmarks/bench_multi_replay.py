@@ -0,0 +1,43 @@
+"""
+Capacity benchmark of concurrent match replay.
+
+Replays N matches at once on virtual clocks (event files are reused when N exceeds the
+number of files) for several values of N and worker processes, and prints aggregate
+events/sec, latency percentiles and the peak memory per active match.
+
+Usage:
+    poetry run python scripts/benchmarks/bench_multi_replay.py --matches 1 50 200 --workers 1 4
+"""
+
+import argparse
+from itertools import cycle, islice
+from pathlib import Path
+from football_stream_processor.config import DATA_DIR
+from football_stream_processor.match.multi_replay import run_multi_replay
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent multi-match replay.")
+    parser.add_argument("--events-dir", type=Path, default=Path(DATA_DIR) / "events", help="Directory of event JSON files.")
+    parser.add_argument("--matches", type=int, nargs="+", default=[1, 50, 200], help="Concurrent match counts.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4], help="Worker process counts.")
+    parser.add_argument("--memory", action="store_true", help="Also trace memory per active match (slower).")
+    args = parser.parse_args()
+
+    files = sorted(args.events_dir.glob("*.json"))
+    if not files:
+        print(f"No events found in {args.events_dir}")
+        return
+
+    print(f"{'matches':>8}{'workers':>8}{'events/s':>12}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'KB/match':>10}")
+    for n_matches in args.matches:
+        paths = list(islice(cycle(files), n_matches))
+        for workers in args.workers:
+            report, _ = run_multi_replay(paths, workers=workers, max_active=n_matches, measure_memory=args.memory)
+            memory = report.get("memory_per_active_match_kb", float("nan"))
+            print(f"{n_matches:>8}{workers:>8}{report['events_per_sec']:>12.0f}{report['latency_p50_ms']:>9.2f}"
+                  f"{report['latency_p95_ms']:>9.2f}{report['latency_p99_ms']:>9.2f}{memory:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Wall-clock time of the xG hyperparameter study for several worker counts.
+
+Runs `--trials` trials with ``run_study`` for each worker count against a fresh journal
+storage and a temporary SQLite MLflow store, so nothing is added to the project's studies
+or runs. Uses the pass dataset in ``.pickle/pass_data``; run it from the project root.
+
+Usage:
+    poetry run python scripts/benchmarks/bench_parallel_study.py --trials 16 --workers 1 2 4
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+from pathlib import Path
+import mlflow
+import optuna
+from football_stream_processor.config import PASS_DATA_PATH
+from football_stream_processor.models.xg_model.train import StudyData, get_storage, run_study
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel Optuna trials.")
+    parser.add_argument("--trials", type=int, default=16, help="Number of trials per study.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts.")
+    args = parser.parse_args()
+
+    if not Path(PASS_DATA_PATH).exists():
+        print(f"No pass dataset found at {PASS_DATA_PATH}")
+        return
+
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    print(f"{os.cpu_count()} CPUs, {args.trials} trials")
+    print(f"{'workers':>8}{'wall s':>9}{'speedup':>9}{'best AUC':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        mlflow.set_tracking_uri(f"sqlite:///{Path(tmp) / 'mlflow.db'}")
+        mlflow.set_experiment("bench-parallel-study")
+        baseline = None
+        for workers in args.workers:
+            storage = str(Path(tmp) / f"journal-{workers}.log")
+            study = optuna.create_study(direction="maximize", study_name=f"bench-{workers}", storage=get_storage(storage))
+            start = time.perf_counter()
+            # Trials print classification reports
+            with contextlib.redirect_stdout(io.StringIO()), mlflow.start_run() as parent:
+                run_study(study, StudyData(), args.trials, workers, storage, parent.info.run_id)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{workers:>8}{elapsed:>9.1f}{baseline / elapsed:>9.2f}{study.best_value:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Compute and best ROC AUC of the xG hyperparameter study with and without pruning.
+
+Runs the same seeded study with every trial training its full `n_estimators`, with early
+stopping only, with early stopping plus the median or Hyperband pruner, and with the first
+trials on a stratified subsample. Reports wall-clock time, boosting rounds trained, pruned
+trials and the best test ROC AUC. MLflow runs go to a temporary SQLite store.
+
+Usage:
+    poetry run python scripts/benchmarks/bench_pruning.py --trials 30
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+import mlflow
+import optuna
+from football_stream_processor.config import PASS_DATA_PATH
+from football_stream_processor.models.xg_model.train import StudyData, create_pruner, run_study
+from football_stream_processor.utils.column_store import load_columns
+
+CONFIGS = [
+    # (name, pruner, early stopping rounds, subsampled trials)
+    ("full", "none", None, 0),
+    ("early-stop", "none", 50, 0),
+    ("median", "median", 50, 0),
+    ("hyperband", "hyperband", 50, 0),
+    ("median+subsample", "median", 50, 10),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark trial pruning in the xG hyperparameter study.")
+    parser.add_argument("--pass-data", type=Path, default=Path(PASS_DATA_PATH), help="Pass dataset column store.")
+    parser.add_argument("--trials", type=int, default=30, help="Number of trials per study.")
+    args = parser.parse_args()
+
+    if not args.pass_data.exists():
+        print(f"No pass dataset found at {args.pass_data}")
+        return
+
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = StudyData(load_columns(args.pass_data))
+
+    print(f"{'config':>18}{'wall s':>9}{'rounds':>9}{'pruned':>8}{'best AUC':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        mlflow.set_tracking_uri(f"sqlite:///{Path(tmp) / 'mlflow.db'}")
+        mlflow.set_experiment("bench-pruning")
+        for name, pruner, early_stopping_rounds, subsample_trials in CONFIGS:
+            study = optuna.create_study(direction="maximize", sampler=optuna.samplers.TPESampler(seed=0),
+                                        pruner=create_pruner(pruner))
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                run_study(study, data, args.trials, early_stopping_rounds=early_stopping_rounds,
+                          subsample_trials=subsample_trials)
+            elapsed = time.perf_counter() - start
+            rounds = sum(t.user_attrs.get("rounds", 0) for t in study.trials)
+            pruned = sum(t.state == optuna.trial.TrialState.PRUNED for t in study.trials)
+            print(f"{name:>18}{elapsed:>9.1f}{rounds:>9}{pruned:>8}{study.best_value:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Data-preparation share of an xG hyperparameter study, prepared per trial versus once per study.
+
+Runs `--trials` XGBoost fits with the same random hyperparameters twice: the way trials used
+to run, with every trial loading the pass dataset, running the EDA cleaning, splitting and
+fitting the preprocessor inside its pipeline, and with one ``StudyData`` shared by all trials.
+Reports seconds spent on data preparation and fitting and the resulting ROC AUC of each trial.
+
+Usage:
+    poetry run python scripts/benchmarks/bench_study_data.py --trials 10
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import time
+from pathlib import Path
+from sklearn.metrics import roc_auc_score
+from sklearn.pipeline import Pipeline
+from football_stream_processor.config import MODEL_NAME, PASS_DATA_PATH
+from football_stream_processor.models.xg_model.data_preparation import load_and_prepare_data
+from football_stream_processor.models.xg_model.model import get_model
+from football_stream_processor.models.xg_model.train import StudyData, create_preprocessor
+from football_stream_processor.utils.column_store import load_columns
+
+
+def sample_params(rng: random.Random, max_estimators: int) -> dict:
+    return {
+        "n_estimators": rng.randint(50, max_estimators),
+        "max_depth": rng.randint(3, 10),
+        "learning_rate": 10 ** rng.uniform(-2, -0.52),
+        "subsample": rng.uniform(0.5, 1.0),
+        "colsample_bytree": rng.uniform(0.5, 1.0),
+    }
+
+
+def per_trial(path: Path, trials: list[dict]) -> tuple[float, float, list[float]]:
+    prep = fit = 0.0
+    scores = []
+    for params in trials:
+        start = time.perf_counter()
+        X_train, X_test, y_train, y_test = load_and_prepare_data(load_columns(path))
+        prepared = time.perf_counter()
+        model = Pipeline([("preprocessor", create_preprocessor()), ("classifier", get_model(MODEL_NAME, **params))])
+        model.fit(X_train, y_train)
+        scores.append(roc_auc_score(y_test, model.predict_proba(X_test)[:, 1]))
+        prep += prepared - start
+        fit += time.perf_counter() - prepared
+    return prep, fit, scores
+
+
+def shared(path: Path, trials: list[dict]) -> tuple[float, float, list[float]]:
+    start = time.perf_counter()
+    data = StudyData(load_columns(path))
+    prep = time.perf_counter() - start
+    scores = []
+    for params in trials:
+        classifier = get_model(MODEL_NAME, **params).fit(data.Xt_train, data.y_train)
+        scores.append(roc_auc_score(data.y_test, classifier.predict_proba(data.Xt_test)[:, 1]))
+    return prep, time.perf_counter() - start - prep, scores
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark data preparation in the xG hyperparameter study.")
+    parser.add_argument("--pass-data", type=Path, default=Path(PASS_DATA_PATH), help="Pass dataset column store.")
+    parser.add_argument("--trials", type=int, default=10, help="Number of trials.")
+    parser.add_argument("--max-estimators", type=int, default=600, help="Upper bound of sampled n_estimators.")
+    args = parser.parse_args()
+
+    if not args.pass_data.exists():
+        print(f"No pass dataset found at {args.pass_data}")
+        return
+
+    rng = random.Random(0)
+    trials = [sample_params(rng, args.max_estimators) for _ in range(args.trials)]
+    print(f"{'mode':>10}{'prep s':>9}{'fit s':>9}{'prep %':>8}{'best AUC':>10}")
+    for mode, run in (("per-trial", per_trial), ("shared", shared)):
+        # The EDA cleaning prints a report on every call
+        with contextlib.redirect_stdout(io.StringIO()):
+            prep, fit, scores = run(args.pass_data, trials)
+        print(f"{mode:>10}{prep:>9.2f}{fit:>9.2f}{prep / (prep + fit):>8.1%}{max(scores):>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Micro-benchmark of StatsBomb timestamp parsing.
+
+Compares ``datetime.strptime`` with the slicing parser ``timestamp_to_seconds`` and the
+vectorized ``timestamps_to_seconds`` on the timestamps of real match files.
+
+Usage:
+    poetry run python scripts/benchmarks/bench_timestamps.py --limit 5
+"""
+
+import argparse
+import timeit
+from datetime import datetime
+from pathlib import Path
+from football_stream_processor.config import DATA_DIR
+from football_stream_processor.utils.event_reader import iter_events
+from football_stream_processor.utils.time_utils import timestamp_to_seconds, timestamps_to_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark timestamp parsing.")
+    parser.add_argument("--events-dir", type=Path, default=Path(DATA_DIR) / "events", help="Directory of event JSON files.")
+    parser.add_argument("--limit", type=int, default=5, help="Number of event files to take timestamps from.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timing repetitions.")
+    args = parser.parse_args()
+
+    files = sorted(args.events_dir.glob("*.json"))[:args.limit]
+    timestamps = [e["timestamp"] for path in files for e in iter_events(path)]
+    if not timestamps:
+        print(f"No events found in {args.events_dir}")
+        return
+
+    candidates = {
+        "datetime.strptime": lambda: [datetime.strptime(t, "%H:%M:%S.%f") for t in timestamps],
+        "timestamp_to_seconds": lambda: [timestamp_to_seconds(t) for t in timestamps],
+        "timestamps_to_seconds": lambda: timestamps_to_seconds(timestamps),
+    }
+
+    print(f"{len(timestamps)} timestamps from {len(files)} files")
+    baseline = None
+    for name, fn in candidates.items():
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        baseline = baseline or best
+        print(f"{name:<24}{best * 1000:>10.2f} ms{best / len(timestamps) * 1e9:>10.0f} ns/ts{baseline / best:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
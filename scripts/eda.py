@@ -1,12 +1,13 @@
 import os
 import mlflow
+from football_stream_processor.config import PASS_DATA_PATH
+from football_stream_processor.utils.column_store import load_columns
 from football_stream_processor.utils.eda_utils import PassDataEDA, add_engineered_features
-import pandas as pd
 
 def main():
     mlflow.set_experiment("football-pass-eda")
     with mlflow.start_run(run_name="eda-run"):
-        df = pd.read_pickle(".pickle/pass_data.pkl")
+        df = load_columns(PASS_DATA_PATH)
         df = add_engineered_features(df)
 
         eda = PassDataEDA(df)
@@ -18,10 +19,10 @@ def main():
         eda.eda_visualizations()
 
         # Log the DataFrame
-        if os.path.exists(".pickle/pass_data.pkl"):
-            mlflow.log_artifact(".pickle/pass_data.pkl", artifact_path="data")
+        if os.path.exists(PASS_DATA_PATH):
+            mlflow.log_artifacts(PASS_DATA_PATH, artifact_path="data/pass_data")
         else:
-            print("Warning: .pickle/pass_data.pkl does not exist and cannot be logged.")
+            print(f"Warning: {PASS_DATA_PATH} does not exist and cannot be logged.")
         
         # Log plots manually if saved to disk
         plot_dir = "resources/plots"
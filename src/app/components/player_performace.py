@@ -12,15 +12,16 @@ Functions
 """
 
 import os
-import json
 import pandas as pd
 import streamlit as st
 from mplsoccer import Pitch
 import matplotlib.pyplot as plt
 from football_stream_processor.config import DATA_DIR
+from football_stream_processor.utils.event_reader import iter_events
+from football_stream_processor.utils.spatial_grid import count_grid
 
 
-def plot_touch_heatmap_mpl(df_touches, player_name):
+def plot_touch_heatmap_mpl(df_touches, player_name, counts=None):
     """
     Generate a touch heatmap for a player using Matplotlib.
 
@@ -28,6 +29,9 @@ def plot_touch_heatmap_mpl(df_touches, player_name):
     :type df_touches: pd.DataFrame
     :param player_name: Name of the player.
     :type player_name: str
+    :param counts: Optional precomputed (20, 30) count grid, e.g. from ``ZoneCounts.grid``.
+        When given, the heatmap is drawn from it instead of binning the raw touches.
+    :type counts: np.ndarray or None
     :return: Matplotlib figure object for the heatmap.
     :rtype: matplotlib.figure.Figure
     """
@@ -41,11 +45,11 @@ def plot_touch_heatmap_mpl(df_touches, player_name):
                   line_zorder=2)
     pitch.draw(ax=ax)
 
-    # Create 2D histogram
-    bin_statistic = pitch.bin_statistic(
-        df_touches['x'], df_touches['y'],
-        statistic='count', bins=(30, 20)
-    )
+    # Create 2D histogram from the shared grid binning (same cells as pitch.bin_statistic)
+    bin_statistic = pitch.bin_statistic([], [], statistic='count', bins=(30, 20))
+    if counts is None:
+        counts = count_grid(df_touches['x'], df_touches['y'], bins=(30, 20))
+    bin_statistic['statistic'] = counts.astype(float)
 
     # Heatmap with better contrast
     pitch.heatmap(bin_statistic, ax=ax,
@@ -98,8 +102,7 @@ def render_player_performance(match_id):
     :return: None
     """
     path = os.path.join(DATA_DIR, "events", f"{match_id}.json")
-    with open(path, "r") as f:
-        events = json.load(f)
+    events = list(iter_events(path))
 
     players = sorted({e["player"]["name"] for e in events if "player" in e})
     selected_player = st.selectbox("Select Player", players)
@@ -10,10 +10,10 @@ Functions
 """
 
 import os
-import json
 import pandas as pd
 import matplotlib.pyplot as plt
 from football_stream_processor.config import DATA_DIR
+from football_stream_processor.utils.event_reader import iter_events
 from mplsoccer import Pitch
 import streamlit as st
 import matplotlib.patches as mpatches
@@ -31,13 +31,11 @@ def render_shot_map(match_id):
     :return: None
     """
     path = os.path.join(DATA_DIR, "events", f"{match_id}.json")
-    with open(path, "r") as f:
-        events = json.load(f)
 
     # Extract shot events
     shots = []
-    for e in events:
-        if e.get("type", {}).get("name") == "Shot" and "location" in e:
+    for e in iter_events(path, event_types={"Shot"}):
+        if "location" in e:
             loc = e["location"]
             xg = e.get("shot", {}).get("statsbomb_xg", 0)
             outcome = e.get("shot", {}).get("outcome", {}).get("name", "Unknown")
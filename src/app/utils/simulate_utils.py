@@ -6,17 +6,20 @@ aggregating pass networks, and rendering interactive match simulations with Stre
 
 Functions
 ---------
-- load_matches: Load and cache all matches from StatsBomb open-data into a DataFrame.
+- load_matches: Load and cache all matches from the persisted match catalog into a DataFrame.
 - load_match_events: Load events for a given match and extract passes & shots.
 - get_pass_network_data: Aggregate pass events into a pass network DataFrame.
 """
 
 import os
-import json
 import numpy as np
 import pandas as pd
 import streamlit as st
 from football_stream_processor.config import DATA_DIR
+from football_stream_processor.match.catalog import MatchCatalog
+from football_stream_processor.match.rolling_metrics import period_seconds
+from football_stream_processor.utils.event_reader import iter_events
+from football_stream_processor.utils.time_utils import MatchClock
 
 
 @st.cache_data
@@ -24,33 +27,13 @@ def load_matches():
     """
     Load and cache all matches from StatsBomb open-data into a DataFrame.
 
+    The matches come from the persisted :class:`MatchCatalog`, which only re-parses
+    season files that changed since the catalog was last built.
+
     :return: DataFrame of matches with columns [match_id, home_team, away_team, competition, season, date].
     :rtype: pd.DataFrame
     """
-    matches = []
-    matches_dir = os.path.join(DATA_DIR, "matches")
-
-    for comp in os.listdir(matches_dir):
-        comp_path = os.path.join(matches_dir, comp)
-        for season_file in os.listdir(comp_path):
-            season_path = os.path.join(comp_path, season_file)
-            if not season_path.endswith(".json"):
-                continue
-
-            with open(season_path, "r") as f:
-                data = json.load(f)
-                for m in data:
-                    comp_name = m["competition"]["competition_name"]
-                    matches.append({
-                        "match_id": m["match_id"],
-                        "home_team": m["home_team"]["home_team_name"],
-                        "away_team": m["away_team"]["away_team_name"],
-                        "competition": comp_name,
-                        "season": m["season"]["season_name"],
-                        "date": m["match_date"]
-                    })
-    df = pd.DataFrame(matches)
-    return df.sort_values(["competition", "season", "date"])
+    return MatchCatalog().refresh().frame
 
 
 @st.cache_data
@@ -58,31 +41,35 @@ def load_match_events(match_id):
     """
     Load events for a given match and extract passes & shots.
 
+    Times are match seconds on the :class:`MatchClock` axis, the same axis as the ``time``
+    column of ``rolling_metrics``, so stoppage time does not make them go backwards.
+
     :param match_id: Match identifier.
     :type match_id: int or str
     :return: Tuple (passes, xg_team1, xg_team2, times)
     :rtype: (list, np.ndarray, np.ndarray, list)
     """
     path = os.path.join(DATA_DIR, "events", f"{match_id}.json")
-    with open(path, "r") as f:
-        events = json.load(f)
 
     passes = []
     xg_team1, xg_team2, times = [], [], []
-    home_name = events[0]["team"]["name"] if events else "Home"
+    home_name = None
+    clock = MatchClock()
 
-    for e in events:
+    for e in iter_events(path):
+        if home_name is None:
+            home_name = e["team"]["name"]
+        t = int(clock.observe(e.get("period", 1), period_seconds(e)))
         if e["type"]["name"] == "Pass" and "location" in e and e["location"]:
             x, y = e["location"]
             passes.append({
                 "x": x / 1.2,  # Rescale 120 -> 100
                 "y": y / 1.33, # Rescale 80 -> 60
-                "time": int(e.get("minute", 0) * 60 + e.get("second", 0))
+                "time": t
             })
         if e["type"]["name"] == "Shot":
             team = e["team"]["name"]
             xg = float(e.get("shot", {}).get("statsbomb_xg", 0))
-            t = int(e.get("minute", 0) * 60 + e.get("second", 0))
             if team == home_name:
                 xg_team1.append(xg)
                 xg_team2.append(0)
@@ -110,14 +97,11 @@ def get_pass_network_data(match_id):
     :rtype: pd.DataFrame
     """
     path = os.path.join(DATA_DIR, "events", f"{match_id}.json")
-    with open(path, "r", encoding="utf-8") as f:
-        events = json.load(f)
 
     data = []
-    for e in events:
+    for e in iter_events(path, event_types={"Pass"}):
         if (
-            e.get("type", {}).get("name") == "Pass"
-            and "pass" in e
+            "pass" in e
             and "recipient" in e["pass"]
             and "location" in e
         ):
@@ -7,12 +7,11 @@ including shot maps, player performance, pass networks, and xG timelines.
 Functions
 ---------
 - get_match_kpis: Compute key match-level KPIs (total shots, passes, xG, pass accuracy).
-- render_xg_timeline: Plot cumulative xG over time for both teams.
+- render_xg_timeline: Plot cumulative (and optionally rolling) xG over time for both teams.
 - match_analysis_page: Renders the match analysis dashboard page.
 """
 
 import os
-import json
 import streamlit as st
 import plotly.graph_objects as go
 
@@ -20,6 +19,8 @@ from utils.simulate_utils import load_matches, load_match_events
 from utils.ui_helpers import kpi_card
 
 from football_stream_processor.config import DATA_DIR
+from football_stream_processor.match.rolling_metrics import rolling_metrics
+from football_stream_processor.utils.event_reader import iter_events
 
 from components.shot_map import render_shot_map
 from components.player_performace import render_player_performance
@@ -36,8 +37,7 @@ def get_match_kpis(match_id):
     :rtype: dict
     """
     path = os.path.join(DATA_DIR, "events", f"{match_id}.json")
-    with open(path, "r") as f:
-        events = json.load(f)
+    events = list(iter_events(path, event_types={"Pass", "Shot"}))
 
     total_shots = sum(1 for e in events if e.get("type", {}).get("name") == "Shot")
     total_passes = sum(1 for e in events if e.get("type", {}).get("name") == "Pass")
@@ -56,15 +56,16 @@ def get_match_kpis(match_id):
     }
 
 
-def render_xg_timeline(xg_team1, xg_team2, times, team1_name, team2_name):
+def render_xg_timeline(xg_team1, xg_team2, times, team1_name, team2_name, rolling=None):
     """
     Plot cumulative xG over time for both teams.
 
     :param xg_team1: List of cumulative xG values for team 1.
     :param xg_team2: List of cumulative xG values for team 2.
-    :param times: List of time points.
+    :param times: List of time points in match seconds on the ``MatchClock`` axis of `rolling`.
     :param team1_name: Name of team 1.
     :param team2_name: Name of team 2.
+    :param rolling: Optional output of ``rolling_metrics``; its windowed xG is drawn as dashed lines.
     :return: Plotly Figure object.
     :rtype: plotly.graph_objects.Figure
     """
@@ -74,6 +75,12 @@ def render_xg_timeline(xg_team1, xg_team2, times, team1_name, team2_name):
     fig.add_trace(go.Scatter(x=times, y=xg_team2, name=team2_name,
                              line=dict(color="#d62728", width=3)))
 
+    if rolling is not None:
+        for team, color in ((team1_name, "#1f77b4"), (team2_name, "#d62728")):
+            team_rows = rolling[rolling["team"] == team]
+            fig.add_trace(go.Scatter(x=team_rows["time"], y=team_rows["xg"], name=f"{team} (rolling)",
+                                     line=dict(color=color, width=2, dash="dot")))
+
     fig.update_layout(
         template="plotly_dark",
         title="<b>xG Accumulation Over Time</b>",
@@ -116,22 +123,22 @@ def match_analysis_page():
 
     st.markdown("<h1 style='color:white;text-align:center;'>⚽ Match Analysis Dashboard</h1>", unsafe_allow_html=True)
 
-    # Match selector
+    # Match selector (labels built once instead of filtering the catalog for every option)
     matches_df = load_matches()
+    matches = {
+        row.match_id: row
+        for row in matches_df[["match_id", "home_team", "away_team", "date"]].itertuples(index=False)
+    }
     match_id = st.selectbox(
         "Select a Match",
-        matches_df["match_id"].tolist(),
-        format_func=lambda mid: (
-            f"{matches_df.loc[matches_df['match_id']==mid, 'home_team'].values[0]} vs "
-            f"{matches_df.loc[matches_df['match_id']==mid, 'away_team'].values[0]} "
-            f"({matches_df.loc[matches_df['match_id']==mid, 'date'].values[0]})"
-        )
+        list(matches),
+        format_func=lambda mid: f"{matches[mid].home_team} vs {matches[mid].away_team} ({matches[mid].date})"
     )
 
     # Load KPIs & Events
     passes, xg_team1, xg_team2, times = load_match_events(match_id)
-    home_team = matches_df.loc[matches_df['match_id'] == match_id, 'home_team'].values[0]
-    away_team = matches_df.loc[matches_df['match_id'] == match_id, 'away_team'].values[0]
+    home_team = matches[match_id].home_team
+    away_team = matches[match_id].away_team
     kpis = get_match_kpis(match_id)
 
     # KPI Cards
@@ -153,6 +160,9 @@ def match_analysis_page():
     with tab3:
         render_pass_network(match_id)
     with tab4:
-        fig_xg = render_xg_timeline(xg_team1, xg_team2, times, home_team, away_team)
+        window = st.slider("Rolling window (minutes)", 5, 30, 10, step=5)
+        rolling = rolling_metrics(iter_events(os.path.join(DATA_DIR, "events", f"{match_id}.json")),
+                                  window=window * 60, step=60)
+        fig_xg = render_xg_timeline(xg_team1, xg_team2, times, home_team, away_team, rolling=rolling)
         st.plotly_chart(fig_xg, use_container_width=True)
     return
\ No newline at end of file
@@ -1,21 +1,10 @@
-import json
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation, FFMpegWriter
 from matplotlib.patches import Circle
-from datetime import datetime
 import argparse
 import os
-
-def parse_time(timestamp):
-    """
-    Convert StatsBomb timestamp string to datetime.
-
-    :param timestamp: Timestamp string in the format "%H:%M:%S.%f"
-    :type timestamp: str
-    :return: Corresponding datetime object
-    :rtype: datetime
-    """
-    return datetime.strptime(timestamp, "%H:%M:%S.%f")
+from football_stream_processor.utils.event_reader import iter_events
+from football_stream_processor.utils.time_utils import elapsed_seconds
 
 def load_events(filepath):
     """
@@ -27,10 +16,8 @@ def load_events(filepath):
     :rtype: list[dict]
     :raises ValueError: If no valid actions are found in the file
     """
-    with open(filepath) as f:
-        events = json.load(f)
     actions = []
-    for e in events:
+    for e in iter_events(filepath, event_types={"Pass", "Carry", "Shot"}):
         # Passes
         if (
             e.get("type", {}).get("name") == "Pass"
@@ -39,6 +26,7 @@ def load_events(filepath):
         ):
             actions.append({
                 "type": "pass",
+                "period": e["period"],
                 "timestamp": e["timestamp"],
                 "start": e["location"],
                 "end": e["pass"]["end_location"]
@@ -52,6 +40,7 @@ def load_events(filepath):
         ):
             actions.append({
                 "type": "carry",
+                "period": e["period"],
                 "timestamp": e["timestamp"],
                 "start": e["location"],
                 "end": e["carry"]["end_location"]
@@ -65,6 +54,7 @@ def load_events(filepath):
         ):
             actions.append({
                 "type": "shot",
+                "period": e["period"],
                 "timestamp": e["timestamp"],
                 "start": e["location"],
                 "end": e["shot"]["end_location"][:2]
@@ -72,9 +62,9 @@ def load_events(filepath):
     if not actions:
         raise ValueError("No valid passes, carries, or shots found in the provided JSON file.")
 
-    base_time = parse_time(actions[0]["timestamp"])
-    for action in actions:
-        action["time_sec"] = (parse_time(action["timestamp"]) - base_time).total_seconds()
+    times = elapsed_seconds([a["period"] for a in actions], [a["timestamp"] for a in actions])
+    for action, t in zip(actions, times - times[0]):
+        action["time_sec"] = float(t)
     return sorted(actions, key=lambda x: x["time_sec"])
 
 def draw_pitch(ax, pitch_color="green"):
@@ -4,13 +4,13 @@ Animate and visualize passes from StatsBomb event data.
 This script loads event data, extracts passes, and animates them on a football pitch.
 """
 
-import json
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation, FFMpegWriter
 from matplotlib.patches import Circle
-from datetime import datetime
 import argparse
 import os
+from football_stream_processor.utils.event_reader import iter_events
+from football_stream_processor.utils.time_utils import elapsed_seconds
 
 
 def load_events(filepath):
@@ -23,36 +23,21 @@ def load_events(filepath):
     :rtype: list[dict]
     :raises ValueError: If no valid passes are found in the file
     """
-    with open(filepath) as f:
-        events = json.load(f)
     passes = [
-        e for e in events
-        if e.get("type", {}).get("name") == "Pass"
-        and "location" in e
+        e for e in iter_events(filepath, event_types={"Pass"})
+        if "location" in e
         and "end_location" in e.get("pass", {})
     ]
     if not passes:
         raise ValueError("No valid passes found in the provided JSON file.")
 
-    base_time = parse_time(passes[0]["timestamp"])
-    for event in passes:
-        event["time_sec"] = (parse_time(event["timestamp"]) - base_time).total_seconds()
+    times = elapsed_seconds([e["period"] for e in passes], [e["timestamp"] for e in passes])
+    for event, t in zip(passes, times - times[0]):
+        event["time_sec"] = float(t)
 
     return passes
 
 
-def parse_time(timestamp):
-    """
-    Convert StatsBomb timestamp string to datetime.
-
-    :param timestamp: Timestamp string in the format "%H:%M:%S.%f"
-    :type timestamp: str
-    :return: Corresponding datetime object
-    :rtype: datetime
-    """
-    return datetime.strptime(timestamp, "%H:%M:%S.%f")
-
-
 def draw_pitch(ax, pitch_color="#00E700"):
     """
     Draw a full football pitch on given Axes.
@@ -14,6 +14,9 @@ MODEL_FILENAME_TEMPLATE = "{model_name}_model.pkl"
 MODEL_SAVE_PATH = os.path.join(MODEL_DIR, MODEL_FILENAME_TEMPLATE.format(model_name=MODEL_NAME))
 PLOT_DIR = "resources/plots"
 PICKLE_DIR = ".pickle"
+PASS_DATA_PATH = os.path.join(PICKLE_DIR, "pass_data")
+PLAYER_INDEX_DIR = os.path.join(PICKLE_DIR, "player_index")
+OPTUNA_STORAGE = os.path.join(PICKLE_DIR, "optuna_journal.log")
 RESOURCES_DIR = "resources"
 DATA_DIR = "open-data/data"
 MLFLOW_DIR = ROOT_DIR / "mlflow"
@@ -0,0 +1,197 @@
+"""
+Persistent catalog of all matches in the StatsBomb open-data ``matches/`` folder.
+
+The catalog is stored as a column store sorted by competition, season and date, together
+with a small index (match_id order, competition/season row ranges and team rows) and a
+manifest of the size and mtime of the season files it was built from. Opening the catalog
+only stats the season files; a season file is parsed again only when its size or mtime
+changed. The rows of unchanged files are taken from the stored columns, whose `source`
+column records the season file of every row.
+"""
+
+import json
+import os
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Optional
+from football_stream_processor.config import DATA_DIR, PICKLE_DIR
+from football_stream_processor.utils.column_store import column_store_exists, load_columns, save_columns
+
+CATALOG_COLUMNS = ["match_id", "home_team", "away_team", "competition", "season", "date"]
+SOURCE_COLUMN = "source"
+
+
+def _parse_season_file(season_path: Path) -> list[list]:
+    with open(season_path, "r") as f:
+        data = json.load(f)
+    return [
+        [
+            m["match_id"],
+            m["home_team"]["home_team_name"],
+            m["away_team"]["away_team_name"],
+            m["competition"]["competition_name"],
+            m["season"]["season_name"],
+            m["match_date"],
+        ]
+        for m in data
+    ]
+
+
+class MatchCatalog:
+    """
+    Columnar, incrementally refreshed match catalog.
+
+    :param catalog_dir: Directory where the catalog is persisted.
+    :type catalog_dir: Path
+    :param matches_dir: StatsBomb ``matches/`` directory (one folder per competition).
+    :type matches_dir: Path
+    """
+
+    def __init__(self, catalog_dir: Path = Path(PICKLE_DIR) / "match_catalog",
+                 matches_dir: Path = Path(DATA_DIR) / "matches"):
+        self.catalog_dir = Path(catalog_dir)
+        self.matches_dir = Path(matches_dir)
+        self.frame = None
+        self.index = None
+        self._match_id_order = None
+        self._sorted_ids = None
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.catalog_dir / "manifest.json"
+
+    def _scan_season_files(self) -> dict[str, dict]:
+        files = {}
+        for comp in sorted(os.scandir(self.matches_dir), key=lambda e: e.name):
+            if not comp.is_dir():
+                continue
+            for season in sorted(os.scandir(comp.path), key=lambda e: e.name):
+                if season.name.endswith(".json"):
+                    stat = season.stat()
+                    files[f"{comp.name}/{season.name}"] = {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+        return files
+
+    def _load_manifest(self) -> dict:
+        if self.manifest_path.exists():
+            with open(self.manifest_path, "r") as f:
+                return json.load(f)
+        return {"files": {}}
+
+    def refresh(self) -> "MatchCatalog":
+        """
+        Open the catalog, re-parsing only season files that were added or changed.
+
+        :return: The catalog itself, with `frame` and `index` loaded.
+        :rtype: MatchCatalog
+        """
+        current = self._scan_season_files()
+        manifest = self._load_manifest()
+        cached = manifest["files"]
+
+        unchanged = all(
+            name in cached and cached[name]["size"] == stat["size"] and cached[name]["mtime"] == stat["mtime"]
+            for name, stat in current.items()
+        ) and set(cached) == set(current)
+
+        columns_dir = self.catalog_dir / "columns"
+        if unchanged and column_store_exists(columns_dir):
+            return self._load()
+
+        stored = load_columns(columns_dir, mmap=False) if column_store_exists(columns_dir) else None
+        if stored is not None and SOURCE_COLUMN not in stored:
+            stored = None
+
+        frames = []
+        parsed = 0
+        for name, stat in current.items():
+            entry = cached.get(name)
+            if stored is not None and entry is not None and entry["size"] == stat["size"] \
+                    and entry["mtime"] == stat["mtime"]:
+                frames.append(stored[stored[SOURCE_COLUMN] == name])
+            else:
+                frame = pd.DataFrame(_parse_season_file(self.matches_dir / name), columns=CATALOG_COLUMNS)
+                frames.append(frame.assign(**{SOURCE_COLUMN: name}))
+                parsed += 1
+        print(f"[INFO] Match catalog: parsed {parsed} of {len(current)} season files")
+
+        if frames:
+            df = pd.concat(frames, ignore_index=True)
+        else:
+            df = pd.DataFrame(columns=CATALOG_COLUMNS + [SOURCE_COLUMN])
+        df = df.sort_values(["competition", "season", "date"], kind="stable").reset_index(drop=True)
+        self._save(df, {"files": current})
+        return self._load()
+
+    def _save(self, df: pd.DataFrame, manifest: dict) -> None:
+        self.catalog_dir.mkdir(parents=True, exist_ok=True)
+        save_columns(df, self.catalog_dir / "columns")
+        np.save(self.catalog_dir / "match_id_order.npy", np.argsort(df["match_id"].to_numpy(), kind="stable"))
+
+        competitions = {}
+        for (comp, season), rows in df.groupby(["competition", "season"], sort=False).indices.items():
+            competitions.setdefault(comp, {})[season] = [int(rows.min()), int(rows.max()) + 1]
+        teams = {}
+        for column in ("home_team", "away_team"):
+            for team, rows in df.groupby(column, sort=False).indices.items():
+                teams.setdefault(team, []).extend(int(r) for r in rows)
+        index = {"competitions": competitions, "teams": {team: sorted(rows) for team, rows in teams.items()}}
+
+        with open(self.catalog_dir / "index.json", "w") as f:
+            json.dump(index, f)
+        with open(self.manifest_path, "w") as f:
+            json.dump(manifest, f)
+
+    def _load(self) -> "MatchCatalog":
+        self.frame = load_columns(self.catalog_dir / "columns", columns=CATALOG_COLUMNS)
+        self._match_id_order = np.load(self.catalog_dir / "match_id_order.npy", mmap_mode="r")
+        self._sorted_ids = self.frame["match_id"].to_numpy()[self._match_id_order]
+        with open(self.catalog_dir / "index.json", "r") as f:
+            self.index = json.load(f)
+        return self
+
+    def lookup(self, match_id: int) -> Optional[pd.Series]:
+        """
+        Find a match by id with a binary search over the match_id order.
+
+        :param match_id: Match identifier.
+        :type match_id: int
+        :return: The catalog row, or None if the match is unknown.
+        :rtype: pd.Series or None
+        """
+        sorted_ids = self._sorted_ids
+        pos = np.searchsorted(sorted_ids, match_id)
+        if pos == len(sorted_ids) or sorted_ids[pos] != match_id:
+            return None
+        return self.frame.iloc[int(self._match_id_order[pos])]
+
+    def filter(self, competition: Optional[str] = None, season: Optional[str] = None, team: Optional[str] = None,
+               date_from: Optional[str] = None, date_to: Optional[str] = None) -> pd.DataFrame:
+        """
+        Select matches by competition, season, team and date range using the stored index.
+
+        :param competition: Competition name.
+        :param season: Season name.
+        :param team: Team name, home or away.
+        :param date_from: First match date to include ("YYYY-MM-DD").
+        :param date_to: Last match date to include ("YYYY-MM-DD").
+        :return: Matching catalog rows.
+        :rtype: pd.DataFrame
+        """
+        rows = np.arange(len(self.frame))
+        if competition is not None:
+            seasons = self.index["competitions"].get(competition, {})
+            if season is not None:
+                seasons = {season: seasons[season]} if season in seasons else {}
+            ranges = [np.arange(start, stop) for start, stop in seasons.values()]
+            rows = np.concatenate(ranges) if ranges else np.array([], dtype=int)
+        if team is not None:
+            rows = np.intersect1d(rows, self.index["teams"].get(team, []))
+        subset = self.frame.iloc[np.sort(rows)]
+        if season is not None and competition is None:
+            subset = subset[subset["season"] == season]
+        if date_from is not None:
+            subset = subset[subset["date"] >= date_from]
+        if date_to is not None:
+            subset = subset[subset["date"] <= date_to]
+        return subset
@@ -0,0 +1,177 @@
+"""
+Corpus-wide match summaries grouped by competition, season and team.
+
+Map: every events file is streamed through a :class:`MatchSummaryAccumulator` in a worker
+process and reduced to per-team partials of raw counts (attempts, completions, xG, ...).
+Partials are plain sums, so they merge by addition in any order. Each match's partials are
+checkpointed to ``partials/<match_id>.json``; an interrupted run resumes by skipping the
+matches that already have a checkpoint.
+
+Reduce: the partials are joined with the match catalog and summed per competition, season
+and team. Rates are computed from the merged counts and the result is saved as column stores:
+- ``match_team/``: one row per match and team
+- ``team_season/``: one row per competition, season and team
+
+Usage:
+    poetry run python src/football_stream_processor/match/corpus_summary.py --workers 8
+"""
+
+import argparse
+import json
+import os
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from tqdm import tqdm
+from typing import Optional
+from football_stream_processor.config import DATA_DIR, PICKLE_DIR
+from football_stream_processor.match.catalog import MatchCatalog
+from football_stream_processor.match.match_summary import MatchSummaryAccumulator
+from football_stream_processor.utils.column_store import save_columns
+from football_stream_processor.utils.event_reader import iter_events
+
+COUNT_COLUMNS = [
+    "pass_attempts", "pass_completions", "carry_counts", "dribble_attempts", "dribble_successes",
+    "total_xg", "turnovers", "recoveries", "pressures", "successful_pressures",
+]
+GROUP_COLUMNS = ["competition", "season", "team"]
+
+
+def match_partials(json_file: Path, partials_dir: Optional[Path] = None) -> list[dict]:
+    """
+    Summarize one match into per-team partials and optionally checkpoint them.
+
+    :param json_file: Path to a StatsBomb events JSON file named ``<match_id>.json``.
+    :type json_file: Path
+    :param partials_dir: Directory for the checkpoint file. Nothing is written if None.
+    :type partials_dir: Path or None
+    :return: One dictionary per team with match_id, team and COUNT_COLUMNS.
+    :rtype: list[dict]
+    """
+    match_id = int(Path(json_file).stem)
+    accumulator = MatchSummaryAccumulator()
+    for event in iter_events(json_file):
+        accumulator.update(event)
+
+    counts = accumulator.counts
+    teams = sorted({team for column in COUNT_COLUMNS for team in counts[column]})
+    partials = [
+        dict({"match_id": match_id, "team": team}, **{column: counts[column].get(team, 0) for column in COUNT_COLUMNS})
+        for team in teams
+    ]
+    if partials_dir is not None:
+        checkpoint = Path(partials_dir) / f"{match_id}.json"
+        tmp_path = checkpoint.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(partials, f)
+        os.replace(tmp_path, checkpoint)
+    return partials
+
+
+def merge_partials(partials: pd.DataFrame, by: list[str]) -> pd.DataFrame:
+    """
+    Merge partials by summing their counts per group.
+
+    :param partials: Partials with COUNT_COLUMNS and the `by` columns.
+    :type partials: pd.DataFrame
+    :param by: Columns to group by.
+    :type by: list[str]
+    :return: One row per group with the summed counts and the number of matches.
+    :rtype: pd.DataFrame
+    """
+    grouped = partials.groupby(by, sort=True)
+    merged = grouped[COUNT_COLUMNS].sum()
+    merged["matches"] = grouped["match_id"].nunique()
+    return merged.reset_index()
+
+
+def _ratio(numerator: pd.Series, denominator: pd.Series) -> np.ndarray:
+    return np.where(denominator > 0, numerator / denominator.where(denominator > 0, 1) * 100, 0.0)
+
+
+def add_rates(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the percentage metrics of the match summary, computed from merged counts.
+
+    :param df: Frame with COUNT_COLUMNS.
+    :type df: pd.DataFrame
+    :return: The frame with pass_accuracy, dribble_success_rate and pressure_success_rate.
+    :rtype: pd.DataFrame
+    """
+    df["pass_accuracy"] = _ratio(df["pass_completions"], df["pass_attempts"])
+    df["dribble_success_rate"] = _ratio(df["dribble_successes"], df["dribble_attempts"])
+    df["pressure_success_rate"] = _ratio(df["successful_pressures"], df["pressures"])
+    return df
+
+
+def build_corpus_summary(events_dir: Path, output_dir: Path, catalog: Optional[MatchCatalog] = None,
+                         limit: Optional[int] = None, workers: int = 1, restart: bool = False) -> pd.DataFrame:
+    """
+    Summarize every match in `events_dir` and reduce the results per competition, season and team.
+
+    :param events_dir: Directory containing StatsBomb event JSON files.
+    :type events_dir: Path
+    :param output_dir: Output directory for checkpoints and column stores.
+    :type output_dir: Path
+    :param catalog: Refreshed match catalog used for competition and season. Defaults to the persisted catalog.
+    :type catalog: MatchCatalog or None
+    :param limit: Maximum number of event files to process. Defaults to all.
+    :type limit: int or None
+    :param workers: Number of worker processes.
+    :type workers: int
+    :param restart: Ignore existing checkpoints and summarize every match again.
+    :type restart: bool
+    :return: The per competition, season and team table.
+    :rtype: pd.DataFrame
+    """
+    output_dir = Path(output_dir)
+    partials_dir = output_dir / "partials"
+    partials_dir.mkdir(parents=True, exist_ok=True)
+
+    json_files = sorted(Path(events_dir).glob("*.json"))[:limit]
+    done = set() if restart else {path.stem for path in partials_dir.glob("*.json")}
+    todo = [path for path in json_files if path.stem not in done]
+    print(f"[INFO] Summarizing {len(todo)} of {len(json_files)} matches ({len(json_files) - len(todo)} checkpointed)")
+
+    if workers > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for _ in tqdm(executor.map(match_partials, todo, [partials_dir] * len(todo), chunksize=4),
+                          total=len(todo), desc="Summarizing matches"):
+                pass
+    else:
+        for json_file in tqdm(todo, desc="Summarizing matches"):
+            match_partials(json_file, partials_dir)
+
+    rows = []
+    for json_file in json_files:
+        with open(partials_dir / f"{json_file.stem}.json", "r") as f:
+            rows.extend(json.load(f))
+    match_team = pd.DataFrame(rows, columns=["match_id", "team"] + COUNT_COLUMNS)
+
+    catalog = catalog if catalog is not None else MatchCatalog().refresh()
+    info = catalog.frame[["match_id", "competition", "season"]]
+    match_team = match_team.merge(info, on="match_id", how="left")
+    match_team[["competition", "season"]] = match_team[["competition", "season"]].fillna("Unknown")
+
+    team_season = add_rates(merge_partials(match_team, GROUP_COLUMNS))
+    save_columns(add_rates(match_team), output_dir / "match_team")
+    save_columns(team_season, output_dir / "team_season")
+    print(f"[INFO] Saved {len(team_season)} team-season rows from {len(json_files)} matches to {output_dir}")
+    return team_season
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize every match and aggregate per competition, season and team.")
+    parser.add_argument("--limit", type=int, default=None, help="Maximum number of JSON files to process.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes.")
+    parser.add_argument("--output-dir", type=Path, default=Path(PICKLE_DIR) / "corpus_summary", help="Output directory.")
+    parser.add_argument("--restart", action="store_true", help="Ignore checkpoints from a previous run.")
+    args = parser.parse_args()
+
+    build_corpus_summary(Path(DATA_DIR) / "events", args.output_dir, limit=args.limit, workers=args.workers,
+                         restart=args.restart)
+
+
+if __name__ == "__main__":
+    main()
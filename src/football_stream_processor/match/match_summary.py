@@ -1,72 +1,177 @@
-
-import json
 import sys
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from football_stream_processor.utils.event_reader import iter_events
+
+# Related event types that make a pressure successful
+PRESSURE_SUCCESS_TYPES = frozenset({"Miscontrol", "Dispossessed", "Incomplete Pass"})
+TURNOVER_TYPES = frozenset({"Miscontrol", "Dispossessed"})
+
 
 def analyze_match_metrics(json_path):
-    with open(json_path, "r") as f:
-        data = json.load(f)
-
-    pass_attempts = defaultdict(int)
-    pass_completions = defaultdict(int)
-    carry_counts = defaultdict(int)
-    dribble_attempts = defaultdict(int)
-    dribble_successes = defaultdict(int)
-    total_xg = defaultdict(float)
-    turnovers = defaultdict(int)
-    recoveries = defaultdict(int)
-    pressures = defaultdict(int)
-    successful_pressures = defaultdict(int)
+    return summarize_events(list(iter_events(json_path)))
 
-    for event in data:
-        team = event.get("team", {}).get("name")
-        if not team:
-            continue
-        event_type = event.get("type", {}).get("name")
 
-        if event_type == "Pass":
-            pass_attempts[team] += 1
-            if "outcome" not in event.get("pass", {}):
-                pass_completions[team] += 1
-        elif event_type == "Carry":
-            carry_counts[team] += 1
-        elif event_type == "Dribble":
-            dribble_attempts[team] += 1
-            if event.get("dribble", {}).get("outcome", {}).get("name") == "Complete":
-                dribble_successes[team] += 1
-        elif event_type == "Shot":
-            total_xg[team] += event.get("shot", {}).get("statsbomb_xg", 0.0)
-        elif event_type in {"Miscontrol", "Dispossessed"}:
-            turnovers[team] += 1
-        elif event_type == "Ball Recovery":
-            recoveries[team] += 1
-        elif event_type == "Pressure":
-            pressures[team] += 1
-            related_ids = event.get("related_events", [])
-            for rel_event in data:
-                if rel_event["id"] in related_ids:
-                    rel_type = rel_event.get("type", {}).get("name")
-                    if rel_type in {"Miscontrol", "Dispossessed", "Incomplete Pass"}:
-                        successful_pressures[team] += 1
-                        break
+def _new_counts():
+    return {
+        "pass_attempts": defaultdict(int),
+        "pass_completions": defaultdict(int),
+        "carry_counts": defaultdict(int),
+        "dribble_attempts": defaultdict(int),
+        "dribble_successes": defaultdict(int),
+        "total_xg": defaultdict(float),
+        "turnovers": defaultdict(int),
+        "recoveries": defaultdict(int),
+        "pressures": defaultdict(int),
+        "successful_pressures": defaultdict(int),
+    }
+
+
+def _count_event(counts, team, event_type, event):
+    # Everything except pressure success, which depends on related events
+    if event_type == "Pass":
+        counts["pass_attempts"][team] += 1
+        if "outcome" not in event.get("pass", {}):
+            counts["pass_completions"][team] += 1
+    elif event_type == "Carry":
+        counts["carry_counts"][team] += 1
+    elif event_type == "Dribble":
+        counts["dribble_attempts"][team] += 1
+        if event.get("dribble", {}).get("outcome", {}).get("name") == "Complete":
+            counts["dribble_successes"][team] += 1
+    elif event_type == "Shot":
+        counts["total_xg"][team] += event.get("shot", {}).get("statsbomb_xg", 0.0)
+    elif event_type in TURNOVER_TYPES:
+        counts["turnovers"][team] += 1
+    elif event_type == "Ball Recovery":
+        counts["recoveries"][team] += 1
+    elif event_type == "Pressure":
+        counts["pressures"][team] += 1
+
+
+def _build_summary(counts):
+    pass_attempts, pass_completions = counts["pass_attempts"], counts["pass_completions"]
+    dribble_attempts, dribble_successes = counts["dribble_attempts"], counts["dribble_successes"]
+    pressures, successful_pressures = counts["pressures"], counts["successful_pressures"]
 
     pass_accuracy = {team: (pass_completions[team] / pass_attempts[team]) * 100 if pass_attempts[team] else 0 for team in pass_attempts}
     pressure_success_rate = {team: (successful_pressures[team] / pressures[team]) * 100 if pressures[team] else 0 for team in pressures}
 
     summary_metrics = {
         "Pass Accuracy (%)": pass_accuracy,
-        "Carries": dict(carry_counts),
-        "Successful Dribbles": dict(dribble_successes),
+        "Carries": dict(counts["carry_counts"]),
+        "Successful Dribbles": {team: n for team, n in dribble_successes.items() if n},
         "Dribble Success Rate (%)": {team: (dribble_successes[team] / dribble_attempts[team]) * 100 if dribble_attempts[team] else 0 for team in dribble_attempts},
-        "Total xG": dict(total_xg),
-        "Turnovers": dict(turnovers),
-        "Ball Recoveries": dict(recoveries),
+        "Total xG": dict(counts["total_xg"]),
+        "Turnovers": dict(counts["turnovers"]),
+        "Ball Recoveries": dict(counts["recoveries"]),
         "Pressures Applied": dict(pressures),
         "Pressure Success Rate (%)": pressure_success_rate
     }
 
     return summary_metrics
 
+
+def summarize_events(data):
+    # Event id -> type name, so related events of a pressure are resolved in O(1)
+    event_types = {event["id"]: event.get("type", {}).get("name") for event in data if "id" in event}
+    counts = _new_counts()
+
+    for event in data:
+        team = event.get("team", {}).get("name")
+        if not team:
+            continue
+        event_type = event.get("type", {}).get("name")
+        _count_event(counts, team, event_type, event)
+
+        if event_type == "Pressure":
+            if any(event_types.get(rel_id) in PRESSURE_SUCCESS_TYPES for rel_id in event.get("related_events", [])):
+                counts["successful_pressures"][team] += 1
+
+    return _build_summary(counts)
+
+
+class MatchSummaryAccumulator:
+    """
+    Incremental version of :func:`summarize_events` for live event feeds.
+
+    Events are added one at a time with :meth:`update` and :meth:`snapshot` returns the
+    summary of everything seen so far. A pressure is successful when one of its related
+    events has a type in PRESSURE_SUCCESS_TYPES; related events may arrive before or after
+    the pressure. Ids of successful related events already seen and related ids that
+    pressures are still waiting for are kept in bounded, oldest-first evicted maps. As long
+    as neither bound is hit, the final snapshot equals the batch summary of the same events.
+
+    :param max_pending: Maximum number of related event ids awaited by pressures.
+    :type max_pending: int
+    :param max_seen: Maximum number of remembered successful related event ids.
+    :type max_seen: int
+    """
+
+    def __init__(self, max_pending=10000, max_seen=10000):
+        self.max_pending = max_pending
+        self.max_seen = max_seen
+        self.counts = _new_counts()
+        self.events_seen = 0
+        self.evicted = 0
+        # related id -> pressures ([team, resolved]) waiting for that event
+        self._pending = OrderedDict()
+        # ids of seen events with a type in PRESSURE_SUCCESS_TYPES
+        self._success_ids = OrderedDict()
+
+    @property
+    def pending(self):
+        return len(self._pending)
+
+    def update(self, event):
+        """
+        Add one event to the summary.
+
+        :param event: StatsBomb event dictionary.
+        :type event: dict
+        """
+        self.events_seen += 1
+        event_type = event.get("type", {}).get("name")
+        event_id = event.get("id")
+
+        if event_id is not None:
+            waiting = self._pending.pop(event_id, None)
+            if event_type in PRESSURE_SUCCESS_TYPES:
+                for pressure in waiting or ():
+                    self._resolve(pressure)
+                self._success_ids[event_id] = None
+                if len(self._success_ids) > self.max_seen:
+                    self._success_ids.popitem(last=False)
+
+        team = event.get("team", {}).get("name")
+        if not team:
+            return
+        _count_event(self.counts, team, event_type, event)
+
+        if event_type == "Pressure":
+            pressure = [team, False]
+            for rel_id in event.get("related_events", []):
+                if rel_id in self._success_ids:
+                    self._resolve(pressure)
+                    return
+            for rel_id in event.get("related_events", []):
+                self._pending.setdefault(rel_id, []).append(pressure)
+            while len(self._pending) > self.max_pending:
+                self._pending.popitem(last=False)
+                self.evicted += 1
+
+    def _resolve(self, pressure):
+        if not pressure[1]:
+            pressure[1] = True
+            self.counts["successful_pressures"][pressure[0]] += 1
+
+    def snapshot(self):
+        """
+        :return: The summary of all events seen so far, in the format of :func:`summarize_events`.
+        :rtype: dict
+        """
+        return _build_summary(self.counts)
+
+
 if __name__ == "__main__":
 
     if len(sys.argv) < 2:
@@ -0,0 +1,183 @@
+"""
+Concurrent replay of many matches with throughput, latency and memory reporting.
+
+Every match runs as its own :class:`AsyncMatchReplay` task in one event loop, with its own
+clock, and every event is passed to a per-match consumer (by default a
+:class:`MatchSummaryAccumulator`). Matches can also be sharded over worker processes, each
+running its own event loop; the per-shard results are merged into one report.
+
+Event latency is the time from the moment an event was due on its clock until its consumer
+returned, so it includes the scheduling delay caused by all other active matches.
+
+Usage:
+    poetry run python src/football_stream_processor/match/multi_replay.py --matches 100 --workers 4
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
+from football_stream_processor.config import DATA_DIR
+from football_stream_processor.match.match_summary import MatchSummaryAccumulator
+from football_stream_processor.match.replay import AsyncMatchReplay, RealTimeClock, VirtualClock
+
+PERCENTILES = (50, 95, 99)
+
+
+def summary_consumer() -> Callable[[float, dict], None]:
+    accumulator = MatchSummaryAccumulator()
+    return lambda match_time, event: accumulator.update(event)
+
+
+def _make_clock(speed: Optional[float]):
+    return RealTimeClock(speed) if speed else VirtualClock()
+
+
+async def replay_matches(paths: list[Path], speed: Optional[float] = None, max_active: int = 200,
+                         consumer_factory: Callable[[], Callable] = summary_consumer,
+                         measure_memory: bool = False) -> dict:
+    """
+    Replay matches concurrently in the running event loop.
+
+    :param paths: Event JSON files to replay.
+    :type paths: list[Path]
+    :param speed: Playback speed factor for real-time clocks; None replays on virtual clocks.
+    :type speed: float or None
+    :param max_active: Maximum number of matches replayed at the same time.
+    :type max_active: int
+    :param consumer_factory: Called once per match; returns the handler for that match's events.
+    :type consumer_factory: Callable
+    :param measure_memory: Trace allocations to report the peak memory per active match (slower).
+    :type measure_memory: bool
+    :return: Raw results with 'elapsed', 'max_active', 'peak_memory' and per-match 'matches'
+        entries of match id, event count and latency array.
+    :rtype: dict
+    """
+    semaphore = asyncio.Semaphore(max_active)
+    active = 0
+    peak_active = 0
+    results = []
+
+    async def run_one(path: Path):
+        nonlocal active, peak_active
+        async with semaphore:
+            active += 1
+            peak_active = max(peak_active, active)
+            loop = asyncio.get_running_loop()
+            replay = AsyncMatchReplay(path, clock=_make_clock(speed))
+            handler = consumer_factory()
+            latencies = []
+            async for match_time, event in replay:
+                handler(match_time, event)
+                latencies.append(loop.time() - replay.clock.due)
+            active -= 1
+            results.append({"match": Path(path).stem, "events": len(latencies),
+                            "latencies": np.asarray(latencies, dtype=np.float64)})
+
+    if measure_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    await asyncio.gather(*(run_one(path) for path in paths))
+    elapsed = time.perf_counter() - start
+    peak_memory = None
+    if measure_memory:
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {"elapsed": elapsed, "max_active": peak_active, "peak_memory": peak_memory, "matches": results}
+
+
+def _replay_shard(paths: list[Path], speed: Optional[float], max_active: int, measure_memory: bool) -> dict:
+    return asyncio.run(replay_matches(paths, speed=speed, max_active=max_active, measure_memory=measure_memory))
+
+
+def build_report(shards: list[dict], elapsed: float) -> tuple[dict, pd.DataFrame]:
+    """
+    Merge shard results into aggregate numbers and a per-match latency table.
+
+    :param shards: Results of :func:`replay_matches`, one per shard.
+    :type shards: list[dict]
+    :param elapsed: Wall-clock seconds for the whole run.
+    :type elapsed: float
+    :return: Aggregate report and one row per match with latency percentiles in milliseconds.
+    :rtype: tuple[dict, pd.DataFrame]
+    """
+    matches = [match for shard in shards for match in shard["matches"]]
+    rows = []
+    for match in matches:
+        row = {"match": match["match"], "events": match["events"]}
+        for p in PERCENTILES:
+            row[f"latency_p{p}_ms"] = float(np.percentile(match["latencies"], p)) * 1000 if match["events"] else 0.0
+        rows.append(row)
+    per_match = pd.DataFrame(rows)
+
+    all_latencies = np.concatenate([m["latencies"] for m in matches]) if matches else np.zeros(0)
+    total_events = int(sum(m["events"] for m in matches))
+    report = {
+        "matches": len(matches),
+        "events": total_events,
+        "elapsed_s": elapsed,
+        "events_per_sec": total_events / elapsed if elapsed > 0 else 0.0,
+        "max_active": sum(shard["max_active"] for shard in shards),
+    }
+    for p in PERCENTILES:
+        report[f"latency_p{p}_ms"] = float(np.percentile(all_latencies, p)) * 1000 if all_latencies.size else 0.0
+    if all(shard["peak_memory"] is not None for shard in shards) and shards:
+        report["memory_per_active_match_kb"] = float(np.mean(
+            [shard["peak_memory"] / max(shard["max_active"], 1) for shard in shards])) / 1024
+    return report, per_match
+
+
+def run_multi_replay(paths: list[Path], speed: Optional[float] = None, workers: int = 1, max_active: int = 200,
+                     measure_memory: bool = False) -> tuple[dict, pd.DataFrame]:
+    """
+    Replay matches concurrently, optionally sharded round-robin over worker processes.
+
+    :param paths: Event JSON files to replay.
+    :type paths: list[Path]
+    :param speed: Playback speed factor for real-time clocks; None replays on virtual clocks.
+    :type speed: float or None
+    :param workers: Number of worker processes; 1 runs everything in this process.
+    :type workers: int
+    :param max_active: Maximum number of concurrently replayed matches per process.
+    :type max_active: int
+    :param measure_memory: Report the peak traced memory per active match.
+    :type measure_memory: bool
+    :return: Aggregate report and per-match latency table, see :func:`build_report`.
+    :rtype: tuple[dict, pd.DataFrame]
+    """
+    start = time.perf_counter()
+    if workers > 1 and len(paths) > 1:
+        shards = [paths[i::workers] for i in range(workers) if paths[i::workers]]
+        with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+            results = list(executor.map(_replay_shard, shards, [speed] * len(shards), [max_active] * len(shards),
+                                        [measure_memory] * len(shards)))
+    else:
+        results = [_replay_shard(paths, speed, max_active, measure_memory)]
+    return build_report(results, time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay many matches concurrently and report throughput.")
+    parser.add_argument("--events-dir", type=Path, default=Path(DATA_DIR) / "events", help="Directory of event JSON files.")
+    parser.add_argument("--matches", type=int, default=50, help="Number of matches to replay.")
+    parser.add_argument("--speed", type=float, default=None, help="Real-time speed factor; omit for virtual clocks.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes.")
+    parser.add_argument("--max-active", type=int, default=200, help="Maximum concurrent matches per process.")
+    parser.add_argument("--memory", action="store_true", help="Trace memory per active match (slower).")
+    args = parser.parse_args()
+
+    paths = sorted(args.events_dir.glob("*.json"))[:args.matches]
+    report, per_match = run_multi_replay(paths, speed=args.speed, workers=args.workers, max_active=args.max_active,
+                                         measure_memory=args.memory)
+    for key, value in report.items():
+        print(f"{key:<28}{value:>14.2f}" if isinstance(value, float) else f"{key:<28}{value:>14}")
+    print(per_match.describe().loc[["mean", "max"]].to_string())
+
+
+if __name__ == "__main__":
+    main()
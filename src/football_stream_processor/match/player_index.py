@@ -0,0 +1,198 @@
+"""
+Inverted index from players and teams to the event slices they appear in.
+
+For every events file the index records, per player id and per team id, the byte ranges
+of the file that contain that player's (or team's) events. Nearby runs are merged so the
+index stays small. A cross-match query then only opens the matches the player appeared in
+and decodes just the indexed slices with :func:`read_event_range`.
+
+Index layout (``index_dir``):
+- ``players/`` and ``teams/``: column stores of postings sorted by key id, with columns
+  key_id, match_id, byte_start, byte_end, n_events
+- ``keys.json``: id -> name for players and teams
+"""
+
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from tqdm import tqdm
+from typing import Iterable, Iterator, Optional
+from football_stream_processor.utils.column_store import load_columns, save_columns
+from football_stream_processor.utils.event_reader import iter_events_with_offsets, read_event_range
+
+POSTING_COLUMNS = ["key_id", "match_id", "byte_start", "byte_end", "n_events"]
+
+# Runs of the same key that are closer than this many bytes are merged into one range
+DEFAULT_MAX_GAP = 32 * 1024
+
+
+def index_event_file(json_file: Path, max_gap: int = DEFAULT_MAX_GAP) -> dict[str, any]:
+    """
+    Collect player and team postings for one events file.
+
+    :param json_file: Path to a StatsBomb events JSON file named ``<match_id>.json``.
+    :type json_file: Path
+    :param max_gap: Maximum byte gap between two runs of the same key that are merged.
+    :type max_gap: int
+    :return: Dictionary with 'players' and 'teams' posting rows and the 'names' seen.
+    :rtype: dict
+    """
+    match_id = int(Path(json_file).stem)
+    open_ranges = {"players": {}, "teams": {}}
+    postings = {"players": [], "teams": []}
+    names = {"players": {}, "teams": {}}
+
+    for byte_start, byte_end, event in iter_events_with_offsets(json_file):
+        for kind, field in (("players", "player"), ("teams", "team")):
+            entity = event.get(field)
+            if not entity:
+                continue
+            key_id = entity["id"]
+            names[kind][key_id] = entity["name"]
+            current = open_ranges[kind].get(key_id)
+            if current is not None and byte_start - current[1] <= max_gap:
+                current[1] = byte_end
+                current[2] += 1
+            else:
+                if current is not None:
+                    postings[kind].append((key_id, match_id, current[0], current[1], current[2]))
+                open_ranges[kind][key_id] = [byte_start, byte_end, 1]
+
+    for kind, ranges in open_ranges.items():
+        for key_id, (start, end, count) in ranges.items():
+            postings[kind].append((key_id, match_id, start, end, count))
+    return {"players": postings["players"], "teams": postings["teams"], "names": names}
+
+
+def build_player_index(events_dir: Path, index_dir: Path, limit: int = 1000, workers: int = 1,
+                       max_gap: int = DEFAULT_MAX_GAP) -> None:
+    """
+    Build the player and team inverted index for up to `limit` event files.
+
+    :param events_dir: Directory containing StatsBomb event JSON files.
+    :type events_dir: Path
+    :param index_dir: Output directory of the index.
+    :type index_dir: Path
+    :param limit: Maximum number of event files to index.
+    :type limit: int
+    :param workers: Number of worker processes.
+    :type workers: int
+    :param max_gap: Maximum byte gap between two runs of the same key that are merged.
+    :type max_gap: int
+    """
+    json_files = sorted(Path(events_dir).glob("*.json"))[:limit]
+    rows = {"players": [], "teams": []}
+    names = {"players": {}, "teams": {}}
+
+    def collect(result):
+        for kind in rows:
+            rows[kind].extend(result[kind])
+            names[kind].update(result["names"][kind])
+
+    if workers > 1 and len(json_files) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(index_event_file, json_files, [max_gap] * len(json_files), chunksize=4)
+            for result in tqdm(results, total=len(json_files), desc="Indexing players"):
+                collect(result)
+    else:
+        for json_file in tqdm(json_files, desc="Indexing players"):
+            collect(index_event_file(json_file, max_gap))
+
+    index_dir = Path(index_dir)
+    index_dir.mkdir(parents=True, exist_ok=True)
+    for kind, kind_rows in rows.items():
+        df = pd.DataFrame(kind_rows, columns=POSTING_COLUMNS).astype(np.int64)
+        df = df.sort_values(["key_id", "match_id", "byte_start"], kind="stable").reset_index(drop=True)
+        save_columns(df, index_dir / kind)
+    with open(index_dir / "keys.json", "w") as f:
+        json.dump({kind: {str(k): v for k, v in kind_names.items()} for kind, kind_names in names.items()}, f)
+    print(f"[INFO] Indexed {len(names['players'])} players and {len(names['teams'])} teams "
+          f"from {len(json_files)} event files into {index_dir}")
+
+
+class PlayerIndex:
+    """
+    Read side of the player and team inverted index.
+
+    :param index_dir: Directory written by :func:`build_player_index`.
+    :type index_dir: Path
+    :param events_dir: Directory containing the indexed StatsBomb event JSON files.
+    :type events_dir: Path
+    """
+
+    def __init__(self, index_dir: Path, events_dir: Path):
+        self.index_dir = Path(index_dir)
+        self.events_dir = Path(events_dir)
+        self.postings = {kind: load_columns(self.index_dir / kind) for kind in ("players", "teams")}
+        with open(self.index_dir / "keys.json", "r") as f:
+            self.names = {kind: {int(k): v for k, v in kind_names.items()} for kind, kind_names in json.load(f).items()}
+
+    def find(self, name: str, kind: str = "players") -> list[int]:
+        """
+        Return the ids whose name contains `name` (case-insensitive).
+
+        :param name: Full or partial player or team name.
+        :type name: str
+        :param kind: 'players' or 'teams'.
+        :type kind: str
+        :return: Matching ids.
+        :rtype: list[int]
+        """
+        needle = name.lower()
+        return [key_id for key_id, key_name in self.names[kind].items() if needle in key_name.lower()]
+
+    def ranges(self, key_id: int, kind: str = "players") -> pd.DataFrame:
+        """
+        Return the postings of one player or team, found by binary search on key_id.
+
+        :param key_id: Player or team id.
+        :type key_id: int
+        :param kind: 'players' or 'teams'.
+        :type kind: str
+        :return: Postings with columns POSTING_COLUMNS.
+        :rtype: pd.DataFrame
+        """
+        postings = self.postings[kind]
+        key_ids = postings["key_id"].to_numpy()
+        start, stop = np.searchsorted(key_ids, key_id, side="left"), np.searchsorted(key_ids, key_id, side="right")
+        return postings.iloc[start:stop]
+
+    def matches(self, key_id: int, kind: str = "players") -> list[int]:
+        """
+        :return: Sorted ids of the matches the player or team appears in.
+        :rtype: list[int]
+        """
+        return sorted(set(self.ranges(key_id, kind)["match_id"].tolist()))
+
+    def iter_events(self, key_id: int, kind: str = "players", event_types: Optional[Iterable[str]] = None,
+                    match_ids: Optional[Iterable[int]] = None) -> Iterator[tuple[int, dict]]:
+        """
+        Yield ``(match_id, event)`` for every event of a player or team across the corpus.
+
+        Only the indexed byte ranges of the relevant matches are read.
+
+        :param key_id: Player or team id.
+        :type key_id: int
+        :param kind: 'players' or 'teams'.
+        :type kind: str
+        :param event_types: Event type names to keep. Defaults to all.
+        :type event_types: Iterable[str] or None
+        :param match_ids: Restrict the query to these matches (e.g. one season from the catalog).
+        :type match_ids: Iterable[int] or None
+        :return: Iterator of (match_id, event) tuples.
+        :rtype: Iterator[tuple[int, dict]]
+        """
+        field = "player" if kind == "players" else "team"
+        wanted = frozenset(event_types) if event_types is not None else None
+        allowed = set(match_ids) if match_ids is not None else None
+        for posting in self.ranges(key_id, kind).itertuples(index=False):
+            if allowed is not None and posting.match_id not in allowed:
+                continue
+            path = self.events_dir / f"{posting.match_id}.json"
+            for event in read_event_range(path, posting.byte_start, posting.byte_end):
+                if event.get(field, {}).get("id") != key_id:
+                    continue
+                if wanted is None or event.get("type", {}).get("name") in wanted:
+                    yield int(posting.match_id), event
@@ -0,0 +1,149 @@
+"""
+asyncio replay of StatsBomb events with a pluggable clock.
+
+The replayer maps every event onto the continuous elapsed-time axis of
+:class:`PeriodClock` and asks its clock to wait until that match time before yielding
+the event. The clock decides what waiting means:
+
+- :class:`RealTimeClock` waits in wall-clock time, optionally `speed` times faster,
+  and can be paused and resumed.
+- :class:`VirtualClock` does not wait at all; it only advances its own time and yields
+  control to the event loop, so a full match replays in milliseconds with the same event
+  order and event times.
+
+Several replayers can run concurrently in one event loop.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Optional, Union
+from football_stream_processor.match.simulate import MatchReplay
+from football_stream_processor.utils.time_utils import PeriodClock
+
+
+class VirtualClock:
+    """
+    Clock that jumps straight to the requested match time.
+
+    `due` is the event loop time at which the last awaited event was due; it is the
+    reference for measuring how late events are handled.
+    """
+
+    def __init__(self):
+        self.time = None
+        self.due = None
+
+    def now(self) -> Optional[float]:
+        """
+        :return: The current match time in seconds, or None before the first event.
+        :rtype: float or None
+        """
+        return self.time
+
+    async def wait_until(self, match_time: float) -> None:
+        """
+        Advance to `match_time` and let other tasks run.
+
+        :param match_time: Elapsed match seconds of the next event.
+        :type match_time: float
+        """
+        self.time = match_time if self.time is None else max(self.time, match_time)
+        self.due = asyncio.get_running_loop().time()
+        await asyncio.sleep(0)
+
+
+class RealTimeClock(VirtualClock):
+    """
+    Clock that waits in wall-clock time.
+
+    The first event is released immediately. Later events are released when the wall-clock
+    time since the start, excluding paused time, reaches their match time offset divided by `speed`.
+
+    :param speed: Playback speed factor, e.g. 1.0 for real time or 10.0 for ten times faster.
+    :type speed: float
+    """
+
+    def __init__(self, speed: float = 1.0):
+        super().__init__()
+        if speed <= 0:
+            raise ValueError("speed must be positive; use VirtualClock to replay without delays")
+        self.speed = speed
+        self._origin = None
+        self._running = asyncio.Event()
+        self._running.set()
+        self._paused_at = None
+
+    def pause(self) -> None:
+        if self._paused_at is None:
+            self._paused_at = asyncio.get_running_loop().time()
+            self._running.clear()
+
+    def resume(self) -> None:
+        if self._paused_at is not None:
+            if self._origin is not None:
+                # Shift the origin so the paused interval does not count as match time
+                self._origin = (self._origin[0] + asyncio.get_running_loop().time() - self._paused_at, self._origin[1])
+            self._paused_at = None
+            self._running.set()
+
+    @property
+    def paused(self) -> bool:
+        return self._paused_at is not None
+
+    async def wait_until(self, match_time: float) -> None:
+        loop = asyncio.get_running_loop()
+        await self._running.wait()
+        if self._origin is None:
+            self._origin = (loop.time(), match_time)
+        while True:
+            due = self._origin[0] + (match_time - self._origin[1]) / self.speed
+            delay = due - loop.time()
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+            # A pause during the sleep moves the origin; wait for resume and recompute
+            await self._running.wait()
+        self.due = due
+        self.time = match_time if self.time is None else max(self.time, match_time)
+
+
+class AsyncMatchReplay:
+    """
+    Replay one match as an async iterator of ``(elapsed seconds, event)`` tuples.
+
+    :param match: Match id or path to an events JSON file.
+    :type match: int or str or Path
+    :param clock: Clock that paces the replay. Defaults to a real-time clock.
+    :type clock: VirtualClock or RealTimeClock or None
+    :param event_types: Only replay these event types. Defaults to all.
+    :type event_types: Iterable[str] or None
+    """
+
+    def __init__(self, match: Union[int, str, Path], clock: Optional[VirtualClock] = None,
+                 event_types: Optional[Iterable[str]] = None):
+        self.source = MatchReplay(match, speed=None, event_types=event_types)
+        self.clock = clock if clock is not None else RealTimeClock()
+        self.events_replayed = 0
+
+    async def __aiter__(self) -> AsyncIterator[tuple[float, dict]]:
+        period_clock = PeriodClock()
+        for event in self.source.events():
+            match_time = period_clock.elapsed(event["period"], event["timestamp"])
+            await self.clock.wait_until(match_time)
+            self.events_replayed += 1
+            yield match_time, event
+
+    async def run(self, handler: Callable[[float, dict], Optional[Awaitable[None]]]) -> int:
+        """
+        Replay the match and pass every event to `handler`.
+
+        :param handler: Function or coroutine function called with (elapsed seconds, event).
+        :type handler: Callable
+        :return: Number of events replayed.
+        :rtype: int
+        """
+        async for match_time, event in self:
+            result = handler(match_time, event)
+            if asyncio.iscoroutine(result):
+                await result
+        return self.events_replayed
@@ -0,0 +1,171 @@
+"""
+Sliding-window match metrics over event time.
+
+Event time is ``minute * 60 + second``, except that a period starts where the previous one
+ended if that was after its nominal start. Stoppage time at the end of the first half (45:xx)
+would otherwise overlap the start of the second half (45:00), and windows already closed would
+receive second-half events (see :class:`MatchClock`).
+
+The window ``(end - window, end]`` moves forward in steps of `step` seconds. Each event is
+added to per-team running sums once and evicted once when it leaves the window, so the time
+series for a whole match costs one pass over the events plus one row per team and window position.
+
+Metrics follow ``match_summary``: xG of shots, pressures applied, pass accuracy (a pass
+without an outcome is complete) and turnovers (miscontrols and dispossessions).
+"""
+
+from collections import defaultdict, deque
+from typing import Iterable
+import pandas as pd
+from football_stream_processor.match.match_summary import TURNOVER_TYPES
+from football_stream_processor.utils.time_utils import PERIOD_START_MINUTE, MatchClock
+
+METRIC_COLUMNS = ["xg", "pressures", "passes", "completed_passes", "turnovers"]
+ROLLING_COLUMNS = ["time", "team"] + METRIC_COLUMNS + ["pass_accuracy"]
+
+
+def event_time(event: dict) -> int:
+    """
+    :return: StatsBomb's ``minute * 60 + second``. Not monotonic across periods when a period has stoppage time.
+    :rtype: int
+    """
+    return event.get("minute", 0) * 60 + event.get("second", 0)
+
+
+def period_seconds(event: dict) -> int:
+    """
+    :return: Whole seconds since the start of the event's period.
+    :rtype: int
+    """
+    return event_time(event) - PERIOD_START_MINUTE.get(event.get("period", 1), 0) * 60
+
+
+def _contribution(event: dict) -> tuple:
+    event_type = event.get("type", {}).get("name")
+    if event_type == "Pass":
+        return 0.0, 0, 1, int("outcome" not in event.get("pass", {})), 0
+    if event_type == "Shot":
+        return event.get("shot", {}).get("statsbomb_xg", 0.0), 0, 0, 0, 0
+    if event_type == "Pressure":
+        return 0.0, 1, 0, 0, 0
+    if event_type in TURNOVER_TYPES:
+        return 0.0, 0, 0, 0, 1
+    return None
+
+
+class SlidingWindowAggregator:
+    """
+    Per-team sliding-window sums of the rolling metrics.
+
+    Feed events in time order (period by period) with :meth:`update`; it returns the rows of every window
+    position that closed before the event. :meth:`flush` returns the remaining positions
+    up to the last event.
+
+    :param window: Window length in seconds.
+    :type window: int
+    :param step: Distance between window positions in seconds.
+    :type step: int
+    """
+
+    def __init__(self, window: int = 600, step: int = 60):
+        if window <= 0 or step <= 0:
+            raise ValueError("window and step must be positive")
+        self.window = window
+        self.step = step
+        self.end = step
+        self.last_time = 0
+        self.clock = MatchClock()
+        self.sums = defaultdict(lambda: [0.0, 0, 0, 0, 0])
+        self._in_window = deque()
+
+    def _evict(self) -> None:
+        start = self.end - self.window
+        while self._in_window and self._in_window[0][0] <= start:
+            _, team, values = self._in_window.popleft()
+            sums = self.sums[team]
+            for i, value in enumerate(values):
+                sums[i] -= value
+
+    def _close_window(self) -> list[dict]:
+        self._evict()
+        rows = []
+        for team, sums in self.sums.items():
+            row = dict(zip(METRIC_COLUMNS, sums), time=self.end, team=team)
+            row["pass_accuracy"] = row["completed_passes"] / row["passes"] * 100 if row["passes"] else 0
+            rows.append(row)
+        self.end += self.step
+        return rows
+
+    def update(self, event: dict) -> list[dict]:
+        """
+        Add an event to the window.
+
+        :param event: StatsBomb event dictionary.
+        :type event: dict
+        :return: Rows of the window positions closed by this event.
+        :rtype: list[dict]
+        """
+        # Every event moves the clock, so period ends match those seen by a ReorderBuffer
+        seconds = self.clock.observe(event.get("period", 1), period_seconds(event))
+        team = event.get("team", {}).get("name")
+        if not team:
+            return []
+        rows = []
+        while seconds > self.end:
+            rows.extend(self._close_window())
+        self.last_time = max(self.last_time, seconds)
+
+        values = _contribution(event)
+        sums = self.sums[team]
+        if values is not None:
+            self._in_window.append((seconds, team, values))
+            for i, value in enumerate(values):
+                sums[i] += value
+        return rows
+
+    def advance(self, watermark_time: float) -> list[dict]:
+        """
+        Close every window that ends before `watermark_time`, e.g. the watermark of a
+        :class:`ReorderBuffer`, even if no later event has arrived yet.
+
+        :param watermark_time: Match time on the :class:`MatchClock` axis up to which the input is complete.
+        :type watermark_time: float
+        :return: Rows of the closed window positions.
+        :rtype: list[dict]
+        """
+        rows = []
+        # Event times are whole seconds, so a later event can still fall on `end` until the watermark reaches end + 1
+        while self.end + 1 <= watermark_time:
+            rows.extend(self._close_window())
+        return rows
+
+    def flush(self) -> list[dict]:
+        """
+        :return: Rows of the remaining window positions up to and including the last event.
+        :rtype: list[dict]
+        """
+        rows = []
+        while self.end - self.step < self.last_time:
+            rows.extend(self._close_window())
+        return rows
+
+
+def rolling_metrics(events: Iterable[dict], window: int = 600, step: int = 60) -> pd.DataFrame:
+    """
+    Compute the rolling metrics of one match in a single pass.
+
+    :param events: Events of the match in file order.
+    :type events: Iterable[dict]
+    :param window: Window length in seconds (600 for "last 10 minutes").
+    :type window: int
+    :param step: Distance between window positions in seconds.
+    :type step: int
+    :return: One row per window end time and team with columns ROLLING_COLUMNS.
+    :rtype: pd.DataFrame
+    """
+    aggregator = SlidingWindowAggregator(window, step)
+    rows = []
+    for event in events:
+        rows.extend(aggregator.update(event))
+    rows.extend(aggregator.flush())
+    return pd.DataFrame(rows, columns=ROLLING_COLUMNS)
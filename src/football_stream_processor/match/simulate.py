@@ -1,51 +1,134 @@
 """
 Simulate real-time playback of StatsBomb events.
 
-This script loads event data and prints each event with a simulated real-time delay.
+:class:`MatchReplay` replays any match, given by id or by path. Nothing is read at import
+or construction time: the events file is streamed with :func:`iter_events` only when the
+replay is iterated, and events are yielded one at a time with the real-time delay between
+them (scaled by `speed`).
+
+Usage:
+    poetry run python src/football_stream_processor/match/simulate.py 22912 --speed 10
 """
 
-import json
+import argparse
 import time
-from datetime import datetime
-from os import path
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Union
 from football_stream_processor.config import DATA_DIR
+from football_stream_processor.utils.event_reader import iter_events
+from football_stream_processor.utils.time_utils import PeriodClock, timestamp_to_seconds
 
-# Load the JSON file
-with open(path.join(DATA_DIR, "events", "22912.json"), "r") as f:
-    events = json.load(f)
 
 def parse_timestamp(t):
     """
-    Convert StatsBomb timestamp string to datetime.
+    Convert StatsBomb timestamp string to seconds since the start of the period.
 
-    :param t: Timestamp string in the format "%H:%M:%S.%f"
+    :param t: Timestamp string in the format "HH:MM:SS.fff"
     :type t: str
-    :return: Corresponding datetime object
-    :rtype: datetime
+    :return: Seconds since the start of the period
+    :rtype: float
     """
-    return datetime.strptime(t, "%H:%M:%S.%f")
+    return timestamp_to_seconds(t)
 
-# Initialize base time (simulate from zero)
-start_time = parse_timestamp(events[0]["timestamp"])
 
-def simulate_events(events):
+def resolve_events_path(match: Union[int, str, Path]) -> Path:
     """
-    Simulate real-time playback of events, printing each event with a delay.
+    Resolve a match id or an events file path.
+
+    :param match: Match id (e.g. 22912 or "22912") or path to an events JSON file.
+    :type match: int or str or Path
+    :return: Path to the events file.
+    :rtype: Path
+    """
+    if isinstance(match, int) or (isinstance(match, str) and match.isdigit()):
+        return Path(DATA_DIR) / "events" / f"{match}.json"
+    return Path(match)
+
+
+def format_event(event):
+    return f"[{event['timestamp']}] {event['type']['name']} by {event['player']['name'] if 'player' in event else 'N/A'}"
+
+
+def replay_events(events: Iterable[dict], speed: Optional[float] = 1.0,
+                  sleep: Callable[[float], None] = time.sleep) -> Iterator[tuple[float, dict]]:
+    """
+    Yield events with the real-time gaps between them.
+
+    :param events: Events in match order.
+    :type events: Iterable[dict]
+    :param speed: Playback speed factor (2.0 plays twice as fast). None or 0 replays without delays.
+    :type speed: float or None
+    :param sleep: Function used to wait, replaceable for tests.
+    :type sleep: Callable[[float], None]
+    :return: Iterator of (elapsed match seconds, event) tuples.
+    :rtype: Iterator[tuple[float, dict]]
+    """
+    clock = PeriodClock()
+    prev_time = None
+    for event in events:
+        # Each timestamp is parsed once; the clock keeps time increasing across period resets
+        current_time = clock.elapsed(event["period"], event["timestamp"])
+
+        if prev_time is not None and speed:
+            gap = (current_time - prev_time) / speed
+            sleep(max(gap, 0.0))  # Simulate real-time delay
+        prev_time = current_time
+        yield current_time, event
+
+
+class MatchReplay:
+    """
+    Lazily loaded replay of one match.
+
+    :param match: Match id or path to an events JSON file.
+    :type match: int or str or Path
+    :param speed: Playback speed factor. None or 0 replays without delays.
+    :type speed: float or None
+    :param event_types: Only replay these event types. Defaults to all.
+    :type event_types: Iterable[str] or None
+    """
+
+    def __init__(self, match: Union[int, str, Path], speed: Optional[float] = 1.0,
+                 event_types: Optional[Iterable[str]] = None):
+        self.path = resolve_events_path(match)
+        self.speed = speed
+        self.event_types = event_types
+
+    def events(self) -> Iterator[dict]:
+        """
+        Stream the match events without delays. The file is opened on the first call to ``next``.
+
+        :return: Iterator of event dictionaries.
+        :rtype: Iterator[dict]
+        """
+        return iter_events(self.path, event_types=self.event_types)
+
+    def __iter__(self) -> Iterator[tuple[float, dict]]:
+        return replay_events(self.events(), speed=self.speed)
 
-    :param events: List of event dictionaries
-    :type events: list[dict]
+
+def simulate_events(events, speed=1.0):
     """
-    for i in range(len(events)):
-        event = events[i]
-        current_time = parse_timestamp(event["timestamp"])
-        
-        if i > 0:
-            prev_time = parse_timestamp(events[i-1]["timestamp"])
-            gap = (current_time - prev_time).total_seconds()
-            time.sleep(gap)  # Simulate real-time delay
+    Simulate real-time playback of events, printing each event with a delay.
 
+    :param events: Iterable of event dictionaries
+    :type events: Iterable[dict]
+    :param speed: Playback speed factor. None or 0 prints without delays.
+    :type speed: float or None
+    """
+    for _, event in replay_events(events, speed=speed):
         # Simulate sending this event (e.g., to a function or API)
-        print(f"[{event['timestamp']}] {event['type']['name']} by {event['player']['name'] if 'player' in event else 'N/A'}")
+        print(format_event(event))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a match in real time.")
+    parser.add_argument("match", nargs="?", default="22912", help="Match id or path to an events JSON file.")
+    parser.add_argument("--speed", type=float, default=1.0, help="Playback speed factor; 0 disables delays.")
+    args = parser.parse_args()
+
+    simulate_events(MatchReplay(args.match).events(), speed=args.speed)
+
 
 if __name__ == "__main__":
-    simulate_events(events)
\ No newline at end of file
+    main()
@@ -6,13 +6,31 @@ and build a pandas DataFrame suitable for modeling or analysis.
 
 """
 
+import hashlib
 import json
 import math
+import time
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from tqdm import tqdm
-from typing import Optional
+from typing import Iterable, Optional
+from football_stream_processor.config import PASS_DATA_PATH, PLAYER_INDEX_DIR
+from football_stream_processor.match.player_index import build_player_index
+from football_stream_processor.utils.column_store import column_store_exists, load_columns, save_columns
+from football_stream_processor.utils.event_reader import iter_events
+
+
+PASS_FEATURE_COLUMNS = [
+    'start_x', 'start_y', 'end_x', 'end_y',
+    'distance', 'angle', 'pass_outcome', 'minute'
+]
+
+# Version of the pass extraction logic. Bump it whenever extract_pass_features or
+# process_event_file change their output, so that cached shards are rebuilt.
+EXTRACTOR_VERSION = "3"
 
 
 def load_events(json_path: str) -> list[dict[str, any]]:
@@ -24,9 +42,7 @@ def load_events(json_path: str) -> list[dict[str, any]]:
     :return: list of event dictionaries.
     :rtype: list[dict]
     """
-    with open(json_path, 'r') as f:
-        events = json.load(f)
-    return events
+    return list(iter_events(json_path))
 
 
 def is_pass(event: dict[str, any]) -> bool:
@@ -116,6 +132,56 @@ def extract_pass_features(event: dict[str, any]) -> Optional[dict[str, any]]:
     }
 
 
+def extract_pass_columns(events: Iterable[dict[str, any]]) -> dict[str, np.ndarray]:
+    """
+    Extract pass features for all passes in a list of events at once.
+
+    Batch counterpart of :func:`extract_pass_features`: the coordinates of every valid pass are
+    collected into flat arrays and distance, angle and outcome are computed with NumPy in one
+    shot. Non-pass events and passes with missing locations are skipped.
+
+    :param events: Iterable of event dictionaries (any event type), e.g. from :func:`iter_events`.
+    :type events: Iterable[dict]
+    :return: Dictionary mapping each name in PASS_FEATURE_COLUMNS to a NumPy array.
+    :rtype: dict[str, np.ndarray]
+    """
+    coords = []
+    successes = []
+    minutes = []
+    for event in events:
+        if not is_pass(event):
+            continue
+        pass_info = event.get('pass', {})
+        start_pos = event.get('location')
+        end_pos = pass_info.get('end_location')
+        if not start_pos or not end_pos or None in end_pos:
+            continue
+        coords.append((start_pos[0], start_pos[1], end_pos[0], end_pos[1]))
+        # outcome == None means success, else failed with outcome['name']
+        successes.append(pass_info.get('outcome') is None)
+        minutes.append(event.get('minute'))
+
+    xy = np.array(coords, dtype=np.float64).reshape(-1, 4)
+    delta_x = xy[:, 2] - xy[:, 0]
+    delta_y = xy[:, 3] - xy[:, 1]
+
+    if None in minutes:
+        minute = np.array([np.nan if m is None else m for m in minutes], dtype=np.float64)
+    else:
+        minute = np.array(minutes, dtype=np.int64)
+
+    return {
+        'start_x': xy[:, 0],
+        'start_y': xy[:, 1],
+        'end_x': xy[:, 2],
+        'end_y': xy[:, 3],
+        'distance': np.hypot(delta_x, delta_y),
+        'angle': np.arctan2(delta_y, delta_x),
+        'pass_outcome': np.array(successes, dtype=np.int64),
+        'minute': minute
+    }
+
+
 def filter_pass_events(events: list[dict[str, any]]) -> list[dict[str, any]]:
     """
     Filter a list of events to only include passes.
@@ -128,51 +194,246 @@ def filter_pass_events(events: list[dict[str, any]]) -> list[dict[str, any]]:
     return [e for e in events if is_pass(e)]
 
 
-def build_all_passes_dataset(events_dir: Path, cache_path: Path = Path("../../.pickle/pass_data.pkl"), limit: int = 1000) -> pd.DataFrame:
+def process_event_file(json_file: Path) -> tuple[str, pd.DataFrame, float]:
+    """
+    Extract pass features from a single event JSON file.
+
+    This is the unit of work for both the serial and the parallel build. The features are
+    extracted column-wise by :func:`extract_pass_columns` and returned as a DataFrame, so
+    worker processes send back compact column buffers instead of per-pass dictionaries.
+
+    :param json_file: Path to a StatsBomb events JSON file.
+    :type json_file: Path
+    :return: Tuple of (file name, DataFrame of pass features, processing time in seconds).
+    :rtype: tuple[str, pd.DataFrame, float]
+    """
+    start = time.perf_counter()
+    events = iter_events(json_file, event_types={'Pass'})
+    df = pd.DataFrame(extract_pass_columns(events), columns=PASS_FEATURE_COLUMNS)
+    return json_file.name, df, time.perf_counter() - start
+
+
+def report_slowest_files(timings: list[tuple[str, float]], top: int = 5) -> None:
+    """
+    Print the total processing time and the slowest event files.
+
+    :param timings: list of (file name, seconds) tuples.
+    :type timings: list[tuple[str, float]]
+    :param top: Number of slowest files to print.
+    :type top: int
+    """
+    if not timings:
+        return
+    total = sum(seconds for _, seconds in timings)
+    print(f"[INFO] Processed {len(timings)} files in {total:.2f}s of CPU time "
+          f"({total / len(timings) * 1000:.1f} ms/file)")
+    for name, seconds in sorted(timings, key=lambda t: t[1], reverse=True)[:top]:
+        print(f"[INFO]   {name}: {seconds * 1000:.1f} ms")
+
+
+def file_fingerprint(json_file: Path, with_hash: bool = True) -> dict[str, any]:
+    """
+    Fingerprint an event file by size, modification time and (optionally) content hash.
+
+    :param json_file: Path to a StatsBomb events JSON file.
+    :type json_file: Path
+    :param with_hash: Whether to compute the SHA-256 of the file contents.
+    :type with_hash: bool
+    :return: Dictionary with 'size', 'mtime' and 'sha256' keys.
+    :rtype: dict
+    """
+    stat = json_file.stat()
+    fingerprint = {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'sha256': None}
+    if with_hash:
+        digest = hashlib.sha256()
+        with open(json_file, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        fingerprint['sha256'] = digest.hexdigest()
+    return fingerprint
+
+
+class ShardCache:
+    """
+    Per-source-file cache of extracted pass features.
+
+    Each event file gets its own shard, recorded in a JSON manifest together with the file's
+    size, mtime, content hash and the extractor version that produced it. A shard is reused
+    when size and mtime are unchanged, or when they changed but the content hash did not.
+
+    :param shard_dir: Directory holding the shards and ``manifest.json``.
+    :type shard_dir: Path
+    """
+
+    def __init__(self, shard_dir: Path):
+        self.shard_dir = shard_dir
+        self.manifest_path = shard_dir / "manifest.json"
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> dict[str, any]:
+        if self.manifest_path.exists():
+            with open(self.manifest_path, 'r') as f:
+                manifest = json.load(f)
+            if manifest.get('extractor_version') == EXTRACTOR_VERSION:
+                return manifest
+            print(f"[INFO] Extractor version changed, discarding shards in {self.shard_dir}")
+        return {'extractor_version': EXTRACTOR_VERSION, 'files': {}, 'dataset': None, 'last_build': None}
+
+    def shard_path(self, json_file: Path) -> Path:
+        return self.shard_dir / f"{json_file.stem}.pkl"
+
+    def lookup(self, json_file: Path) -> bool:
+        """
+        Check whether a valid shard exists for the event file.
+
+        :param json_file: Path to a StatsBomb events JSON file.
+        :type json_file: Path
+        :return: True on a cache hit, False if the file must be (re)processed.
+        :rtype: bool
+        """
+        entry = self.manifest['files'].get(str(json_file))
+        if entry is None or not self.shard_path(json_file).exists():
+            return False
+        fingerprint = file_fingerprint(json_file, with_hash=False)
+        if fingerprint['size'] == entry['size'] and fingerprint['mtime'] == entry['mtime']:
+            return True
+        # Size or mtime changed (e.g. a fresh checkout): fall back to the content hash
+        fingerprint = file_fingerprint(json_file)
+        if fingerprint['sha256'] == entry['sha256']:
+            entry['mtime'] = fingerprint['mtime']
+            return True
+        return False
+
+    def store(self, json_file: Path, df: pd.DataFrame) -> None:
+        """
+        Write the shard for an event file and record it in the manifest.
+
+        :param json_file: Path to the processed StatsBomb events JSON file.
+        :type json_file: Path
+        :param df: Pass features extracted from the file.
+        :type df: pd.DataFrame
+        """
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        df.to_pickle(self.shard_path(json_file))
+        entry = file_fingerprint(json_file)
+        entry['shard'] = self.shard_path(json_file).name
+        entry['rows'] = len(df)
+        self.manifest['files'][str(json_file)] = entry
+
+    def load(self, json_file: Path) -> pd.DataFrame:
+        return pd.read_pickle(self.shard_path(json_file))
+
+    def save_manifest(self) -> None:
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_path, 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+
+
+def load_pass_dataset(cache_path: Path, columns: Optional[list[str]] = None) -> pd.DataFrame:
+    """
+    Load the cached pass dataset, optionally only a subset of its columns.
+
+    The columns are memory-mapped, so only the pages that are actually read are loaded
+    and concurrent readers share the operating system's page cache.
+
+    :param cache_path: Directory of the pass dataset column store.
+    :type cache_path: Path
+    :param columns: Columns to load. Defaults to all columns.
+    :type columns: list[str] or None
+    :return: DataFrame of pass features.
+    :rtype: pd.DataFrame
+    """
+    return load_columns(cache_path, columns=columns)
+
+
+def build_all_passes_dataset(events_dir: Path, cache_path: Path = Path("../../.pickle/pass_data"), limit: int = 1000,
+                             workers: int = 1) -> pd.DataFrame:
     """
     Process up to `limit` event JSON files in a directory and extract pass features into a single DataFrame.
-    Caches the result to a pickle file.
+    Caches the result as a column store directory (one ``.npy`` file per column).
+
+    Extracted features are also cached per event file in ``<cache name>_shards/`` next to
+    `cache_path`, so a rebuild only parses new or changed files. The shard manifest records
+    the hits and misses of the last build.
+
+    With ``workers > 1`` the files are fanned out to a process pool. Results are merged in the
+    sorted file order, so the output is identical to the serial build.
 
     :param events_dir: Path to the directory containing StatsBomb event JSON files.
-    :param cache_path: Path to the pickle file for caching.
+    :param cache_path: Directory of the column store used for caching.
     :param limit: Maximum number of event files to process.
+    :param workers: Number of worker processes. 1 processes files in the current process.
     :return: DataFrame of all pass features.
     """
-    if cache_path.exists():
-        print(f"[INFO] Loading cached data from {cache_path}")
-        return pd.read_pickle(cache_path)
-
-    print(f"[INFO] Processing up to {limit} event files in {events_dir}")
-    all_features = []
-
     json_files = sorted(events_dir.glob("*.json"))[:limit]
+    cache = ShardCache(cache_path.parent / f"{cache_path.stem}_shards")
+
+    hits, misses = [], []
+    for json_file in json_files:
+        (hits if cache.lookup(json_file) else misses).append(json_file)
+    print(f"[INFO] Shard cache for {events_dir}: {len(hits)} hits, {len(misses)} misses")
+    cache.manifest['last_build'] = {
+        'hits': [json_file.name for json_file in hits],
+        'misses': [json_file.name for json_file in misses],
+    }
 
-    for json_file in tqdm(json_files, desc="Processing JSON files"):
-        events = load_events(json_file)
-        pass_events = filter_pass_events(events)
-        features = [extract_pass_features(e) for e in pass_events if extract_pass_features(e) is not None]
-        all_features.extend(features)
-
-    df = pd.DataFrame(all_features)
+    dataset_files = [str(json_file) for json_file in json_files]
+    if not misses and cache.manifest['dataset'] == dataset_files and column_store_exists(cache_path):
+        cache.save_manifest()
+        print(f"[INFO] Loading cached data from {cache_path}")
+        return load_pass_dataset(cache_path)
+
+    print(f"[INFO] Processing {len(misses)} event files with {workers} worker(s)")
+    timings = []
+    if workers > 1 and len(misses) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(process_event_file, misses, chunksize=4)
+            for json_file, (name, file_df, seconds) in tqdm(zip(misses, results), total=len(misses),
+                                                             desc="Processing JSON files"):
+                cache.store(json_file, file_df)
+                timings.append((name, seconds))
+    else:
+        for json_file in tqdm(misses, desc="Processing JSON files"):
+            name, file_df, seconds = process_event_file(json_file)
+            cache.store(json_file, file_df)
+            timings.append((name, seconds))
+
+    report_slowest_files(timings)
+
+    # Merge shards in the sorted file order, which keeps the output deterministic
+    frames = [cache.load(json_file) for json_file in json_files]
+    if frames:
+        df = pd.concat(frames, ignore_index=True)
+    else:
+        df = pd.DataFrame(extract_pass_columns([]), columns=PASS_FEATURE_COLUMNS)
 
     # Ensure .pickle directory exists
     cache_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_pickle(cache_path)
+    save_columns(df, cache_path)
     print(f"[INFO] Cached pass dataset to {cache_path}")
 
+    cache.manifest['dataset'] = dataset_files
+    cache.save_manifest()
+
     return df
 
 def main():
     parser = argparse.ArgumentParser(description="Build pass dataset from StatsBomb event files.")
     parser.add_argument("--limit", type=int, default=10, help="Maximum number of JSON files to process.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes for the build.")
+    parser.add_argument("--player-index", action="store_true", help="Also build the player/team inverted index.")
     args = parser.parse_args()
 
     events_dir = Path(__file__).parents[4] / 'open-data' / 'data' / 'events'
-    cache_path = Path(__file__).parents[4] / '.pickle' / 'pass_data.pkl'
+    cache_path = Path(__file__).parents[4] / PASS_DATA_PATH
 
-    df = build_all_passes_dataset(events_dir=events_dir, cache_path=cache_path, limit=args.limit)
+    df = build_all_passes_dataset(events_dir=events_dir, cache_path=cache_path, limit=args.limit, workers=args.workers)
     print(df)
 
+    if args.player_index:
+        index_dir = Path(__file__).parents[4] / PLAYER_INDEX_DIR
+        build_player_index(events_dir, index_dir, limit=args.limit, workers=args.workers)
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
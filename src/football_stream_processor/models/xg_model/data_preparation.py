@@ -2,8 +2,8 @@ import pandas as pd
 from sklearn.model_selection import train_test_split
 from football_stream_processor.utils.eda_utils import basic_checks
 
-def load_and_prepare_data():
-    df = basic_checks()
+def load_and_prepare_data(df: pd.DataFrame = None):
+    df = basic_checks(df)
 
     features = [
         "start_x", "start_y", "end_x", "end_y",
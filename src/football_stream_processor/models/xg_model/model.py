@@ -12,9 +12,12 @@ def get_model(model_name: str = "logistic_regression", **kwargs):
           max_depth=kwargs.get("max_depth", 6),
           subsample=kwargs.get("subsample", 1.0),
           colsample_bytree=kwargs.get("colsample_bytree", 1.0),
-          eval_metric="logloss",
+          eval_metric=kwargs.get("eval_metric", "logloss"),
+          early_stopping_rounds=kwargs.get("early_stopping_rounds"),
+          callbacks=kwargs.get("callbacks"),
           use_label_encoder=False,
-          random_state=42
+          random_state=42,
+          n_jobs=kwargs.get("n_jobs")
       )
     else:
       raise ValueError(f"Unsupported model: {model_name}")
\ No newline at end of file
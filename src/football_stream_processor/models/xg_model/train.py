@@ -1,4 +1,10 @@
+import argparse
+import multiprocessing
 import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import mlflow
 import mlflow.sklearn
 import optuna
@@ -13,6 +19,8 @@ from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.preprocessing import StandardScaler, OneHotEncoder
 from sklearn.metrics import accuracy_score, precision_score, recall_score, roc_auc_score
+from sklearn.model_selection import train_test_split
+from xgboost.callback import TrainingCallback
 
 from football_stream_processor.models.xg_model.data_preparation import load_and_prepare_data
 
@@ -21,7 +29,9 @@ from football_stream_processor.config import (
     MODEL_SAVE_PATH,
     MLFLOW_EXPERIMENT_NAME,
     MLFLOW_TRACKING_URI,
-    MLFLOW_REGISTRY_URI
+    MLFLOW_REGISTRY_URI,
+    MLFLOW_RUN_NAME,
+    OPTUNA_STORAGE
 )
 from football_stream_processor.models.xg_model.evaluation import print_classification_report, print_roc_auc, plot_confusion_matrix
 
@@ -50,7 +60,147 @@ def create_preprocessor():
     ])
 
 
-def objective(trial):
+class StudyData:
+    """
+    Training data shared by every trial of an Optuna study.
+
+    Loading and cleaning the pass dataset, the train/test split and fitting the
+    ``create_preprocessor`` ColumnTransformer do not depend on the hyperparameters, so they run
+    once here and trials only fit the classifier on the transformed matrices. The split and the
+    fitted preprocessor are the same ones each trial used to recompute, so scores are unchanged.
+
+    Trials fit on ``Xt_fit`` and evaluate every boosting round on the stratified validation split
+    ``Xt_valid`` for early stopping and pruning; the test split only scores the finished model.
+
+    :param df: Pass dataset. If None, loads the cached pass dataset.
+    :type df: pd.DataFrame or None
+    :param validation_size: Fraction of the training split held out for validation.
+    :type validation_size: float
+    """
+
+    def __init__(self, df: pd.DataFrame = None, validation_size: float = 0.2):
+        start = time.perf_counter()
+        self.X_train, self.X_test, self.y_train, self.y_test = load_and_prepare_data(df)
+        loaded = time.perf_counter()
+        self.preprocessor = create_preprocessor().fit(self.X_train)
+        self.Xt_train = self.preprocessor.transform(self.X_train)
+        self.Xt_test = self.preprocessor.transform(self.X_test)
+        self.Xt_fit, self.Xt_valid, self.y_fit, self.y_valid = train_test_split(
+            self.Xt_train, self.y_train, test_size=validation_size, random_state=42, stratify=self.y_train
+        )
+        self._subsamples = {}
+        self.timings = {"load": loaded - start, "preprocess": time.perf_counter() - loaded, "trials": 0.0}
+        self.preparations = 1
+
+    def merge_timings(self, timings: dict) -> None:
+        """
+        Add the timings of a worker process that prepared its own copy of the data.
+
+        :param timings: ``timings`` of the worker's StudyData.
+        :type timings: dict
+        """
+        for key, seconds in timings.items():
+            self.timings[key] += seconds
+        self.preparations += 1
+
+    def subsample(self, fraction: float) -> tuple:
+        """
+        :param fraction: Fraction of ``Xt_fit`` to keep.
+        :type fraction: float
+        :return: A stratified subsample (X, y) of the fit split, the same for every call with `fraction`.
+        :rtype: tuple
+        """
+        if fraction not in self._subsamples:
+            X, _, y, _ = train_test_split(self.Xt_fit, self.y_fit, train_size=fraction, random_state=42,
+                                          stratify=self.y_fit)
+            self._subsamples[fraction] = X, y
+        return self._subsamples[fraction]
+
+    def pipeline(self, classifier) -> Pipeline:
+        """
+        :param classifier: Classifier fitted on ``Xt_train``.
+        :return: A fitted pipeline of the shared preprocessor and `classifier` that predicts from raw features.
+        :rtype: Pipeline
+        """
+        return Pipeline([("preprocessor", self.preprocessor), ("classifier", classifier)])
+
+    def timing_report(self, n_trials: int) -> dict:
+        """
+        Split the study time into data preparation and trials.
+
+        :param n_trials: Number of trials run with this data.
+        :type n_trials: int
+        :return: Seconds spent preparing data and in trials, the fraction of the study spent on
+            data preparation, and the estimated fraction had every trial and the final fit
+            prepared the data again.
+        :rtype: dict
+        """
+        prep = self.timings["load"] + self.timings["preprocess"]
+        trials = self.timings["trials"]
+        repeated = prep / self.preparations * (n_trials + 1)
+        return {
+            "prep_seconds": prep,
+            "trial_seconds": trials,
+            "prep_fraction": prep / (prep + trials) if prep + trials else 0.0,
+            "per_trial_prep_fraction": repeated / (repeated + trials) if repeated + trials else 0.0,
+        }
+
+
+class PruningCallback(TrainingCallback):
+    """
+    Report the validation ROC AUC of every `report_every`-th boosting round to an Optuna trial
+    and stop training with :class:`optuna.TrialPruned` when the study's pruner says so.
+
+    :param trial: Trial being trained.
+    :type trial: optuna.Trial
+    :param report_every: Rounds between reports.
+    :type report_every: int
+    """
+
+    def __init__(self, trial, report_every: int = 10):
+        super().__init__()
+        self.trial = trial
+        self.report_every = report_every
+        self.rounds = 0
+
+    def after_iteration(self, model, epoch: int, evals_log: dict) -> bool:
+        self.rounds = epoch + 1
+        if self.rounds % self.report_every == 0:
+            self.trial.report(evals_log["validation_0"]["auc"][-1], epoch)
+            if self.trial.should_prune():
+                raise optuna.TrialPruned(f"Pruned at round {self.rounds}")
+        return False
+
+
+def create_pruner(name: str = "median"):
+    """
+    :param name: "median", "hyperband" or "none".
+    :type name: str
+    :return: Optuna pruner working on boosting rounds.
+    :rtype: optuna.pruners.BasePruner
+    """
+    if name == "median":
+        return optuna.pruners.MedianPruner(n_startup_trials=5, n_warmup_steps=30)
+    if name == "hyperband":
+        return optuna.pruners.HyperbandPruner(min_resource=10, reduction_factor=3)
+    if name == "none":
+        return optuna.pruners.NopPruner()
+    raise ValueError(f"Unsupported pruner: {name}")
+
+
+def objective(trial, data: StudyData = None, parent_run_id: str = None, n_jobs: int = None,
+              early_stopping_rounds: int = 50, subsample_trials: int = 0, subsample_fraction: float = 0.25):
+    """
+    Train and score one XGBoost configuration.
+
+    Boosting stops early once the validation ROC AUC has not improved for `early_stopping_rounds`
+    rounds, and intermediate scores are reported to the study's pruner. The first
+    `subsample_trials` trials of the study fit on a stratified `subsample_fraction` of the data.
+
+    :return: ROC AUC on the test split.
+    :rtype: float
+    :raises optuna.TrialPruned: If the pruner stopped the trial.
+    """
     xgb_params = {
         "n_estimators": trial.suggest_int("n_estimators", 50, 600),
         "max_depth": trial.suggest_int("max_depth", 3, 10),
@@ -58,49 +208,138 @@ def objective(trial):
         "subsample": trial.suggest_float("subsample", 0.5, 1.0),
         "colsample_bytree": trial.suggest_float("colsample_bytree", 0.5, 1.0),
         "random_state": 42,
-        "eval_metric": "logloss"
+        "eval_metric": "auc"
     }
 
-    X_train, X_test, y_train, y_test = load_and_prepare_data()
-    preprocessor = create_preprocessor()
-
-    model = Pipeline([
-        ("preprocessor", preprocessor),
-        ("classifier", get_model(MODEL_NAME, **xgb_params))
-    ])
-
-    with mlflow.start_run(nested=True) as run:
-        mlflow.log_params(xgb_params)
-        model.fit(X_train, y_train)
-
-        y_pred = model.predict(X_test)
-        y_probs = model.predict_proba(X_test)[:, 1]
-
-        accuracy = accuracy_score(y_test, y_pred)
-        precision = precision_score(y_test, y_pred)
-        recall = recall_score(y_test, y_pred)
-        roc_auc = roc_auc_score(y_test, y_probs)
-
-        mlflow.log_metrics({
-            "accuracy": accuracy,
-            "precision": precision,
-            "recall": recall,
-            "roc_auc": roc_auc
-        })
-
-        plot_path = "resources/plots/confusion_matrix.png"
-        plot_confusion_matrix(y_test, y_pred, save_path=plot_path)
-        mlflow.log_artifact(plot_path)
-
+    data = StudyData() if data is None else data
+    y_test = data.y_test
+    X_fit, y_fit = data.Xt_fit, data.y_fit
+    fidelity = 1.0
+    if trial.number < subsample_trials:
+        fidelity = subsample_fraction
+        X_fit, y_fit = data.subsample(fidelity)
+    trial.set_user_attr("fidelity", fidelity)
+    pruning = PruningCallback(trial)
+    pruned = False
+    start = time.perf_counter()
+
+    with mlflow.start_run(run_name=f"trial-{trial.number}", nested=True, parent_run_id=parent_run_id) as run:
+        mlflow.log_params({**xgb_params, "early_stopping_rounds": early_stopping_rounds, "fidelity": fidelity})
         # Save the run_id in the trial's user_attrs for later retrieval
         trial.set_user_attr("mlflow_run_id", run.info.run_id)
-
+        classifier = get_model(MODEL_NAME, n_jobs=n_jobs, early_stopping_rounds=early_stopping_rounds,
+                               callbacks=[pruning], **xgb_params)
+        try:
+            classifier.fit(X_fit, y_fit, eval_set=[(data.Xt_valid, data.y_valid)], verbose=False)
+        except optuna.TrialPruned:
+            pruned = True
+        trial.set_user_attr("rounds", pruning.rounds)
+        mlflow.log_metric("rounds", pruning.rounds)
+
+        if pruned:
+            mlflow.set_tag("pruned", "true")
+        else:
+            # Prediction uses the best round found by early stopping
+            best_iteration = classifier.best_iteration if early_stopping_rounds else pruning.rounds - 1
+            trial.set_user_attr("best_iteration", best_iteration)
+            y_pred = classifier.predict(data.Xt_test)
+            y_probs = classifier.predict_proba(data.Xt_test)[:, 1]
+
+            accuracy = accuracy_score(y_test, y_pred)
+            precision = precision_score(y_test, y_pred)
+            recall = recall_score(y_test, y_pred)
+            roc_auc = roc_auc_score(y_test, y_probs)
+
+            mlflow.log_metrics({
+                "accuracy": accuracy,
+                "precision": precision,
+                "recall": recall,
+                "roc_auc": roc_auc,
+                "best_iteration": best_iteration
+            })
+
+            # A fixed path would be overwritten by concurrent trials, so each run plots into its own directory
+            with tempfile.TemporaryDirectory() as plot_dir:
+                plot_path = os.path.join(plot_dir, "confusion_matrix.png")
+                plot_confusion_matrix(y_test, y_pred, save_path=plot_path)
+                mlflow.log_artifact(plot_path)
+
+    data.timings["trials"] += time.perf_counter() - start
+    if pruned:
+        raise optuna.TrialPruned(f"Pruned at round {pruning.rounds}")
     print_classification_report(y_test, y_pred)
     print_roc_auc(y_test, y_probs)
 
     return roc_auc
 
 
+def get_storage(storage: str):
+    """
+    :param storage: An RDB URL such as ``sqlite:///optuna.db``, or the path of a journal file.
+    :type storage: str
+    :return: Optuna storage that several processes can share.
+    """
+    if "://" in storage:
+        return storage
+    os.makedirs(os.path.dirname(storage) or ".", exist_ok=True)
+    return optuna.storages.JournalStorage(optuna.storages.journal.JournalFileBackend(storage))
+
+
+def _optimize_worker(study_name: str, storage: str, pruner, n_trials: int, objective_kwargs: dict,
+                     tracking_uri: str, registry_uri: str, experiment_id: str) -> dict:
+    mlflow.set_tracking_uri(tracking_uri)
+    mlflow.set_registry_uri(registry_uri)
+    mlflow.set_experiment(experiment_id=experiment_id)
+    data = StudyData()
+    study = optuna.load_study(study_name=study_name, storage=get_storage(storage), pruner=pruner)
+    study.optimize(partial(objective, data=data, **objective_kwargs), n_trials=n_trials)
+    return data.timings
+
+
+def run_study(study, data: StudyData, n_trials: int, workers: int = 1, storage: str = None,
+              parent_run_id: str = None, **objective_kwargs) -> None:
+    """
+    Run the trials of an Optuna study, in this process or spread over worker processes.
+
+    Workers load the study from the shared `storage`, prepare their own StudyData and log every
+    trial as its own MLflow run nested under `parent_run_id`. Their timings are merged into `data`.
+    Workers use the pruner of `study`; the remaining keyword arguments are passed to :func:`objective`.
+
+    :param study: Study created on `storage`.
+    :type study: optuna.Study
+    :param data: Data of this process, used for the trials when ``workers == 1``.
+    :type data: StudyData
+    :param n_trials: Total number of trials.
+    :type n_trials: int
+    :param workers: Number of worker processes.
+    :type workers: int
+    :param storage: Storage spec passed to :func:`get_storage`; required when ``workers > 1``.
+    :type storage: str
+    :param parent_run_id: MLflow run the trial runs are nested under.
+    :type parent_run_id: str
+    """
+    objective_kwargs["parent_run_id"] = parent_run_id
+    if workers <= 1:
+        study.optimize(partial(objective, data=data, **objective_kwargs), n_trials=n_trials)
+        return
+    if storage is None:
+        raise ValueError("Parallel trials need a shared storage")
+
+    shares = [n_trials // workers + (i < n_trials % workers) for i in range(workers)]
+    shares = [share for share in shares if share]
+    objective_kwargs["n_jobs"] = max(1, (os.cpu_count() or 1) // len(shares))
+    experiment_id = mlflow.get_run(parent_run_id).info.experiment_id if parent_run_id else None
+    # Spawned workers start without the parent's active MLflow run and XGBoost/OpenMP thread state
+    with ProcessPoolExecutor(max_workers=len(shares), mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [
+            executor.submit(_optimize_worker, study.study_name, storage, study.pruner, share, objective_kwargs,
+                            mlflow.get_tracking_uri(), mlflow.get_registry_uri(), experiment_id)
+            for share in shares
+        ]
+        for future in futures:
+            data.merge_timings(future.result())
+
+
 def get_latest_registered_model():
     """Fetch latest version of the registered model from MLflow."""
     client = MlflowClient()
@@ -121,7 +360,26 @@ def get_latest_registered_model():
         return None
 
 
-def main():
+def main(n_trials: int = 20, workers: int = 1, storage: str = OPTUNA_STORAGE, pruner: str = "median",
+         early_stopping_rounds: int = 50, subsample_trials: int = 0, subsample_fraction: float = 0.25):
+    """
+    Tune, train and register the xG model unless a registered model exists.
+
+    :param n_trials: Number of Optuna trials.
+    :type n_trials: int
+    :param workers: Number of processes running trials in parallel.
+    :type workers: int
+    :param storage: Optuna storage shared by the workers (see :func:`get_storage`).
+    :type storage: str
+    :param pruner: Pruner of unpromising trials (see :func:`create_pruner`).
+    :type pruner: str
+    :param early_stopping_rounds: Rounds without validation improvement before a trial stops boosting.
+    :type early_stopping_rounds: int
+    :param subsample_trials: Number of initial trials trained on a stratified subsample.
+    :type subsample_trials: int
+    :param subsample_fraction: Fraction of the training data used by those trials.
+    :type subsample_fraction: float
+    """
     mlflow.set_tracking_uri(MLFLOW_TRACKING_URI)
     mlflow.set_registry_uri(MLFLOW_REGISTRY_URI)
     mlflow.set_experiment(MLFLOW_EXPERIMENT_NAME)
@@ -134,8 +392,18 @@ def main():
 
     # If no model exists, run Optuna optimization
     print("🚀 No registered model found. Running hyperparameter optimization...")
-    study = optuna.create_study(direction="maximize")
-    study.optimize(objective, n_trials=20, n_jobs=1)
+    data = StudyData()
+    study = optuna.create_study(direction="maximize", study_name=MLFLOW_RUN_NAME, storage=get_storage(storage),
+                                pruner=create_pruner(pruner))
+    start = time.perf_counter()
+    with mlflow.start_run(run_name=MLFLOW_RUN_NAME) as parent_run:
+        run_study(study, data, n_trials, workers, storage, parent_run.info.run_id,
+                  early_stopping_rounds=early_stopping_rounds, subsample_trials=subsample_trials,
+                  subsample_fraction=subsample_fraction)
+    print(f"[INFO] {n_trials} trials on {workers} worker(s) took {time.perf_counter() - start:.1f}s")
+    pruned = [t for t in study.trials if t.state == optuna.trial.TrialState.PRUNED]
+    rounds = sum(t.user_attrs.get("rounds", 0) for t in study.trials)
+    print(f"[INFO] {len(pruned)} trial(s) pruned, {rounds} boosting rounds trained in total")
 
     print("Best trial:")
     print(f"  ROC AUC: {study.best_value}")
@@ -144,14 +412,18 @@ def main():
     best_trial = study.best_trial
     best_params = best_trial.params
     best_params.update({"random_state": 42, "eval_metric": "logloss"})
+    # Refit on the whole training split with the number of rounds early stopping settled on
+    best_params["n_estimators"] = best_trial.user_attrs["best_iteration"] + 1
 
-    X_train, X_test, y_train, y_test = load_and_prepare_data()
-    preprocessor = create_preprocessor()
-    best_model = Pipeline([
-        ("preprocessor", preprocessor),
-        ("classifier", get_model(MODEL_NAME, **best_params))
-    ])
-    best_model.fit(X_train, y_train)
+    classifier = get_model(MODEL_NAME, **best_params)
+    classifier.fit(data.Xt_train, data.y_train)
+    best_model = data.pipeline(classifier)
+
+    report = data.timing_report(n_trials)
+    print(f"[INFO] Data preparation: {report['prep_seconds']:.2f}s in {data.preparations} process(es), "
+          f"trials: {report['trial_seconds']:.2f}s")
+    print(f"[INFO] Share of study spent on data preparation: {report['prep_fraction']:.1%} "
+          f"(~{report['per_trial_prep_fraction']:.1%} when prepared per trial)")
 
     # Save locally
     save_model(best_model, MODEL_SAVE_PATH)
@@ -164,10 +436,26 @@ def main():
             best_model,
             artifact_path="model",
             registered_model_name=MODEL_NAME,
-            input_example=X_train.head(5)
+            input_example=data.X_train.head(5)
         )
         print(f"Model registered to MLflow as '{MODEL_NAME}' in run {best_run_id}.")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Tune and train the xG model.")
+    parser.add_argument("--trials", type=int, default=20, help="Number of Optuna trials.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of processes running trials in parallel.")
+    parser.add_argument("--storage", type=str, default=OPTUNA_STORAGE,
+                        help="Optuna storage: an RDB URL (e.g. sqlite:///optuna.db) or a journal file path.")
+    parser.add_argument("--pruner", choices=["median", "hyperband", "none"], default="median",
+                        help="Pruner of unpromising trials.")
+    parser.add_argument("--early-stopping-rounds", type=int, default=50,
+                        help="Rounds without validation improvement before a trial stops boosting.")
+    parser.add_argument("--subsample-trials", type=int, default=0,
+                        help="Number of initial trials trained on a stratified subsample (multi-fidelity).")
+    parser.add_argument("--subsample-fraction", type=float, default=0.25,
+                        help="Fraction of the training data used by the subsampled trials.")
+    args = parser.parse_args()
+    main(n_trials=args.trials, workers=args.workers, storage=args.storage, pruner=args.pruner,
+         early_stopping_rounds=args.early_stopping_rounds, subsample_trials=args.subsample_trials,
+         subsample_fraction=args.subsample_fraction)
\ No newline at end of file
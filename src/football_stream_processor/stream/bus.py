@@ -0,0 +1,262 @@
+"""
+In-process publish/subscribe event bus over bounded asyncio queues.
+
+Every subscriber gets its own bounded queue and a backpressure policy that decides what
+happens when that queue is full:
+
+- ``block``: the publisher waits until the subscriber catches up (optionally only for
+  `block_timeout` seconds, after which the event is dropped for that subscriber). Use it
+  for consumers that must see every event; a slow one slows down publishing. With a
+  `block_timeout`, closing the bus evicts the oldest queued event of a stalled subscriber
+  to make room for the end-of-stream marker instead of waiting for it.
+- ``drop_oldest``: the oldest queued event is discarded to make room. The publisher never waits.
+- ``sample``: only every `sample_every`-th event is offered to the subscriber and new events
+  are dropped while its queue is full. The publisher never waits.
+
+Queues are bounded, so a slow subscriber under ``drop_oldest`` or ``sample`` neither stalls
+the other subscribers nor grows memory. Each subscription counts offered, delivered and
+dropped events, its current and maximum lag (queued events) and its throughput.
+
+Example::
+
+    bus = EventBus()
+    summary = bus.subscribe("summary", maxsize=10000, policy=BLOCK)
+    animation = bus.subscribe("animation", maxsize=100, policy=DROP_OLDEST)
+    asyncio.create_task(bus.publish_from(AsyncMatchReplay(22912, clock=VirtualClock())))
+    async for match_time, event in summary:
+        accumulator.update(event)
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterable, Iterable, Optional, Union
+
+BLOCK = "block"
+DROP_OLDEST = "drop_oldest"
+SAMPLE = "sample"
+POLICIES = (BLOCK, DROP_OLDEST, SAMPLE)
+
+_CLOSED = object()
+
+
+class Subscription:
+    """
+    One subscriber's bounded queue, backpressure policy and counters.
+
+    Created by :meth:`EventBus.subscribe`. Iterate it with ``async for`` to consume events
+    until the bus is closed.
+
+    :param name: Subscriber name used in the stats.
+    :type name: str
+    :param maxsize: Maximum number of queued events.
+    :type maxsize: int
+    :param policy: One of BLOCK, DROP_OLDEST or SAMPLE.
+    :type policy: str
+    :param sample_every: Offer every n-th event under the SAMPLE policy.
+    :type sample_every: int
+    :param block_timeout: Seconds a BLOCK subscriber may hold up the publisher per event; None waits forever.
+    :type block_timeout: float or None
+    """
+
+    def __init__(self, name: str, maxsize: int = 1000, policy: str = BLOCK, sample_every: int = 10,
+                 block_timeout: Optional[float] = None):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.name = name
+        self.policy = policy
+        self.sample_every = sample_every
+        self.block_timeout = block_timeout
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        self.offered = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.max_lag = 0
+        self._seen = 0
+        self._started = None
+        self._closed = False
+
+    @property
+    def lag(self) -> int:
+        """
+        :return: Number of events queued but not yet consumed.
+        :rtype: int
+        """
+        return self.queue.qsize()
+
+    @property
+    def throughput(self) -> float:
+        """
+        :return: Consumed events per second since the first delivery.
+        :rtype: float
+        """
+        if self._started is None:
+            return 0.0
+        elapsed = time.perf_counter() - self._started
+        return self.delivered / elapsed if elapsed > 0 else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "policy": self.policy,
+            "offered": self.offered,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "lag": self.lag,
+            "max_lag": self.max_lag,
+            "throughput": self.throughput,
+        }
+
+    async def _offer(self, item: Any) -> None:
+        self._seen += 1
+        if self.policy == SAMPLE and (self._seen - 1) % self.sample_every:
+            self.dropped += 1
+            return
+        self.offered += 1
+        queue = self.queue
+        if self.policy == BLOCK:
+            if self.block_timeout is None:
+                await queue.put(item)
+            else:
+                try:
+                    await asyncio.wait_for(queue.put(item), self.block_timeout)
+                except asyncio.TimeoutError:
+                    self.dropped += 1
+                    return
+        elif queue.full():
+            if self.policy == DROP_OLDEST:
+                queue.get_nowait()
+                self.dropped += 1
+                queue.put_nowait(item)
+            else:
+                self.dropped += 1
+                return
+        else:
+            queue.put_nowait(item)
+        self.max_lag = max(self.max_lag, queue.qsize())
+
+    async def _close(self) -> None:
+        if self.policy == BLOCK:
+            if self.block_timeout is None:
+                await self.queue.put(_CLOSED)
+                return
+            try:
+                await asyncio.wait_for(self.queue.put(_CLOSED), self.block_timeout)
+                return
+            except asyncio.TimeoutError:
+                # A stalled subscriber must not hold up end of stream for the others
+                pass
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(_CLOSED)
+
+    async def get(self) -> Any:
+        """
+        Wait for the next event.
+
+        :return: The next published item.
+        :raises StopAsyncIteration: If the bus was closed and the queue is drained.
+        """
+        if self._closed:
+            raise StopAsyncIteration
+        item = await self.queue.get()
+        if item is _CLOSED:
+            self._closed = True
+            raise StopAsyncIteration
+        if self._started is None:
+            self._started = time.perf_counter()
+        self.delivered += 1
+        return item
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> Any:
+        return await self.get()
+
+
+class EventBus:
+    """
+    Fan published events out to all subscriptions according to their backpressure policy.
+    """
+
+    def __init__(self):
+        self.subscriptions = {}
+        self.published = 0
+        self.closed = False
+
+    def subscribe(self, name: str, maxsize: int = 1000, policy: str = BLOCK, sample_every: int = 10,
+                  block_timeout: Optional[float] = None) -> Subscription:
+        """
+        Register a subscriber. Only events published after subscribing are delivered.
+
+        :param name: Unique subscriber name.
+        :type name: str
+        :return: The new subscription. See :class:`Subscription` for the other parameters.
+        :rtype: Subscription
+        :raises ValueError: If the name is already subscribed or the policy is unknown.
+        """
+        if name in self.subscriptions:
+            raise ValueError(f"Subscriber already registered: {name}")
+        subscription = Subscription(name, maxsize, policy, sample_every, block_timeout)
+        self.subscriptions[name] = subscription
+        return subscription
+
+    def unsubscribe(self, name: str) -> None:
+        self.subscriptions.pop(name, None)
+
+    async def publish(self, item: Any) -> None:
+        """
+        Offer an item to every subscription. Waits only for BLOCK subscribers with a full queue.
+
+        :param item: Event (or any object) to publish.
+        :raises RuntimeError: If the bus is closed.
+        """
+        if self.closed:
+            raise RuntimeError("Cannot publish to a closed bus")
+        self.published += 1
+        for subscription in list(self.subscriptions.values()):
+            await subscription._offer(item)
+        # Let consumers run even when no subscriber made the publisher wait
+        await asyncio.sleep(0)
+
+    async def publish_from(self, source: Union[AsyncIterable, Iterable], close: bool = True) -> int:
+        """
+        Publish every item of a (async) iterable, e.g. an :class:`AsyncMatchReplay`.
+
+        :param source: Items to publish.
+        :type source: AsyncIterable or Iterable
+        :param close: Close the bus when the source is exhausted.
+        :type close: bool
+        :return: Number of items published.
+        :rtype: int
+        """
+        count = 0
+        if hasattr(source, "__aiter__"):
+            async for item in source:
+                await self.publish(item)
+                count += 1
+        else:
+            for item in source:
+                await self.publish(item)
+                count += 1
+        if close:
+            await self.close()
+        return count
+
+    async def close(self) -> None:
+        """
+        Signal end of stream; subscribers stop iterating after draining their queues.
+        """
+        if not self.closed:
+            self.closed = True
+            for subscription in list(self.subscriptions.values()):
+                await subscription._close()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """
+        :return: Counters per subscriber name.
+        :rtype: dict[str, dict]
+        """
+        return {name: subscription.stats() for name, subscription in self.subscriptions.items()}
@@ -0,0 +1,203 @@
+"""
+Bounded-memory duplicate suppression keyed on the StatsBomb event ``id``.
+
+:class:`EventDeduplicator` keeps an exact set of ids for each live match and, for every id,
+also sets its bits in a fixed-size Bloom filter. Once a match is closed (or evicted because
+more than `max_live_matches` are open) its exact set is dropped and later re-deliveries are
+caught by the filter alone, with the configured false-positive rate. The filter is
+rotated once it holds `capacity` ids, the previous generation still being consulted, so a
+long-running process never uses more than two filters.
+
+While a match is live both structures are consulted. If the match's exact set covers all of its
+events, a filter hit for an id the set has not seen is a measured false positive of the filter.
+A match that is reopened after its set was dropped only has a partial set, so there a filter
+hit is taken as a duplicate.
+
+Example::
+
+    dedup = EventDeduplicator()
+    for event in feed:
+        if not dedup.is_duplicate(event, match_id):
+            accumulator.update(event)
+"""
+
+import hashlib
+import math
+from collections import OrderedDict
+from typing import Hashable, Iterable, Iterator, Optional
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings using double hashing of a 128-bit BLAKE2b digest.
+
+    :param capacity: Number of items the filter is sized for.
+    :type capacity: int
+    :param error_rate: Target false-positive rate at `capacity` items.
+    :type error_rate: float
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 1e-4):
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate in (0, 1)")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.n_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.n_hashes = max(1, round(self.n_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.n_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        n_bits = self.n_bits
+        return [(h1 + i * h2) % n_bits for i in range(self.n_hashes)]
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def add(self, item: str) -> bool:
+        """
+        Add an item.
+
+        :param item: Item to add.
+        :type item: str
+        :return: True if the item was (probably) present already.
+        :rtype: bool
+        """
+        bits = self.bits
+        present = True
+        for pos in self._positions(item):
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                present = False
+                bits[pos >> 3] |= mask
+        if not present:
+            self.count += 1
+        return present
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.bits)
+
+    def expected_error_rate(self) -> float:
+        """
+        :return: Expected false-positive rate at the current number of items.
+        :rtype: float
+        """
+        return (1 - math.exp(-self.n_hashes * self.count / self.n_bits)) ** self.n_hashes
+
+
+class EventDeduplicator:
+    """
+    Exact per-match id sets for live matches with a rotating Bloom filter behind them.
+
+    :param capacity: Ids per Bloom filter generation.
+    :type capacity: int
+    :param error_rate: Target false-positive rate of each generation.
+    :type error_rate: float
+    :param max_live_matches: Maximum number of matches with an exact id set; the least recently used is closed.
+    :type max_live_matches: int
+    """
+
+    def __init__(self, capacity: int = 5_000_000, error_rate: float = 1e-4, max_live_matches: int = 200):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.max_live_matches = max_live_matches
+        self.live = OrderedDict()
+        # Matches whose exact set was dropped; one entry per match, not per event
+        self.closed_matches = set()
+        self.filter = BloomFilter(capacity, error_rate)
+        self.previous_filter = None
+        self.checked = 0
+        self.duplicates = 0
+        self.exact_hits = 0
+        self.filter_hits = 0
+        self.false_positives = 0
+        self.rotations = 0
+
+    def _in_filters(self, event_id: str) -> bool:
+        return event_id in self.filter or (self.previous_filter is not None and event_id in self.previous_filter)
+
+    def _remember(self, event_id: str) -> None:
+        if self.filter.count >= self.capacity:
+            self.previous_filter = self.filter
+            self.filter = BloomFilter(self.capacity, self.error_rate)
+            self.rotations += 1
+        self.filter.add(event_id)
+
+    def is_duplicate(self, event: dict, match_id: Optional[Hashable] = None) -> bool:
+        """
+        Check an event and remember its id.
+
+        :param event: StatsBomb event dictionary. Events without an id are never duplicates.
+        :type event: dict
+        :param match_id: Match the event belongs to. Without a match the event is checked
+            against the Bloom filter only.
+        :type match_id: Hashable or None
+        :return: True if the event id was seen before (or, after its match was closed, probably seen).
+        :rtype: bool
+        """
+        event_id = event.get("id")
+        if event_id is None:
+            return False
+        self.checked += 1
+
+        seen = self.live.get(match_id) if match_id is not None else None
+        if seen is not None:
+            self.live.move_to_end(match_id)
+            if event_id in seen:
+                self.duplicates += 1
+                self.exact_hits += 1
+                return True
+
+        in_filter = self._in_filters(event_id)
+        # Without a complete exact set the filter decides; a resend to a closed match does not reopen it
+        if in_filter and (match_id is None or match_id in self.closed_matches):
+            self.duplicates += 1
+            self.filter_hits += 1
+            return True
+
+        if match_id is not None:
+            if seen is None:
+                seen = self.live[match_id] = set()
+                while len(self.live) > self.max_live_matches:
+                    self.closed_matches.add(self.live.popitem(last=False)[0])
+            if in_filter:
+                self.false_positives += 1
+            seen.add(event_id)
+        self._remember(event_id)
+        return False
+
+    def close_match(self, match_id: Hashable) -> None:
+        """
+        Drop the exact id set of a finished match; its ids stay in the Bloom filter.
+        """
+        if self.live.pop(match_id, None) is not None:
+            self.closed_matches.add(match_id)
+
+    def filter_events(self, events: Iterable[dict], match_id: Optional[Hashable] = None) -> Iterator[dict]:
+        """
+        :return: The events whose ids were not seen before.
+        :rtype: Iterator[dict]
+        """
+        for event in events:
+            if not self.is_duplicate(event, match_id):
+                yield event
+
+    def stats(self) -> dict:
+        return {
+            "checked": self.checked,
+            "duplicates": self.duplicates,
+            "exact_hits": self.exact_hits,
+            "filter_hits": self.filter_hits,
+            "false_positives": self.false_positives,
+            "live_matches": len(self.live),
+            "live_ids": sum(len(ids) for ids in self.live.values()),
+            "filter_ids": self.filter.count,
+            "filter_bytes": self.filter.nbytes + (self.previous_filter.nbytes if self.previous_filter else 0),
+            "expected_error_rate": self.filter.expected_error_rate(),
+            "rotations": self.rotations,
+        }
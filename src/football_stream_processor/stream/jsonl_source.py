@@ -0,0 +1,247 @@
+"""
+Live ingestion of newline-delimited JSON (JSON Lines) events.
+
+Line sources read raw lines from a growing file (``tail -f`` style), from stdin or from a
+local TCP socket. :class:`JsonLinesSource` parses the lines as they arrive and groups the
+events into micro-batches that are closed when `batch_size` events are collected or
+`max_delay` seconds after the first event of the batch, whichever comes first. Batches can
+be consumed directly or published event by event to an :class:`EventBus`, as
+``(elapsed match seconds, event)`` tuples like the replay path.
+
+Usage:
+    poetry run python src/football_stream_processor/stream/jsonl_source.py --file feed.jsonl --follow
+    cat feed.jsonl | poetry run python src/football_stream_processor/stream/jsonl_source.py --stdin
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import deque
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Optional
+from football_stream_processor.stream.bus import EventBus
+from football_stream_processor.utils.time_utils import PeriodClock
+
+CHUNK_SIZE = 1 << 16
+
+
+async def tail_lines(path: Path, follow: bool = True, poll_interval: float = 0.05,
+                     idle_timeout: Optional[float] = None) -> AsyncIterator[bytes]:
+    """
+    Yield complete lines of a file, waiting for new data at the end like ``tail -f``.
+
+    A partial last line is held back until its newline arrives.
+
+    :param path: JSON Lines file.
+    :type path: Path
+    :param follow: Keep waiting for appended data at the end of the file.
+    :type follow: bool
+    :param poll_interval: Seconds between checks for new data.
+    :type poll_interval: float
+    :param idle_timeout: Stop following after this many seconds without new data. None follows forever.
+    :type idle_timeout: float or None
+    :return: Iterator of lines without the newline.
+    :rtype: AsyncIterator[bytes]
+    """
+    pending = b""
+    idle_since = time.monotonic()
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if chunk:
+                idle_since = time.monotonic()
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                for line in lines:
+                    yield line
+                continue
+            if not follow or (idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout):
+                break
+            await asyncio.sleep(poll_interval)
+    if pending:
+        yield pending
+
+
+async def reader_lines(reader: asyncio.StreamReader) -> AsyncIterator[bytes]:
+    """
+    Yield lines from an asyncio stream until EOF.
+
+    :param reader: Stream reader, e.g. of a socket connection or of stdin.
+    :type reader: asyncio.StreamReader
+    :return: Iterator of lines without the newline.
+    :rtype: AsyncIterator[bytes]
+    """
+    while True:
+        line = await reader.readline()
+        if not line:
+            return
+        yield line.rstrip(b"\n")
+
+
+async def stdin_lines() -> AsyncIterator[bytes]:
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=1 << 24)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    async for line in reader_lines(reader):
+        yield line
+
+
+async def socket_lines(host: str, port: int) -> AsyncIterator[bytes]:
+    reader, writer = await asyncio.open_connection(host, port, limit=1 << 24)
+    try:
+        async for line in reader_lines(reader):
+            yield line
+    finally:
+        writer.close()
+
+
+class JsonLinesSource:
+    """
+    Parse JSON lines incrementally and group the events into micro-batches.
+
+    :param lines: Async iterable of raw lines, e.g. :func:`tail_lines`.
+    :type lines: AsyncIterable[bytes]
+    :param batch_size: Close a batch once it holds this many events.
+    :type batch_size: int
+    :param max_delay: Close a batch this many seconds after its first event arrived.
+    :type max_delay: float
+    :param buffer_size: Maximum number of parsed events waiting to be batched. Defaults to two
+        batches; a larger buffer only adds queueing delay when the source outpaces the consumers.
+    :type buffer_size: int or None
+    """
+
+    def __init__(self, lines: AsyncIterable[bytes], batch_size: int = 100, max_delay: float = 0.05,
+                 buffer_size: Optional[int] = None):
+        self.lines = lines
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.buffer_size = buffer_size if buffer_size is not None else 2 * batch_size
+        self.events = 0
+        self.batches = 0
+        self.errors = 0
+        self.bytes = 0
+        # Seconds from parsing an event to handing out its batch, for the most recent events
+        self.latencies = deque(maxlen=100000)
+
+    async def _read(self, queue: asyncio.Queue) -> None:
+        cancelled = False
+        try:
+            async for line in self.lines:
+                if not line.strip():
+                    continue
+                self.bytes += len(line) + 1
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    self.errors += 1
+                    continue
+                await queue.put((time.perf_counter(), event))
+        except asyncio.CancelledError:
+            # The consumer closed iter_batches early; nobody waits for the end-of-stream marker
+            cancelled = True
+            raise
+        finally:
+            if not cancelled:
+                await queue.put(None)
+
+    async def iter_batches(self) -> AsyncIterator[list[dict]]:
+        """
+        Yield micro-batches of parsed events.
+
+        Events are parsed by a reader task into a bounded queue, so waiting for the batch
+        deadline never interrupts a read.
+
+        :return: Iterator of non-empty lists of events.
+        :rtype: AsyncIterator[list[dict]]
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=self.buffer_size)
+        reader = asyncio.create_task(self._read(queue))
+        batch, received, deadline, done = [], [], None, False
+        try:
+            while not done:
+                timeout = None if deadline is None else max(deadline - loop.time(), 0)
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    item = False
+                if item is None:
+                    done = True
+                elif item is not False:
+                    received.append(item[0])
+                    batch.append(item[1])
+                    if deadline is None:
+                        deadline = loop.time() + self.max_delay
+                if batch and (done or item is False or len(batch) >= self.batch_size):
+                    now = time.perf_counter()
+                    self.latencies.extend(now - t for t in received)
+                    self.events += len(batch)
+                    self.batches += 1
+                    yield batch
+                    batch, received, deadline = [], [], None
+        finally:
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
+
+    async def publish_to(self, bus: EventBus, close: bool = True) -> int:
+        """
+        Publish every event to a bus as ``(elapsed match seconds, event)``, like the replay path.
+
+        Elapsed time is tracked per ``match_id`` field (if the events carry one).
+
+        :param bus: Event bus to publish to.
+        :type bus: EventBus
+        :param close: Close the bus when the source ends.
+        :type close: bool
+        :return: Number of events published.
+        :rtype: int
+        """
+        clocks = {}
+        count = 0
+        async for batch in self.iter_batches():
+            for event in batch:
+                clock = clocks.setdefault(event.get("match_id"), PeriodClock())
+                match_time = clock.elapsed(event.get("period", 1), event.get("timestamp", "00:00:00.000"))
+                await bus.publish((match_time, event))
+                count += 1
+        if close:
+            await bus.close()
+        return count
+
+    def stats(self) -> dict:
+        return {"events": self.events, "batches": self.batches, "errors": self.errors, "bytes": self.bytes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest JSON Lines events from a file, stdin or a socket.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--file", type=Path, help="JSON Lines file to read.")
+    source.add_argument("--stdin", action="store_true", help="Read from stdin.")
+    source.add_argument("--socket", help="host:port of a local socket to read from.")
+    parser.add_argument("--follow", action="store_true", help="Keep tailing the file for new lines.")
+    parser.add_argument("--batch-size", type=int, default=100, help="Maximum events per micro-batch.")
+    parser.add_argument("--max-delay", type=float, default=0.05, help="Maximum seconds a batch stays open.")
+    args = parser.parse_args()
+
+    async def run():
+        if args.file:
+            lines = tail_lines(args.file, follow=args.follow)
+        elif args.stdin:
+            lines = stdin_lines()
+        else:
+            host, port = args.socket.rsplit(":", 1)
+            lines = socket_lines(host, int(port))
+        source = JsonLinesSource(lines, batch_size=args.batch_size, max_delay=args.max_delay)
+        start = time.perf_counter()
+        async for batch in source.iter_batches():
+            print(f"[INFO] Batch {source.batches}: {len(batch)} events")
+        elapsed = time.perf_counter() - start
+        print(f"[INFO] {source.stats()} in {elapsed:.2f}s ({source.events / elapsed if elapsed else 0:.0f} events/s)")
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+"""
+Durable, append-only, segmented event log on local disk.
+
+The log is a single ordered partition of JSON records, each addressed by a sequential
+offset. Records are appended to the active segment and the log rolls over to a new segment
+once the active one exceeds `segment_bytes`. Consumer groups commit the next offset they
+want to read, so a consumer resumes where it stopped after a restart or crash.
+
+Directory layout (``log_dir``):
+- ``segments/<base_offset>.log``: records, each ``<length:u32><crc32:u32><timestamp:f64><payload>``
+  with a UTF-8 JSON payload
+- ``segments/<base_offset>.index``: sparse index of ``<relative_offset:u32><position:u32>``
+  entries, one every `index_interval` bytes of log
+- ``consumers/<group>.json``: committed offset of each consumer group
+
+On open, the tail of the active segment is validated and a partially written record left
+by a crash is truncated.
+
+Usage:
+    poetry run python src/football_stream_processor/stream/log.py append 22912 3788741
+    poetry run python src/football_stream_processor/stream/log.py consume --group summary --max-records 100
+"""
+
+import argparse
+import bisect
+import json
+import os
+import struct
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+from football_stream_processor.config import PICKLE_DIR
+from football_stream_processor.match.simulate import resolve_events_path
+from football_stream_processor.utils.event_reader import iter_events
+
+HEADER = struct.Struct("<IId")
+INDEX_ENTRY = struct.Struct("<II")
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+DEFAULT_INDEX_INTERVAL = 4096
+
+
+class Segment:
+    """
+    One log file and its sparse index, starting at `base_offset`.
+    """
+
+    def __init__(self, directory: Path, base_offset: int):
+        self.base_offset = base_offset
+        self.log_path = directory / f"{base_offset:020d}.log"
+        self.index_path = directory / f"{base_offset:020d}.index"
+        self.index = []  # (relative_offset, position)
+        if self.index_path.exists():
+            raw = self.index_path.read_bytes()
+            usable = len(raw) - len(raw) % INDEX_ENTRY.size
+            self.index = [INDEX_ENTRY.unpack_from(raw, pos) for pos in range(0, usable, INDEX_ENTRY.size)]
+
+    @property
+    def size(self) -> int:
+        return self.log_path.stat().st_size if self.log_path.exists() else 0
+
+    def seek_position(self, offset: int) -> tuple[int, int]:
+        """
+        :return: The closest indexed (offset, file position) at or before `offset`.
+        :rtype: tuple[int, int]
+        """
+        pos = bisect.bisect_right(self.index, (offset - self.base_offset, float("inf"))) - 1
+        if pos < 0:
+            return self.base_offset, 0
+        relative, position = self.index[pos]
+        return self.base_offset + relative, position
+
+    def scan(self, offset: int, position: int) -> Iterator[tuple[int, int, float, bytes]]:
+        """
+        Read valid records from `position` (which holds `offset`) to the end of the segment.
+
+        :return: Iterator of (offset, end position, timestamp, payload). Stops at a torn or corrupt record.
+        :rtype: Iterator[tuple[int, int, float, bytes]]
+        """
+        with open(self.log_path, "rb") as f:
+            f.seek(position)
+            while True:
+                header = f.read(HEADER.size)
+                if len(header) < HEADER.size:
+                    return
+                length, crc, timestamp = HEADER.unpack(header)
+                payload = f.read(length)
+                if len(payload) < length or zlib.crc32(payload) != crc:
+                    return
+                position += HEADER.size + length
+                yield offset, position, timestamp, payload
+                offset += 1
+
+
+class EventLog:
+    """
+    Append-only segmented log with a sparse offset index.
+
+    :param log_dir: Directory of the log.
+    :type log_dir: Path
+    :param segment_bytes: Roll to a new segment once the active segment reaches this size.
+    :type segment_bytes: int
+    :param index_interval: Add a sparse index entry every this many bytes of log.
+    :type index_interval: int
+    :param fsync: fsync the active segment on every :meth:`flush` for durability across power loss.
+    :type fsync: bool
+    """
+
+    def __init__(self, log_dir: Path, segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+                 index_interval: int = DEFAULT_INDEX_INTERVAL, fsync: bool = False):
+        self.log_dir = Path(log_dir)
+        self.segment_dir = self.log_dir / "segments"
+        self.consumer_dir = self.log_dir / "consumers"
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        self.consumer_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.index_interval = index_interval
+        self.fsync = fsync
+
+        bases = sorted(int(path.stem) for path in self.segment_dir.glob("*.log"))
+        self.segments = [Segment(self.segment_dir, base) for base in bases] or [Segment(self.segment_dir, 0)]
+        self._recover_active()
+        self._open_active()
+
+    def _recover_active(self) -> None:
+        active = self.segments[-1]
+        size = active.size
+        index = [entry for entry in active.index if entry[1] <= size]
+        active.index = index
+        offset, position = active.seek_position(float("inf"))
+        end = position
+        if active.log_path.exists():
+            for record_offset, end, _, _ in active.scan(offset, position):
+                offset = record_offset + 1
+            if end < size:
+                # A crash left a partial record behind; drop it
+                with open(active.log_path, "r+b") as f:
+                    f.truncate(end)
+        active.index = [entry for entry in index if entry[1] <= end]
+        if active.index_path.exists() and active.index_path.stat().st_size != len(active.index) * INDEX_ENTRY.size:
+            active.index_path.write_bytes(b"".join(INDEX_ENTRY.pack(*entry) for entry in active.index))
+        self.next_offset = offset
+        self._active_size = end
+        self._last_indexed = active.index[-1][1] if active.index else None
+
+    def _open_active(self) -> None:
+        active = self.segments[-1]
+        self._log_file = open(active.log_path, "ab")
+        self._index_file = open(active.index_path, "ab")
+
+    def _roll(self) -> None:
+        self.flush()
+        self._log_file.close()
+        self._index_file.close()
+        self.segments.append(Segment(self.segment_dir, self.next_offset))
+        self._active_size = 0
+        self._last_indexed = None
+        self._open_active()
+
+    @property
+    def start_offset(self) -> int:
+        return self.segments[0].base_offset
+
+    @property
+    def end_offset(self) -> int:
+        """
+        :return: The offset the next appended record will get.
+        :rtype: int
+        """
+        return self.next_offset
+
+    def append(self, record: Any, timestamp: Optional[float] = None) -> int:
+        """
+        Append one JSON-serializable record.
+
+        :param record: Record to append, e.g. an event dictionary.
+        :type record: Any
+        :param timestamp: Record time in seconds; defaults to the current wall-clock time.
+        :type timestamp: float or None
+        :return: Offset of the record.
+        :rtype: int
+        """
+        if self._active_size >= self.segment_bytes:
+            self._roll()
+        payload = json.dumps(record, separators=(",", ":")).encode("utf-8")
+        active = self.segments[-1]
+        if self._last_indexed is None or self._active_size - self._last_indexed >= self.index_interval:
+            entry = (self.next_offset - active.base_offset, self._active_size)
+            active.index.append(entry)
+            self._index_file.write(INDEX_ENTRY.pack(*entry))
+            self._last_indexed = self._active_size
+        self._log_file.write(HEADER.pack(len(payload), zlib.crc32(payload), time.time() if timestamp is None else timestamp))
+        self._log_file.write(payload)
+        self._active_size += HEADER.size + len(payload)
+        offset = self.next_offset
+        self.next_offset += 1
+        return offset
+
+    def append_many(self, records: Iterable[Any]) -> int:
+        """
+        Append records and flush once at the end.
+
+        :return: Offset of the next record after the appended ones.
+        :rtype: int
+        """
+        for record in records:
+            self.append(record)
+        self.flush()
+        return self.next_offset
+
+    def flush(self) -> None:
+        self._log_file.flush()
+        self._index_file.flush()
+        if self.fsync:
+            os.fsync(self._log_file.fileno())
+
+    def close(self) -> None:
+        if not self._log_file.closed:
+            self.flush()
+            self._log_file.close()
+            self._index_file.close()
+
+    def __enter__(self) -> "EventLog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _segment_for(self, offset: int) -> int:
+        return max(bisect.bisect_right([s.base_offset for s in self.segments], offset) - 1, 0)
+
+    def read(self, offset: int = 0, max_records: Optional[int] = None,
+             with_timestamps: bool = False) -> Iterator[tuple]:
+        """
+        Read records starting at `offset`.
+
+        The segment is found by binary search over segment base offsets and the read starts
+        at the closest sparse index entry, so only the bytes from there on are scanned.
+
+        :param offset: First offset to read. Offsets before the start of the log read from the start.
+        :type offset: int
+        :param max_records: Maximum number of records to return. Defaults to all.
+        :type max_records: int or None
+        :param with_timestamps: Yield (offset, timestamp, record) instead of (offset, record).
+        :type with_timestamps: bool
+        :return: Iterator of (offset, record) tuples.
+        :rtype: Iterator[tuple]
+        """
+        if not self._log_file.closed:
+            self._log_file.flush()
+        offset = max(offset, self.start_offset)
+        returned = 0
+        for segment in self.segments[self._segment_for(offset):]:
+            if not segment.log_path.exists():
+                continue
+            current, position = segment.seek_position(offset)
+            for record_offset, _, timestamp, payload in segment.scan(current, position):
+                if record_offset < offset:
+                    continue
+                if max_records is not None and returned >= max_records:
+                    return
+                record = json.loads(payload)
+                yield (record_offset, timestamp, record) if with_timestamps else (record_offset, record)
+                returned += 1
+
+    def offset_for_time(self, timestamp: float) -> int:
+        """
+        Find the first offset whose record time is at or after `timestamp`, e.g. to replay the last N minutes.
+
+        Record times are assumed to be non-decreasing.
+
+        :param timestamp: Time in seconds.
+        :type timestamp: float
+        :return: The offset, or `end_offset` if all records are older.
+        :rtype: int
+        """
+        if not self._log_file.closed:
+            self._log_file.flush()
+        candidates = []
+        for segment in self.segments:
+            first = next(segment.scan(segment.base_offset, 0), None) if segment.log_path.exists() else None
+            if first is not None:
+                candidates.append((first[2], segment))
+        pos = max(bisect.bisect_right([t for t, _ in candidates], timestamp) - 1, 0)
+        for _, segment in candidates[pos:]:
+            for record_offset, _, record_time, _ in segment.scan(segment.base_offset, 0):
+                if record_time >= timestamp:
+                    return record_offset
+        return self.next_offset
+
+
+class ConsumerGroup:
+    """
+    Reader of an :class:`EventLog` that commits its position under a group name.
+
+    :param log: The log to consume.
+    :type log: EventLog
+    :param group: Consumer group name.
+    :type group: str
+    """
+
+    def __init__(self, log: EventLog, group: str):
+        self.log = log
+        self.group = group
+        self.path = log.consumer_dir / f"{group}.json"
+        self.position = self.committed()
+
+    def committed(self) -> int:
+        """
+        :return: The committed offset, or the start of the log if the group never committed.
+        :rtype: int
+        """
+        if self.path.exists():
+            with open(self.path, "r") as f:
+                return max(json.load(f)["offset"], self.log.start_offset)
+        return self.log.start_offset
+
+    def poll(self, max_records: int = 500) -> list[tuple[int, Any]]:
+        """
+        Read the next records after the current position and advance it (without committing).
+
+        :param max_records: Maximum number of records to return.
+        :type max_records: int
+        :return: List of (offset, record) tuples.
+        :rtype: list[tuple[int, Any]]
+        """
+        records = list(self.log.read(self.position, max_records=max_records))
+        if records:
+            self.position = records[-1][0] + 1
+        return records
+
+    def seek(self, offset: int) -> None:
+        self.position = offset
+
+    def commit(self, offset: Optional[int] = None) -> None:
+        """
+        Atomically store the offset the group resumes from.
+
+        :param offset: Offset to commit. Defaults to the current position.
+        :type offset: int or None
+        """
+        offset = self.position if offset is None else offset
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"offset": offset, "committed_at": time.time()}, f)
+        os.replace(tmp_path, self.path)
+
+    @property
+    def lag(self) -> int:
+        return self.log.end_offset - self.position
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Append matches to the local event log or consume from it.")
+    parser.add_argument("--log-dir", type=Path, default=Path(PICKLE_DIR) / "event_log", help="Log directory.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    append_parser = subparsers.add_parser("append", help="Append the events of matches (ids or paths).")
+    append_parser.add_argument("matches", nargs="+", help="Match ids or event file paths.")
+    consume_parser = subparsers.add_parser("consume", help="Print records from a consumer group's position.")
+    consume_parser.add_argument("--group", default="cli", help="Consumer group name.")
+    consume_parser.add_argument("--max-records", type=int, default=100, help="Maximum number of records.")
+    args = parser.parse_args()
+
+    with EventLog(args.log_dir) as log:
+        if args.command == "append":
+            for match in args.matches:
+                start = log.end_offset
+                log.append_many(iter_events(resolve_events_path(match)))
+                print(f"[INFO] Appended offsets {start}-{log.end_offset - 1} from {match}")
+        else:
+            consumer = ConsumerGroup(log, args.group)
+            for offset, event in consumer.poll(args.max_records):
+                print(f"{offset}: [{event.get('timestamp')}] {event.get('type', {}).get('name')}")
+            consumer.commit()
+            print(f"[INFO] Committed offset {consumer.position} for group {args.group} (lag {consumer.lag})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Event-time ordering, watermarks and late-event handling for stream consumers.
+
+Events are ordered by ``(period, seconds since period start, index)``, because StatsBomb
+timestamps restart in every period. :class:`ReorderBuffer` holds arriving events in a heap
+and releases them in event-time order once the watermark has passed them. The watermark
+trails the largest event time seen by `allowed_lateness` seconds; an event older than the
+watermark is late, counted and routed to the bounded `late_events` side output instead of
+being released. Released events are therefore in order, and a windowed aggregator may
+finalize every window that ends before :attr:`ReorderBuffer.watermark_time`. That time is on the
+monotonic :class:`MatchClock` axis of the rolling metrics, where a period starts after the
+stoppage time of the previous one, so it never goes backwards at half time.
+
+The buffer holds at most `max_buffer` events. When a disordered feed fills it, the oldest
+event is released early and the watermark is moved up to it, so memory stays bounded
+whatever the input order.
+
+Example::
+
+    buffer = ReorderBuffer(allowed_lateness=5.0)
+    windows = SlidingWindowAggregator(window=600, step=60)
+    for event in feed:
+        for ready in buffer.push(event):
+            rows.extend(windows.update(ready))
+        rows.extend(windows.advance(buffer.watermark_time))
+"""
+
+import heapq
+from collections import deque
+from typing import Optional
+from football_stream_processor.utils.time_utils import MatchClock, timestamp_to_seconds
+
+
+def event_time_key(event: dict) -> tuple[int, float, int]:
+    """
+    :return: The event-time ordering key (period, seconds since period start, index).
+    :rtype: tuple[int, float, int]
+    """
+    return event.get("period", 1), timestamp_to_seconds(event.get("timestamp", "00:00:00.000")), event.get("index", 0)
+
+
+class ReorderBuffer:
+    """
+    Bounded buffer that releases events in event-time order behind a watermark.
+
+    :param allowed_lateness: Seconds an event may arrive after a later event of the same period.
+    :type allowed_lateness: float
+    :param max_buffer: Maximum number of buffered events.
+    :type max_buffer: int
+    :param max_late_events: Maximum number of late events kept in the side output.
+    :type max_late_events: int
+    """
+
+    def __init__(self, allowed_lateness: float = 5.0, max_buffer: int = 10000, max_late_events: int = 1000):
+        if max_buffer <= 0:
+            raise ValueError("max_buffer must be positive")
+        self.allowed_lateness = allowed_lateness
+        self.max_buffer = max_buffer
+        self.late_events = deque(maxlen=max_late_events)
+        self.late = 0
+        self.forced = 0
+        self.released = 0
+        self._heap = []
+        self._seq = 0
+        self._max_key = None
+        self._forced_watermark = None
+        self.clock = MatchClock()
+
+    @property
+    def watermark(self) -> Optional[tuple[int, float]]:
+        """
+        :return: (period, seconds); events with an earlier key are late. None before the first event.
+        :rtype: tuple[int, float] or None
+        """
+        if self._max_key is None:
+            return None
+        natural = (self._max_key[0], self._max_key[1] - self.allowed_lateness)
+        if self._forced_watermark is not None and self._forced_watermark > natural:
+            return self._forced_watermark
+        return natural
+
+    @property
+    def watermark_time(self) -> float:
+        """
+        :return: The watermark on the :class:`MatchClock` axis (negative infinity before the first event).
+        :rtype: float
+        """
+        watermark = self.watermark
+        return float("-inf") if watermark is None else self.clock.to_match_seconds(*watermark)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, event: dict) -> list[dict]:
+        """
+        Add an event and return the events the watermark has passed, in event-time order.
+
+        :param event: StatsBomb event dictionary.
+        :type event: dict
+        :return: Released events; empty if the event was late or nothing is ready yet.
+        :rtype: list[dict]
+        """
+        key = event_time_key(event)
+        watermark = self.watermark
+        if watermark is not None and key[:2] < watermark:
+            self.late += 1
+            self.late_events.append(event)
+            return []
+
+        self.clock.observe(key[0], key[1])
+        heapq.heappush(self._heap, (key, self._seq, event))
+        self._seq += 1
+        if self._max_key is None or key[:2] > self._max_key:
+            self._max_key = key[:2]
+
+        released = []
+        if len(self._heap) > self.max_buffer:
+            key, _, oldest = heapq.heappop(self._heap)
+            self._forced_watermark = key[:2]
+            self.forced += 1
+            released.append(oldest)
+        watermark = self.watermark
+        while self._heap and self._heap[0][0][:2] < watermark:
+            released.append(heapq.heappop(self._heap)[2])
+        self.released += len(released)
+        return released
+
+    def flush(self) -> list[dict]:
+        """
+        Release every buffered event, e.g. at the end of a match.
+
+        :return: Remaining events in event-time order.
+        :rtype: list[dict]
+        """
+        released = [heapq.heappop(self._heap)[2] for _ in range(len(self._heap))]
+        if self._max_key is not None:
+            self._forced_watermark = self._max_key
+        self.released += len(released)
+        return released
+
+    def stats(self) -> dict:
+        return {"buffered": len(self._heap), "released": self.released, "late": self.late, "forced": self.forced,
+                "watermark": self.watermark}
@@ -1,22 +1,18 @@
-import json
-from datetime import datetime
 import matplotlib.pyplot as plt
 from matplotlib.patches import Circle
 import streamlit as st
 from streamlit_autorefresh import st_autorefresh
 import os
-
-def parse_time(timestamp):
-    return datetime.strptime(timestamp, "%H:%M:%S.%f")
+from football_stream_processor.utils.event_reader import iter_events
+from football_stream_processor.utils.time_utils import elapsed_seconds
 
 def load_events(filepath):
-    with open(filepath) as f:
-        events = json.load(f)
     actions = []
-    for e in events:
+    for e in iter_events(filepath, event_types={"Pass", "Carry", "Shot"}):
         if e.get("type", {}).get("name") == "Pass" and "location" in e and "end_location" in e.get("pass", {}):
             actions.append({
                 "type": "pass",
+                "period": e["period"],
                 "timestamp": e["timestamp"],
                 "start": e["location"],
                 "end": e["pass"]["end_location"]
@@ -24,6 +20,7 @@ def load_events(filepath):
         elif e.get("type", {}).get("name") == "Carry" and "location" in e and "carry" in e and "end_location" in e["carry"]:
             actions.append({
                 "type": "carry",
+                "period": e["period"],
                 "timestamp": e["timestamp"],
                 "start": e["location"],
                 "end": e["carry"]["end_location"]
@@ -31,6 +28,7 @@ def load_events(filepath):
         elif e.get("type", {}).get("name") == "Shot" and "location" in e and "shot" in e and "end_location" in e["shot"]:
             actions.append({
                 "type": "shot",
+                "period": e["period"],
                 "timestamp": e["timestamp"],
                 "start": e["location"],
                 "end": e["shot"]["end_location"][:2]
@@ -38,9 +36,9 @@ def load_events(filepath):
     if not actions:
         raise ValueError("No valid passes, carries, or shots found in the file.")
 
-    base_time = parse_time(actions[0]["timestamp"])
-    for action in actions:
-        action["time_sec"] = (parse_time(action["timestamp"]) - base_time).total_seconds()
+    times = elapsed_seconds([a["period"] for a in actions], [a["timestamp"] for a in actions])
+    for action, t in zip(actions, times - times[0]):
+        action["time_sec"] = float(t)
     return sorted(actions, key=lambda x: x["time_sec"])
 
 def draw_pitch(ax):
@@ -0,0 +1,136 @@
+"""
+Columnar on-disk storage for pandas DataFrames.
+
+A column store is a directory with one NumPy ``.npy`` file per column and a small
+``meta.json`` describing the column order and dtypes. Columns are opened with
+``mmap_mode`` so readers only page in the columns they ask for, and several processes
+reading the same store share one page-cached copy.
+
+Missing values of string columns are recorded in a boolean null mask stored next to the
+column (``<column>.mask.npy``) and come back as missing values. Such columns are loaded into memory
+as object arrays instead of being memory-mapped.
+"""
+
+import json
+import shutil
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Optional
+
+META_FILE = "meta.json"
+# pd.api.types.infer_dtype results of object columns that are stored as numeric columns
+NUMERIC_OBJECT_TYPES = ("integer", "floating", "mixed-integer-float", "decimal")
+
+
+def column_store_exists(path: Path) -> bool:
+    """
+    Check whether a column store has been written at `path`.
+
+    :param path: Directory of the column store.
+    :type path: Path
+    :return: True if the store's metadata file exists.
+    :rtype: bool
+    """
+    return (Path(path) / META_FILE).exists()
+
+
+def save_columns(df: pd.DataFrame, path: Path, dtypes: Optional[dict[str, str]] = None) -> None:
+    """
+    Save a DataFrame as a directory of ``.npy`` columns.
+
+    Numeric and boolean columns are stored as-is, categorical columns as integer codes plus
+    their categories, and string columns as fixed-width unicode arrays so that they can be
+    memory-mapped as well. Object columns holding only numbers (and missing values) are
+    stored as numeric columns; missing values of the other object columns are kept in a
+    null mask. The store is written to a temporary directory and swapped in, so
+    readers never see a half-written store.
+
+    :param df: DataFrame to save.
+    :type df: pd.DataFrame
+    :param path: Target directory of the column store.
+    :type path: Path
+    :param dtypes: Optional mapping of column name to the dtype it is stored as (e.g. 'float32').
+    :type dtypes: dict[str, str] or None
+    """
+    path = Path(path)
+    dtypes = dtypes or {}
+    tmp_path = path.with_name(path.name + ".tmp")
+    if tmp_path.exists():
+        shutil.rmtree(tmp_path)
+    tmp_path.mkdir(parents=True)
+
+    columns = []
+    for i, name in enumerate(df.columns):
+        series = df[name]
+        file_name = f"{i:03d}.npy"
+        entry = {"name": name, "file": file_name}
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            entry["kind"] = "categorical"
+            entry["categories"] = series.cat.categories.tolist()
+            entry["ordered"] = bool(series.cat.ordered)
+            values = series.cat.codes.to_numpy()
+        elif pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+            entry["kind"] = "numeric"
+            values = series.to_numpy(dtype=dtypes.get(name, series.dtype))
+        elif pd.api.types.infer_dtype(series, skipna=True) in NUMERIC_OBJECT_TYPES:
+            # e.g. a float column that became object when concatenated with an empty frame
+            entry["kind"] = "numeric"
+            values = pd.to_numeric(series).to_numpy(dtype=dtypes.get(name))
+        else:
+            entry["kind"] = "string"
+            mask = series.isna().to_numpy()
+            values = series.where(~mask, "").astype(str).to_numpy(dtype=str)
+            if mask.any():
+                entry["mask"] = f"{i:03d}.mask.npy"
+                np.save(tmp_path / entry["mask"], mask, allow_pickle=False)
+        np.save(tmp_path / file_name, values, allow_pickle=False)
+        entry["dtype"] = values.dtype.str
+        columns.append(entry)
+
+    with open(tmp_path / META_FILE, "w") as f:
+        json.dump({"rows": len(df), "columns": columns}, f, indent=2)
+
+    if path.exists():
+        shutil.rmtree(path)
+    tmp_path.rename(path)
+
+
+def load_columns(path: Path, columns: Optional[list[str]] = None, mmap: bool = True) -> pd.DataFrame:
+    """
+    Load a column store into a DataFrame.
+
+    :param path: Directory of the column store.
+    :type path: Path
+    :param columns: Columns to load. Defaults to all columns in their stored order.
+    :type columns: list[str] or None
+    :param mmap: Memory-map the column files (read-only) instead of reading them into RAM.
+    :type mmap: bool
+    :return: DataFrame backed by the stored columns.
+    :rtype: pd.DataFrame
+    :raises KeyError: If a requested column is not in the store.
+    """
+    path = Path(path)
+    with open(path / META_FILE, "r") as f:
+        meta = json.load(f)
+
+    entries = {entry["name"]: entry for entry in meta["columns"]}
+    names = columns if columns is not None else [entry["name"] for entry in meta["columns"]]
+    missing = [name for name in names if name not in entries]
+    if missing:
+        raise KeyError(f"Columns not found in {path}: {missing}")
+
+    data = {}
+    for name in names:
+        entry = entries[name]
+        values = np.load(path / entry["file"], mmap_mode="r" if mmap else None, allow_pickle=False)
+        if entry["kind"] == "categorical":
+            values = pd.Categorical.from_codes(np.asarray(values), categories=entry["categories"],
+                                               ordered=entry["ordered"])
+        elif "mask" in entry:
+            values = np.asarray(values).astype(object)
+            values[np.load(path / entry["mask"], allow_pickle=False)] = None
+        data[name] = values
+
+    # copy=False keeps the memory-mapped arrays as the DataFrame's backing buffers
+    return pd.DataFrame(data, columns=names, copy=False)
@@ -5,7 +5,8 @@ import pandas as pd
 import seaborn as sns
 from pathlib import Path
 import matplotlib.pyplot as plt
-from football_stream_processor.config import PICKLE_DIR
+from football_stream_processor.config import PASS_DATA_PATH
+from football_stream_processor.utils.column_store import load_columns
 from football_stream_processor.models.xg_model.feature_engineering import add_engineered_features
 
 class PassDataEDA:
@@ -152,13 +153,12 @@ def basic_checks(df: pd.DataFrame = None) -> pd.DataFrame:
     """
     Run basic EDA checks and return a cleaned DataFrame.
 
-    :param df: DataFrame to check. If None, loads from default pickle.
+    :param df: DataFrame to check. If None, loads the cached pass dataset.
     :type df: pd.DataFrame or None
     :return: Cleaned DataFrame.
     :rtype: pd.DataFrame
     """
-    cache_path = Path(PICKLE_DIR) / "pass_data.pkl"
-    df = pd.read_pickle(cache_path) if df is None else df
+    df = load_columns(Path(PASS_DATA_PATH)) if df is None else df
     df = add_engineered_features(df)
     eda = PassDataEDA(df)
     eda.missing_values(handle="drop")
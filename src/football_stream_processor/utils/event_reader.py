@@ -0,0 +1,137 @@
+"""
+Incremental reader for StatsBomb event files.
+
+StatsBomb event files are one JSON array of event objects. Instead of building the whole
+array with ``json.load``, the functions in this module read the file in fixed-size chunks
+and decode one event object at a time, so memory stays bounded by the chunk size plus a
+single event and consumers can start working before the file is fully read.
+"""
+
+import codecs
+import json
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# Whitespace and the commas separating array elements
+_SEPARATOR = re.compile(r"[\s,]*")
+
+
+def _iter_raw_events(json_path: Path, chunk_size: int, with_offsets: bool) -> Iterator[tuple[int, int, dict]]:
+    """
+    Yield ``(byte_start, byte_end, event)`` for every element of the top-level JSON array.
+
+    Byte offsets are only tracked when `with_offsets` is set; otherwise they are -1.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    pos = 0
+    byte_pos = 0
+    eof = False
+    started = False
+
+    with open(json_path, "rb") as f:
+        while True:
+            end = _SEPARATOR.match(buf, pos).end()
+            if with_offsets:
+                byte_pos += len(buf[pos:end].encode("utf-8"))
+            pos = end
+
+            if pos < len(buf) and not started:
+                if buf[pos] != "[":
+                    raise ValueError(f"{json_path} does not contain a JSON array of events")
+                pos += 1
+                byte_pos += 1
+                started = True
+                continue
+            if pos < len(buf) and buf[pos] == "]":
+                return
+
+            event = None
+            if pos < len(buf):
+                try:
+                    event, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    # Most likely the object is cut off at the end of the buffer
+                    if eof:
+                        raise
+            elif eof:
+                raise ValueError(f"Unexpected end of file in {json_path}")
+
+            if event is None:
+                # Drop the consumed prefix before reading the next chunk
+                buf = buf[pos:]
+                pos = 0
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf += utf8.decode(chunk, final=eof)
+                continue
+
+            if with_offsets:
+                start_byte = byte_pos
+                byte_pos += len(buf[pos:end].encode("utf-8"))
+                yield start_byte, byte_pos, event
+            else:
+                yield -1, -1, event
+            pos = end
+
+
+def iter_events(json_path: Path, event_types: Optional[Iterable[str]] = None,
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[dict]:
+    """
+    Lazily yield the events of a StatsBomb events JSON file one at a time.
+
+    :param json_path: Path to the StatsBomb events JSON file.
+    :type json_path: Path or str
+    :param event_types: Event type names to keep (e.g. ``{"Pass", "Shot"}``). Other events are
+        discarded as soon as they are decoded. Defaults to all events.
+    :type event_types: Iterable[str] or None
+    :param chunk_size: Number of bytes read from the file at a time.
+    :type chunk_size: int
+    :return: Iterator over event dictionaries in file order.
+    :rtype: Iterator[dict]
+    :raises ValueError: If the file is not a JSON array or is truncated.
+    """
+    wanted = frozenset(event_types) if event_types is not None else None
+    for _, _, event in _iter_raw_events(Path(json_path), chunk_size, with_offsets=False):
+        if wanted is None or event.get("type", {}).get("name") in wanted:
+            yield event
+
+
+def iter_events_with_offsets(json_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[tuple[int, int, dict]]:
+    """
+    Lazily yield events together with their byte range in the file.
+
+    The ranges can be stored and later passed to :func:`read_event_range` to decode a slice of
+    the file without reading the events before it.
+
+    :param json_path: Path to the StatsBomb events JSON file.
+    :type json_path: Path or str
+    :param chunk_size: Number of bytes read from the file at a time.
+    :type chunk_size: int
+    :return: Iterator over ``(byte_start, byte_end, event)`` tuples in file order.
+    :rtype: Iterator[tuple[int, int, dict]]
+    """
+    return _iter_raw_events(Path(json_path), chunk_size, with_offsets=True)
+
+
+def read_event_range(json_path: Path, byte_start: int, byte_end: int) -> list[dict]:
+    """
+    Decode the events stored between two byte offsets of an events file.
+
+    :param json_path: Path to the StatsBomb events JSON file.
+    :type json_path: Path or str
+    :param byte_start: Byte offset where the first event starts.
+    :type byte_start: int
+    :param byte_end: Byte offset just past the last event.
+    :type byte_end: int
+    :return: list of the events in the range.
+    :rtype: list[dict]
+    """
+    with open(json_path, "rb") as f:
+        f.seek(byte_start)
+        raw = f.read(byte_end - byte_start)
+    return json.loads(b"[" + raw + b"]")
@@ -0,0 +1,324 @@
+"""
+Single-pass extraction of typed event tables from StatsBomb event files.
+
+Each match file is read once. Every event is routed by its type name to the registered
+tables (passes, carries, shots, pressures, duels, ...), and each table accumulates its own
+columns. Rebuilding all derived datasets therefore costs one read and parse of the corpus
+instead of one per dataset.
+
+Usage:
+    poetry run python src/football_stream_processor/utils/event_tables.py --limit 100 --workers 8
+"""
+
+import argparse
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from tqdm import tqdm
+from typing import Iterable, Optional
+from football_stream_processor.config import DATA_DIR, PICKLE_DIR
+from football_stream_processor.utils.column_store import save_columns
+from football_stream_processor.utils.event_reader import iter_events
+from football_stream_processor.utils.spatial_grid import assign_cells
+
+BASE_COLUMNS = ["match_id", "id", "index", "period", "timestamp", "minute", "second", "team", "player", "x", "y"]
+BASE_DTYPES = {
+    "match_id": np.int64, "id": str, "index": np.int64, "period": np.int64, "timestamp": str, "minute": np.int64,
+    "second": np.int64, "team": str, "player": str, "x": np.float64, "y": np.float64,
+}
+
+
+def _name(value: Optional[dict]) -> str:
+    return value.get("name", "") if value else ""
+
+
+def _column(values: tuple, dtype: type) -> np.ndarray:
+    # Missing numbers become NaN, like the minute column of data_pipeline.extract_pass_columns
+    if dtype is not str and None in values:
+        return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+    return np.array(values, dtype=dtype)
+
+
+class EventTable:
+    """
+    Column builder for one typed table.
+
+    Subclasses set `name`, `event_types`, `columns` (the columns after the shared
+    BASE_COLUMNS) and their `dtypes` (inferred by NumPy when missing), implement :meth:`row` and may override :meth:`finalize`
+    to derive columns with vectorized NumPy operations once all rows are collected.
+    """
+
+    name = None
+    event_types = ()
+    columns = []
+    dtypes = {}
+    derived_columns = []
+
+    def __init__(self):
+        self._rows = []
+
+    def row(self, event: dict) -> Optional[tuple]:
+        """
+        Return the table-specific values for an event, or None to skip it.
+
+        :param event: Event dictionary whose type is in `event_types`.
+        :type event: dict
+        :return: Tuple of values aligned with `columns`, or None.
+        :rtype: tuple or None
+        """
+        raise NotImplementedError
+
+    def add(self, event: dict, match_id: int) -> None:
+        values = self.row(event)
+        if values is None:
+            return
+        location = event.get("location") or (np.nan, np.nan)
+        self._rows.append((
+            match_id, event.get("id", ""), event.get("index", -1), event.get("period", 0),
+            event.get("timestamp", ""), event.get("minute"), event.get("second", 0),
+            _name(event.get("team")), _name(event.get("player")), location[0], location[1],
+        ) + values)
+
+    def finalize(self, data: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        """
+        Add derived columns to the collected columns. The default adds nothing.
+
+        :param data: Collected columns by name.
+        :type data: dict[str, np.ndarray]
+        :return: Columns including the derived ones.
+        :rtype: dict[str, np.ndarray]
+        """
+        return data
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Build the table from the collected rows.
+
+        :return: DataFrame with BASE_COLUMNS, `columns`, `derived_columns` and the 30x20 pitch `cell`.
+        :rtype: pd.DataFrame
+        """
+        names = BASE_COLUMNS + self.columns
+        dtypes = {**BASE_DTYPES, **self.dtypes}
+        columns = zip(*self._rows) if self._rows else [()] * len(names)
+        # Empty tables get the same column dtypes as filled ones
+        data = {name: _column(values, dtypes.get(name)) for name, values in zip(names, columns)}
+        data = self.finalize(data)
+        data["cell"] = assign_cells(data["x"], data["y"])
+        return pd.DataFrame(data, columns=names + self.derived_columns + ["cell"])
+
+
+def _segment_geometry(data: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    delta_x = data["end_x"] - data["x"]
+    delta_y = data["end_y"] - data["y"]
+    data["distance"] = np.hypot(delta_x, delta_y)
+    data["angle"] = np.arctan2(delta_y, delta_x)
+    return data
+
+
+class PassTable(EventTable):
+    name = "passes"
+    event_types = ("Pass",)
+    columns = ["end_x", "end_y", "pass_outcome", "outcome", "height", "recipient"]
+    dtypes = {"end_x": np.float64, "end_y": np.float64, "pass_outcome": np.int64, "outcome": str, "height": str,
+              "recipient": str}
+    derived_columns = ["distance", "angle"]
+
+    def row(self, event):
+        pass_info = event.get("pass", {})
+        end = pass_info.get("end_location")
+        if not event.get("location") or not end or None in end:
+            return None
+        outcome = pass_info.get("outcome")
+        # outcome == None means success, same as data_pipeline.extract_pass_features
+        return (end[0], end[1], int(outcome is None), _name(outcome),
+                _name(pass_info.get("height")), _name(pass_info.get("recipient")))
+
+    def finalize(self, data):
+        return _segment_geometry(data)
+
+
+class CarryTable(EventTable):
+    name = "carries"
+    event_types = ("Carry",)
+    columns = ["end_x", "end_y", "duration"]
+    dtypes = {"end_x": np.float64, "end_y": np.float64, "duration": np.float64}
+    derived_columns = ["distance", "angle"]
+
+    def row(self, event):
+        end = event.get("carry", {}).get("end_location")
+        if not event.get("location") or not end:
+            return None
+        return end[0], end[1], event.get("duration", 0.0)
+
+    def finalize(self, data):
+        return _segment_geometry(data)
+
+
+class ShotTable(EventTable):
+    name = "shots"
+    event_types = ("Shot",)
+    columns = ["statsbomb_xg", "outcome", "body_part", "technique", "end_x", "end_y"]
+    dtypes = {"statsbomb_xg": np.float64, "outcome": str, "body_part": str, "technique": str, "end_x": np.float64,
+              "end_y": np.float64}
+
+    def row(self, event):
+        shot = event.get("shot", {})
+        end = shot.get("end_location") or (np.nan, np.nan)
+        return (float(shot.get("statsbomb_xg", 0.0)), _name(shot.get("outcome")), _name(shot.get("body_part")),
+                _name(shot.get("technique")), float(end[0]), float(end[1]))
+
+
+class PressureTable(EventTable):
+    name = "pressures"
+    event_types = ("Pressure",)
+    columns = ["duration", "counterpress", "n_related"]
+    dtypes = {"duration": np.float64, "counterpress": bool, "n_related": np.int64}
+
+    def row(self, event):
+        return event.get("duration", 0.0), bool(event.get("counterpress", False)), len(event.get("related_events", []))
+
+
+class DuelTable(EventTable):
+    name = "duels"
+    event_types = ("Duel",)
+    columns = ["duel_type", "outcome"]
+    dtypes = {"duel_type": str, "outcome": str}
+
+    def row(self, event):
+        duel = event.get("duel", {})
+        return _name(duel.get("type")), _name(duel.get("outcome"))
+
+
+DEFAULT_TABLES = (PassTable, CarryTable, ShotTable, PressureTable, DuelTable)
+
+
+class EventTableExtractor:
+    """
+    Route events to registered tables in a single pass over each match.
+
+    :param tables: Table classes to register. Defaults to DEFAULT_TABLES.
+    :type tables: Iterable[type[EventTable]] or None
+    """
+
+    def __init__(self, tables: Optional[Iterable[type]] = None):
+        self.tables = {}
+        self.routes = {}
+        for table_cls in (tables if tables is not None else DEFAULT_TABLES):
+            self.register(table_cls())
+
+    def register(self, table: EventTable) -> None:
+        """
+        Register a table and route its event types to it.
+
+        :param table: Table instance.
+        :type table: EventTable
+        :raises ValueError: If a table with the same name is already registered.
+        """
+        if table.name in self.tables:
+            raise ValueError(f"Table already registered: {table.name}")
+        self.tables[table.name] = table
+        for event_type in table.event_types:
+            self.routes.setdefault(event_type, []).append(table)
+
+    def process(self, events: Iterable[dict], match_id: int = -1) -> None:
+        """
+        Route every event of a match to the tables registered for its type.
+
+        :param events: Iterable of event dictionaries.
+        :type events: Iterable[dict]
+        :param match_id: Match identifier stored in every row.
+        :type match_id: int
+        """
+        routes = self.routes
+        for event in events:
+            for table in routes.get(event.get("type", {}).get("name"), ()):
+                table.add(event, match_id)
+
+    def process_file(self, json_path: Path) -> None:
+        """
+        Read one events file and route its events. Only the routed event types are kept.
+
+        :param json_path: Path to a StatsBomb events JSON file named ``<match_id>.json``.
+        :type json_path: Path
+        """
+        json_path = Path(json_path)
+        match_id = int(json_path.stem) if json_path.stem.isdigit() else -1
+        self.process(iter_events(json_path, event_types=self.routes.keys()), match_id=match_id)
+
+    def to_frames(self) -> dict[str, pd.DataFrame]:
+        """
+        :return: One DataFrame per registered table, keyed by table name.
+        :rtype: dict[str, pd.DataFrame]
+        """
+        return {name: table.to_frame() for name, table in self.tables.items()}
+
+
+def extract_tables_from_file(json_path: Path) -> dict[str, pd.DataFrame]:
+    """
+    Extract the default tables from one events file. Worker function for the parallel build.
+
+    :param json_path: Path to a StatsBomb events JSON file.
+    :type json_path: Path
+    :return: One DataFrame per default table.
+    :rtype: dict[str, pd.DataFrame]
+    """
+    extractor = EventTableExtractor()
+    extractor.process_file(json_path)
+    return extractor.to_frames()
+
+
+def build_event_tables(events_dir: Path, output_dir: Path, limit: int = 1000, workers: int = 1) -> dict[str, pd.DataFrame]:
+    """
+    Extract all default tables from up to `limit` event files and save them as column stores.
+
+    Each file is read once. Per-file tables are merged in sorted file order, so the output
+    does not depend on the number of workers.
+
+    :param events_dir: Directory containing StatsBomb event JSON files.
+    :type events_dir: Path
+    :param output_dir: Directory that receives one column store per table.
+    :type output_dir: Path
+    :param limit: Maximum number of event files to process.
+    :type limit: int
+    :param workers: Number of worker processes.
+    :type workers: int
+    :return: The merged tables keyed by table name.
+    :rtype: dict[str, pd.DataFrame]
+    """
+    json_files = sorted(Path(events_dir).glob("*.json"))[:limit]
+    print(f"[INFO] Extracting {len(DEFAULT_TABLES)} tables from {len(json_files)} event files with {workers} worker(s)")
+
+    parts = {table_cls.name: [] for table_cls in DEFAULT_TABLES}
+    if workers > 1 and len(json_files) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(extract_tables_from_file, json_files, chunksize=4)
+            for frames in tqdm(results, total=len(json_files), desc="Extracting tables"):
+                for name, frame in frames.items():
+                    parts[name].append(frame)
+    else:
+        for json_file in tqdm(json_files, desc="Extracting tables"):
+            for name, frame in extract_tables_from_file(json_file).items():
+                parts[name].append(frame)
+
+    tables = {}
+    empty = EventTableExtractor().to_frames()
+    for name, frames in parts.items():
+        tables[name] = pd.concat(frames, ignore_index=True) if frames else empty[name]
+        save_columns(tables[name], Path(output_dir) / name)
+        print(f"[INFO] Saved {len(tables[name])} rows to {Path(output_dir) / name}")
+    return tables
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract passes, carries, shots, pressures and duels in one pass.")
+    parser.add_argument("--limit", type=int, default=10, help="Maximum number of JSON files to process.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes.")
+    parser.add_argument("--output-dir", type=Path, default=Path(PICKLE_DIR) / "event_tables", help="Output directory.")
+    args = parser.parse_args()
+
+    build_event_tables(Path(DATA_DIR) / "events", args.output_dir, limit=args.limit, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""
+Spatial binning of event locations and precomputed zone counts.
+
+Events are assigned to cells of a regular grid over the 120x80 StatsBomb pitch. Cell ids
+are flat (``iy * nx + ix``) and the binning matches ``mplsoccer.Pitch.bin_statistic``.
+Along x, bins are closed on the left and x = 120 falls in the last bin. StatsBomb's y axis
+points down and mplsoccer bins the flipped coordinate ``80 - y``, so along y bins are closed
+on the top instead (y = 4.0 is in row 0 of a 20-row grid) and y = 0 falls in row 0.
+Locations off the pitch get cell -1. Count grids use mplsoccer's ``(ny, nx)`` orientation,
+so they can be drawn with ``Pitch.heatmap`` directly.
+
+Zone counts are built once over the corpus (per match, team and player, for one or more
+resolutions) and stored as sparse ``(key_id, match_id, cell, count)`` column stores, so a
+season heatmap or a region query is answered by summing a few aggregated rows.
+
+Usage:
+    poetry run python src/football_stream_processor/utils/spatial_grid.py --limit 100 --workers 8
+"""
+
+import argparse
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from tqdm import tqdm
+from typing import Iterable, Optional
+from football_stream_processor.config import DATA_DIR, PICKLE_DIR
+from football_stream_processor.utils.column_store import load_columns, save_columns
+from football_stream_processor.utils.event_reader import iter_events
+
+PITCH_LENGTH = 120.0
+PITCH_WIDTH = 80.0
+DEFAULT_RESOLUTIONS = ((30, 20),)
+ZONE_COLUMNS = ["key_id", "match_id", "cell", "count"]
+
+
+def resolution_name(bins: tuple[int, int]) -> str:
+    return f"{bins[0]}x{bins[1]}"
+
+
+def assign_cells(x: Iterable[float], y: Iterable[float], bins: tuple[int, int] = (30, 20)) -> np.ndarray:
+    """
+    Assign pitch locations to flat grid cell ids.
+
+    :param x: X-coordinates (0-120).
+    :type x: Iterable[float]
+    :param y: Y-coordinates (0-80).
+    :type y: Iterable[float]
+    :param bins: Number of bins along x and y.
+    :type bins: tuple[int, int]
+    :return: Cell id per location, -1 for locations off the pitch or missing.
+    :rtype: np.ndarray
+    """
+    nx, ny = bins
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    ix = np.searchsorted(np.linspace(0, PITCH_LENGTH, nx + 1), x, side="right") - 1
+    # The far edge of the pitch belongs to the last bin
+    ix[x == PITCH_LENGTH] = nx - 1
+    # Bin the flipped y like mplsoccer does for the inverted StatsBomb axis, then flip the rows back
+    flipped = PITCH_WIDTH - y
+    jy = np.searchsorted(np.linspace(0, PITCH_WIDTH, ny + 1), flipped, side="right") - 1
+    jy[flipped == PITCH_WIDTH] = ny - 1
+    inside = (ix >= 0) & (ix < nx) & (jy >= 0) & (jy < ny)
+    return np.where(inside, (ny - 1 - jy) * nx + ix, -1)
+
+
+def cells_to_grid(cells: np.ndarray, bins: tuple[int, int] = (30, 20), weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Turn cell ids (with optional weights) into a ``(ny, nx)`` count grid.
+
+    :param cells: Flat cell ids; negative ids are ignored.
+    :type cells: np.ndarray
+    :param bins: Number of bins along x and y.
+    :type bins: tuple[int, int]
+    :param weights: Optional weight per cell id (e.g. stored counts).
+    :type weights: np.ndarray or None
+    :return: Grid of counts with rows along y and columns along x.
+    :rtype: np.ndarray
+    """
+    nx, ny = bins
+    cells = np.asarray(cells)
+    keep = cells >= 0
+    if weights is not None:
+        weights = np.asarray(weights)[keep]
+    return np.bincount(cells[keep], weights=weights, minlength=nx * ny).reshape(ny, nx)
+
+
+def count_grid(x: Iterable[float], y: Iterable[float], bins: tuple[int, int] = (30, 20)) -> np.ndarray:
+    """
+    Count locations per grid cell.
+
+    :return: Grid of counts in mplsoccer's ``(ny, nx)`` orientation.
+    :rtype: np.ndarray
+    """
+    return cells_to_grid(assign_cells(x, y, bins), bins)
+
+
+def _aggregate(key_ids: np.ndarray, cells: np.ndarray, match_id: int) -> np.ndarray:
+    keep = cells >= 0
+    pairs = np.stack([key_ids[keep], cells[keep]], axis=1)
+    if len(pairs) == 0:
+        return np.zeros((0, 4), dtype=np.int64)
+    unique, counts = np.unique(pairs, axis=0, return_counts=True)
+    return np.column_stack([unique[:, 0], np.full(len(unique), match_id), unique[:, 1], counts]).astype(np.int64)
+
+
+def zone_counts_for_file(json_file: Path, resolutions: tuple = DEFAULT_RESOLUTIONS,
+                         event_types: Optional[Iterable[str]] = None) -> dict[str, dict[str, np.ndarray]]:
+    """
+    Aggregate the located events of one match into per-match, per-team and per-player counts.
+
+    :param json_file: Path to a StatsBomb events JSON file named ``<match_id>.json``.
+    :type json_file: Path
+    :param resolutions: Grid resolutions as (nx, ny) tuples.
+    :type resolutions: tuple
+    :param event_types: Event types to count. Defaults to all located events.
+    :type event_types: Iterable[str] or None
+    :return: Rows of ZONE_COLUMNS keyed by resolution name and then by 'matches', 'teams', 'players'.
+    :rtype: dict
+    """
+    match_id = int(Path(json_file).stem)
+    xs, ys, team_ids, player_ids = [], [], [], []
+    for event in iter_events(json_file, event_types=event_types):
+        location = event.get("location")
+        if not location:
+            continue
+        xs.append(location[0])
+        ys.append(location[1])
+        team_ids.append(event.get("team", {}).get("id", -1))
+        player_ids.append(event.get("player", {}).get("id", -1))
+
+    team_ids = np.array(team_ids, dtype=np.int64)
+    player_ids = np.array(player_ids, dtype=np.int64)
+    result = {}
+    for bins in resolutions:
+        cells = assign_cells(xs, ys, bins)
+        result[resolution_name(bins)] = {
+            "matches": _aggregate(np.full(len(cells), match_id, dtype=np.int64), cells, match_id),
+            "teams": _aggregate(team_ids, cells, match_id),
+            "players": _aggregate(player_ids[player_ids >= 0], cells[player_ids >= 0], match_id),
+        }
+    return result
+
+
+def build_zone_counts(events_dir: Path, output_dir: Path, resolutions: tuple = DEFAULT_RESOLUTIONS, limit: int = 1000,
+                      workers: int = 1, event_types: Optional[Iterable[str]] = None) -> None:
+    """
+    Build the zone count stores for up to `limit` event files.
+
+    One column store is written per resolution and level, e.g. ``<output_dir>/30x20/players``.
+
+    :param events_dir: Directory containing StatsBomb event JSON files.
+    :type events_dir: Path
+    :param output_dir: Output directory.
+    :type output_dir: Path
+    :param resolutions: Grid resolutions as (nx, ny) tuples.
+    :type resolutions: tuple
+    :param limit: Maximum number of event files to process.
+    :type limit: int
+    :param workers: Number of worker processes.
+    :type workers: int
+    :param event_types: Event types to count. Defaults to all located events.
+    :type event_types: Iterable[str] or None
+    """
+    json_files = sorted(Path(events_dir).glob("*.json"))[:limit]
+    event_types = tuple(event_types) if event_types is not None else None
+    parts = {resolution_name(bins): {"matches": [], "teams": [], "players": []} for bins in resolutions}
+
+    def collect(result):
+        for name, levels in result.items():
+            for level, rows in levels.items():
+                parts[name][level].append(rows)
+
+    if workers > 1 and len(json_files) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(zone_counts_for_file, json_files, [resolutions] * len(json_files),
+                                   [event_types] * len(json_files), chunksize=4)
+            for result in tqdm(results, total=len(json_files), desc="Binning events"):
+                collect(result)
+    else:
+        for json_file in tqdm(json_files, desc="Binning events"):
+            collect(zone_counts_for_file(json_file, resolutions, event_types))
+
+    for name, levels in parts.items():
+        for level, chunks in levels.items():
+            rows = np.concatenate(chunks) if chunks else np.zeros((0, 4), dtype=np.int64)
+            df = pd.DataFrame(rows, columns=ZONE_COLUMNS)
+            df = df.sort_values(["key_id", "match_id", "cell"], kind="stable").reset_index(drop=True)
+            save_columns(df, Path(output_dir) / name / level)
+    print(f"[INFO] Saved zone counts for {len(json_files)} event files to {output_dir}")
+
+
+class ZoneCounts:
+    """
+    Query precomputed zone counts at one grid resolution.
+
+    :param zones_dir: Directory written by :func:`build_zone_counts`.
+    :type zones_dir: Path
+    :param bins: Grid resolution as (nx, ny).
+    :type bins: tuple[int, int]
+    """
+
+    def __init__(self, zones_dir: Path, bins: tuple[int, int] = (30, 20)):
+        self.bins = bins
+        self.path = Path(zones_dir) / resolution_name(bins)
+        self._levels = {}
+
+    def _level(self, level: str) -> pd.DataFrame:
+        if level not in self._levels:
+            self._levels[level] = load_columns(self.path / level)
+        return self._levels[level]
+
+    def grid(self, level: str, key_id: int, match_ids: Optional[Iterable[int]] = None) -> np.ndarray:
+        """
+        Return the summed count grid of one match, team or player.
+
+        :param level: 'matches', 'teams' or 'players'.
+        :type level: str
+        :param key_id: Match, team or player id.
+        :type key_id: int
+        :param match_ids: Only count these matches (e.g. one season from the match catalog).
+        :type match_ids: Iterable[int] or None
+        :return: Grid of counts in ``(ny, nx)`` orientation.
+        :rtype: np.ndarray
+        """
+        df = self._level(level)
+        key_ids = df["key_id"].to_numpy()
+        start, stop = np.searchsorted(key_ids, key_id, side="left"), np.searchsorted(key_ids, key_id, side="right")
+        rows = df.iloc[start:stop]
+        if match_ids is not None:
+            rows = rows[rows["match_id"].isin(list(match_ids))]
+        return cells_to_grid(rows["cell"].to_numpy(), self.bins, weights=rows["count"].to_numpy())
+
+    def region_count(self, level: str, key_id: int, x_range: tuple[float, float], y_range: tuple[float, float],
+                     match_ids: Optional[Iterable[int]] = None) -> float:
+        """
+        Count events of a match, team or player whose cell centre lies in a rectangle.
+
+        :param x_range: (min, max) x-coordinates of the region.
+        :type x_range: tuple[float, float]
+        :param y_range: (min, max) y-coordinates of the region.
+        :type y_range: tuple[float, float]
+        :return: Number of events in the region.
+        :rtype: float
+        """
+        nx, ny = self.bins
+        centres_x = (np.arange(nx) + 0.5) * PITCH_LENGTH / nx
+        centres_y = (np.arange(ny) + 0.5) * PITCH_WIDTH / ny
+        in_x = (centres_x >= x_range[0]) & (centres_x <= x_range[1])
+        in_y = (centres_y >= y_range[0]) & (centres_y <= y_range[1])
+        return float(self.grid(level, key_id, match_ids)[np.ix_(in_y, in_x)].sum())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute per-match, per-team and per-player zone counts.")
+    parser.add_argument("--limit", type=int, default=10, help="Maximum number of JSON files to process.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes.")
+    parser.add_argument("--bins", nargs="+", default=["30x20"], help="Grid resolutions as NXxNY, e.g. 30x20 12x8.")
+    parser.add_argument("--output-dir", type=Path, default=Path(PICKLE_DIR) / "zones", help="Output directory.")
+    args = parser.parse_args()
+
+    resolutions = tuple(tuple(int(n) for n in spec.split("x")) for spec in args.bins)
+    build_zone_counts(Path(DATA_DIR) / "events", args.output_dir, resolutions=resolutions, limit=args.limit,
+                      workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Fast conversion of StatsBomb event timestamps to seconds.
+
+StatsBomb timestamps are fixed-width ``HH:MM:SS.fff`` strings measured from the start of
+the event's period, so the clock resets at half time (and at the start of extra time and
+penalties). The helpers here parse them by slicing instead of ``datetime.strptime`` and
+map ``(period, timestamp)`` pairs onto one continuous elapsed-time axis.
+"""
+
+import numpy as np
+from typing import Iterable
+
+TIMESTAMP_LENGTH = 12  # "HH:MM:SS.fff"
+
+# Minute at which each period starts on StatsBomb's continuous minute/second clock
+PERIOD_START_MINUTE = {1: 0, 2: 45, 3: 90, 4: 105, 5: 120}
+
+
+def timestamp_to_seconds(timestamp: str) -> float:
+    """
+    Convert a StatsBomb timestamp string to seconds since the start of its period.
+
+    :param timestamp: Timestamp string in the format "HH:MM:SS.fff".
+    :type timestamp: str
+    :return: Seconds since the start of the period.
+    :rtype: float
+    """
+    return int(timestamp[0:2]) * 3600 + int(timestamp[3:5]) * 60 + float(timestamp[6:])
+
+
+def timestamps_to_seconds(timestamps: Iterable[str]) -> np.ndarray:
+    """
+    Vectorized :func:`timestamp_to_seconds` for a whole sequence of timestamps.
+
+    The strings are viewed as a matrix of ASCII digits and combined with integer arithmetic.
+    Sequences that are not all in the fixed ``HH:MM:SS.fff`` format fall back to the scalar parser.
+
+    :param timestamps: Sequence of timestamp strings.
+    :type timestamps: Iterable[str]
+    :return: Array of seconds since the start of each timestamp's period.
+    :rtype: np.ndarray
+    """
+    raw = np.asarray(list(timestamps) if not isinstance(timestamps, np.ndarray) else timestamps, dtype="S")
+    if raw.size == 0:
+        return np.zeros(0, dtype=np.float64)
+    if raw.dtype.itemsize != TIMESTAMP_LENGTH or np.char.str_len(raw).min() != TIMESTAMP_LENGTH:
+        return np.array([timestamp_to_seconds(t.decode()) for t in raw], dtype=np.float64)
+
+    digits = raw.view(np.uint8).reshape(-1, TIMESTAMP_LENGTH).astype(np.int64) - ord("0")
+    hours = digits[:, 0] * 10 + digits[:, 1]
+    minutes = digits[:, 3] * 10 + digits[:, 4]
+    seconds = digits[:, 6] * 10 + digits[:, 7]
+    millis = digits[:, 9] * 100 + digits[:, 10] * 10 + digits[:, 11]
+    return (hours * 3600 + minutes * 60 + seconds) + millis / 1000.0
+
+
+def elapsed_seconds(periods: Iterable[int], timestamps: Iterable[str]) -> np.ndarray:
+    """
+    Map ``(period, timestamp)`` pairs onto a continuous elapsed-time axis.
+
+    Each period starts where the previous period's last event ended, so times keep increasing
+    across the half-time reset and there are no gaps for the break between periods.
+
+    :param periods: Period number of each event.
+    :type periods: Iterable[int]
+    :param timestamps: Timestamp string of each event.
+    :type timestamps: Iterable[str]
+    :return: Array of elapsed seconds, aligned with the input.
+    :rtype: np.ndarray
+    """
+    periods = np.asarray(list(periods), dtype=np.int64)
+    seconds = timestamps_to_seconds(timestamps)
+    if seconds.size == 0:
+        return seconds
+
+    unique_periods = np.unique(periods)
+    period_lengths = np.array([seconds[periods == p].max() for p in unique_periods])
+    offsets = np.concatenate(([0.0], np.cumsum(period_lengths)[:-1]))
+    return seconds + offsets[np.searchsorted(unique_periods, periods)]
+
+
+class PeriodClock:
+    """
+    Streaming counterpart of :func:`elapsed_seconds` for events that arrive one at a time.
+
+    Events are expected in period order. When a later period starts, its offset is the
+    latest time seen in the previous periods.
+    """
+
+    def __init__(self):
+        self.period = None
+        self.offset = 0.0
+        self.latest = 0.0
+
+    def elapsed(self, period: int, timestamp: str) -> float:
+        """
+        Return the elapsed seconds for an event.
+
+        :param period: Period number of the event.
+        :type period: int
+        :param timestamp: Timestamp string of the event.
+        :type timestamp: str
+        :return: Seconds on the continuous elapsed-time axis.
+        :rtype: float
+        """
+        seconds = timestamp_to_seconds(timestamp)
+        if self.period is None:
+            self.period = period
+        elif period > self.period:
+            self.offset = self.latest
+            self.period = period
+        elapsed = self.offset + seconds
+        self.latest = max(self.latest, elapsed)
+        return elapsed
+
+
+class MatchClock:
+    """
+    Monotonic match time on the ``minute * 60 + second`` axis of StatsBomb events.
+
+    The nominal start of a period (45:00 for the second half) overlaps the stoppage time of the
+    previous one, so ``minute * 60 + second`` goes backwards at half time. Here a period starts at
+    its nominal minute or at the whole second the previous period ended, whichever is later.
+    Without stoppage time the axis is the plain match clock. Periods are expected in order: the
+    offset of a period is fixed when its first time is observed.
+    """
+
+    def __init__(self):
+        self.offsets = {}
+        self.period = None
+        self.period_end = 0
+
+    def observe(self, period: int, seconds: float) -> float:
+        """
+        Record a time and return it on the monotonic axis.
+
+        :param period: Period number.
+        :type period: int
+        :param seconds: Seconds since the start of the period.
+        :type seconds: float
+        :return: Match seconds.
+        :rtype: float
+        """
+        if period not in self.offsets:
+            nominal = PERIOD_START_MINUTE.get(period, 0) * 60
+            if self.period is None or period < self.period:
+                self.offsets[period] = nominal
+            else:
+                self.offsets[period] = max(nominal, self.offsets[self.period] + self.period_end)
+            if self.period is None or period > self.period:
+                self.period, self.period_end = period, 0
+        if period == self.period:
+            self.period_end = max(self.period_end, int(seconds))
+        return self.offsets[period] + seconds
+
+    def to_match_seconds(self, period: int, seconds: float) -> float:
+        """
+        Map a time of an observed period onto the axis without recording it, e.g. a watermark.
+
+        :rtype: float
+        """
+        return self.offsets.get(period, PERIOD_START_MINUTE.get(period, 0) * 60) + seconds
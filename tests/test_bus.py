@@ -0,0 +1,116 @@
+import asyncio
+import json
+import pytest
+from football_stream_processor.match.match_summary import MatchSummaryAccumulator, summarize_events
+from football_stream_processor.match.replay import AsyncMatchReplay, VirtualClock
+from football_stream_processor.stream.bus import BLOCK, DROP_OLDEST, SAMPLE, EventBus
+
+
+async def _drain(subscription, delay=0.0):
+    items = []
+    async for item in subscription:
+        items.append(item)
+        if delay:
+            await asyncio.sleep(delay)
+    return items
+
+
+def test_block_policy_delivers_everything_in_order():
+    async def run():
+        bus = EventBus()
+        subscription = bus.subscribe("all", maxsize=2, policy=BLOCK)
+        consumer = asyncio.create_task(_drain(subscription))
+        await bus.publish_from(range(50))
+        return await consumer, subscription.stats()
+
+    items, stats = asyncio.run(run())
+    assert items == list(range(50))
+    assert stats["delivered"] == 50 and stats["dropped"] == 0
+    assert stats["max_lag"] <= 2
+
+
+def test_slow_consumer_does_not_stall_others():
+    async def run():
+        bus = EventBus()
+        fast = bus.subscribe("fast", maxsize=100, policy=BLOCK)
+        slow = bus.subscribe("slow", maxsize=5, policy=DROP_OLDEST)
+        sampled = bus.subscribe("sampled", maxsize=5, policy=SAMPLE, sample_every=10)
+        tasks = [asyncio.create_task(_drain(fast)), asyncio.create_task(_drain(slow, delay=0.01)),
+                 asyncio.create_task(_drain(sampled, delay=0.01))]
+        await bus.publish_from(range(1000))
+        return await asyncio.gather(*tasks), bus.stats()
+
+    (fast, slow, sampled), stats = asyncio.run(run())
+    assert fast == list(range(1000))
+    # The slow subscriber keeps the newest events and never holds more than its queue size
+    assert slow[-1] == 999 and len(slow) < 1000
+    assert stats["slow"]["dropped"] == 1000 - len(slow)
+    assert stats["slow"]["max_lag"] <= 5
+    assert all(item % 10 == 0 for item in sampled)
+    assert stats["sampled"]["delivered"] + stats["sampled"]["dropped"] == 1000
+
+
+def test_block_timeout_drops_for_stuck_subscriber():
+    async def run():
+        bus = EventBus()
+        stuck = bus.subscribe("stuck", maxsize=1, policy=BLOCK, block_timeout=0.01)
+        for i in range(3):
+            await bus.publish(i)
+        return stuck.stats()
+
+    stats = asyncio.run(run())
+    assert stats["offered"] == 3 and stats["dropped"] == 2 and stats["lag"] == 1
+
+
+def test_stalled_block_subscriber_does_not_hold_up_close():
+    async def run():
+        bus = EventBus()
+        stalled = bus.subscribe("stalled", maxsize=1, policy=BLOCK, block_timeout=0.05)
+        other = bus.subscribe("other", maxsize=100, policy=BLOCK)
+        consumer = asyncio.create_task(_drain(other))
+        await asyncio.wait_for(bus.publish_from(range(5)), timeout=2)
+        items = await asyncio.wait_for(consumer, timeout=2)
+        # The stalled subscriber still ends its stream once it resumes
+        return items, await asyncio.wait_for(_drain(stalled), timeout=2)
+
+    items, stalled_items = asyncio.run(run())
+    assert items == list(range(5))
+    assert stalled_items == []
+
+
+def test_subscribe_validation_and_closed_bus():
+    async def run():
+        bus = EventBus()
+        bus.subscribe("a")
+        with pytest.raises(ValueError):
+            bus.subscribe("a")
+        with pytest.raises(ValueError):
+            bus.subscribe("b", policy="unknown")
+        await bus.close()
+        with pytest.raises(RuntimeError):
+            await bus.publish(1)
+
+    asyncio.run(run())
+
+
+def test_replay_feeds_summary_accumulator(tmp_path):
+    events = [{"id": f"e{i}", "period": 1, "timestamp": f"00:00:{i:02d}.000", "type": {"name": "Pass"},
+               "team": {"name": "A"}, "pass": {}} for i in range(30)]
+    path = tmp_path / "1.json"
+    path.write_text(json.dumps(events))
+
+    async def run():
+        bus = EventBus()
+        subscription = bus.subscribe("summary")
+        accumulator = MatchSummaryAccumulator()
+
+        async def consume():
+            async for _, event in subscription:
+                accumulator.update(event)
+
+        consumer = asyncio.create_task(consume())
+        await bus.publish_from(AsyncMatchReplay(path, clock=VirtualClock()))
+        await consumer
+        return accumulator.snapshot()
+
+    assert asyncio.run(run()) == summarize_events(events)
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+from football_stream_processor.utils.column_store import column_store_exists, load_columns, save_columns
+
+
+@pytest.fixture
+def sample_df():
+    return pd.DataFrame({
+        "distance": [1.5, 2.5, 3.5],
+        "minute": [1, 45, 90],
+        "team": ["Arsenal", "Chelsea", "Arsenal"],
+        "bucket": pd.Categorical(["short", "long", "short"], categories=["short", "long"]),
+    })
+
+
+def test_save_and_load_roundtrip(tmp_path, sample_df):
+    path = tmp_path / "store"
+    save_columns(sample_df, path)
+
+    assert column_store_exists(path)
+    loaded = load_columns(path, mmap=False)
+    pd.testing.assert_frame_equal(loaded, sample_df, check_dtype=False)
+    assert list(loaded["bucket"].cat.categories) == ["short", "long"]
+
+
+def test_load_columns_projection_is_memory_mapped(tmp_path, sample_df):
+    path = tmp_path / "store"
+    save_columns(sample_df, path)
+
+    loaded = load_columns(path, columns=["minute", "distance"])
+    assert loaded.columns.tolist() == ["minute", "distance"]
+    assert isinstance(loaded["distance"].values, np.memmap)
+
+
+def test_save_columns_dtype_override(tmp_path, sample_df):
+    path = tmp_path / "store"
+    save_columns(sample_df, path, dtypes={"distance": "float32"})
+    assert load_columns(path)["distance"].dtype == np.float32
+
+
+def test_load_columns_unknown_column(tmp_path, sample_df):
+    path = tmp_path / "store"
+    save_columns(sample_df, path)
+    with pytest.raises(KeyError):
+        load_columns(path, columns=["missing"])
+
+
+def test_missing_strings_roundtrip_as_none(tmp_path):
+    path = tmp_path / "store"
+    df = pd.DataFrame({"outcome": ["Incomplete", None, np.nan, "None"], "x": [1.0, np.nan, 3.0, 4.0]})
+    save_columns(df, path)
+
+    loaded = load_columns(path)
+    assert loaded["outcome"].isna().tolist() == [False, True, True, False]
+    assert loaded["outcome"][[0, 3]].tolist() == ["Incomplete", "None"]
+    assert np.isnan(loaded["x"][1])
+
+
+def test_object_numbers_and_empty_frames_keep_their_dtypes(tmp_path):
+    path = tmp_path / "store"
+    df = pd.DataFrame({"minute": pd.Series([1, 2, None], dtype=object), "team": ["a", "b", "c"]})
+    save_columns(df, path)
+    loaded = load_columns(path)
+    assert loaded["minute"].dtype == np.float64
+    assert loaded["team"].tolist() == ["a", "b", "c"]
+
+    empty = pd.DataFrame({"distance": np.array([], dtype=np.float64), "team": np.array([], dtype=object)})
+    save_columns(empty, path)
+    loaded = load_columns(path)
+    assert len(loaded) == 0
+    assert loaded["distance"].dtype == np.float64
+    assert pd.api.types.is_string_dtype(loaded["team"])
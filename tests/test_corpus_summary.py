@@ -0,0 +1,63 @@
+import json
+import pytest
+from football_stream_processor.match.catalog import MatchCatalog
+from football_stream_processor.match.corpus_summary import build_corpus_summary
+from football_stream_processor.match.match_summary import summarize_events
+from football_stream_processor.utils.column_store import load_columns
+
+
+def _match(match_id, season):
+    return {
+        "match_id": match_id, "match_date": "2020-01-01",
+        "competition": {"competition_name": "La Liga"}, "season": {"season_name": season},
+        "home_team": {"home_team_name": "Barcelona"}, "away_team": {"away_team_name": "Eibar"},
+    }
+
+
+def _events(n_passes, n_failed):
+    events = [{"id": f"p{i}", "type": {"name": "Pass"}, "team": {"name": "Barcelona"}, "pass": {}} for i in range(n_passes)]
+    events += [{"id": f"f{i}", "type": {"name": "Pass"}, "team": {"name": "Eibar"},
+                "pass": {"outcome": {"name": "Incomplete"}}} for i in range(n_failed)]
+    events += [{"id": "pr", "type": {"name": "Pressure"}, "team": {"name": "Eibar"}, "related_events": ["d"]},
+               {"id": "d", "type": {"name": "Dispossessed"}, "team": {"name": "Barcelona"}}]
+    return events
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    (tmp_path / "matches" / "11").mkdir(parents=True)
+    (tmp_path / "matches" / "11" / "1.json").write_text(json.dumps([_match(1, "2019/2020"), _match(2, "2019/2020")]))
+    (tmp_path / "matches" / "11" / "2.json").write_text(json.dumps([_match(3, "2020/2021")]))
+    events_dir = tmp_path / "events"
+    events_dir.mkdir()
+    for match_id, (passes, failed) in {1: (3, 1), 2: (5, 2), 3: (2, 0)}.items():
+        (events_dir / f"{match_id}.json").write_text(json.dumps(_events(passes, failed)))
+    catalog = MatchCatalog(tmp_path / "catalog", tmp_path / "matches").refresh()
+    return events_dir, catalog
+
+
+def test_corpus_summary_merges_partials_per_season(tmp_path, corpus):
+    events_dir, catalog = corpus
+    summary = build_corpus_summary(events_dir, tmp_path / "out", catalog=catalog, workers=2)
+
+    barca = summary[summary["team"] == "Barcelona"].set_index("season")
+    assert barca.loc["2019/2020", "pass_attempts"] == 8
+    assert barca.loc["2019/2020", "matches"] == 2
+    assert barca.loc["2020/2021", "pass_accuracy"] == 100.0
+    eibar = summary[(summary["team"] == "Eibar") & (summary["season"] == "2019/2020")].iloc[0]
+    assert eibar["pass_accuracy"] == 0.0
+    assert eibar["pressure_success_rate"] == 100.0
+
+    match_team = load_columns(tmp_path / "out" / "match_team", mmap=False)
+    row = match_team[(match_team["match_id"] == 2) & (match_team["team"] == "Barcelona")].iloc[0]
+    expected = summarize_events(_events(5, 2))
+    assert row["pass_accuracy"] == expected["Pass Accuracy (%)"]["Barcelona"]
+
+
+def test_corpus_summary_resumes_from_checkpoints(tmp_path, corpus):
+    events_dir, catalog = corpus
+    first = build_corpus_summary(events_dir, tmp_path / "out", catalog=catalog)
+    # Checkpoints are used instead of the (now broken) event file
+    (events_dir / "2.json").write_text("not json")
+    resumed = build_corpus_summary(events_dir, tmp_path / "out", catalog=catalog)
+    assert resumed.equals(first)
@@ -1,3 +1,4 @@
+import json
 import pytest
 import pandas as pd
 from pathlib import Path
@@ -54,14 +55,84 @@ def test_filter_pass_events():
     assert result[0]["type"]["name"] == "Pass"
 
 
-def test_build_all_passes_dataset_creates_pickle(tmp_path):
+def test_build_all_passes_dataset_creates_column_store(tmp_path):
     # Simulate empty event dir with a single file
     events_dir = tmp_path / "events"
     events_dir.mkdir()
     sample_file = events_dir / "12345.json"
     sample_file.write_text('[{"type": {"name": "Pass"}, "location": [1,1], "pass": {"end_location": [2,2]}, "minute": 1}]')
 
-    cache_path = tmp_path / "pass_data.pkl"
+    cache_path = tmp_path / "pass_data"
     df = data_pipeline.build_all_passes_dataset(events_dir, cache_path=cache_path, limit=1)
     assert isinstance(df, pd.DataFrame)
-    assert cache_path.exists()
+    assert (cache_path / "meta.json").exists()
+
+    projected = data_pipeline.load_pass_dataset(cache_path, columns=["distance", "pass_outcome"])
+    assert projected.columns.tolist() == ["distance", "pass_outcome"]
+    assert projected["pass_outcome"].tolist() == df["pass_outcome"].tolist()
+
+
+def _write_event_files(events_dir, n_files=4):
+    events_dir.mkdir()
+    for i in range(n_files):
+        events = [
+            {"type": {"name": "Pass"}, "location": [10.0 + i, 20.0], "pass": {"end_location": [30.0, 25.0 + i]}, "minute": i},
+            {"type": {"name": "Pass"}, "location": [40.0, 40.0], "pass": {"end_location": [20.0, 60.0], "outcome": {"name": "Incomplete"}}, "minute": i + 1},
+            {"type": {"name": "Shot"}, "location": [110.0, 40.0]},
+        ]
+        (events_dir / f"{1000 + i}.json").write_text(json.dumps(events))
+
+
+def test_build_all_passes_dataset_parallel_matches_serial(tmp_path):
+    events_dir = tmp_path / "events"
+    _write_event_files(events_dir)
+
+    serial = data_pipeline.build_all_passes_dataset(events_dir, cache_path=tmp_path / "serial", limit=10)
+    parallel = data_pipeline.build_all_passes_dataset(events_dir, cache_path=tmp_path / "parallel", limit=10, workers=2)
+
+    assert len(serial) == 8
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_build_all_passes_dataset_reuses_unchanged_shards(tmp_path):
+    events_dir = tmp_path / "events"
+    _write_event_files(events_dir, n_files=3)
+    cache_path = tmp_path / "pass_data"
+
+    first = data_pipeline.build_all_passes_dataset(events_dir, cache_path=cache_path, limit=10)
+
+    # Add a new match and change an existing one
+    _events = [{"type": {"name": "Pass"}, "location": [1.0, 1.0], "pass": {"end_location": [4.0, 5.0]}, "minute": 7}]
+    (events_dir / "2000.json").write_text(json.dumps(_events))
+    (events_dir / "1001.json").write_text(json.dumps(_events))
+
+    second = data_pipeline.build_all_passes_dataset(events_dir, cache_path=cache_path, limit=10)
+    manifest = json.loads((tmp_path / "pass_data_shards" / "manifest.json").read_text())
+
+    assert manifest["last_build"]["misses"] == ["1001.json", "2000.json"]
+    assert manifest["last_build"]["hits"] == ["1000.json", "1002.json"]
+    assert len(first) == 6
+    assert len(second) == 6
+    assert second["minute"].tolist() == [0, 1, 7, 2, 3, 7]
+
+
+def test_extract_pass_columns_matches_per_event_features(sample_event):
+    events = [
+        sample_event,
+        {"type": {"name": "Pass"}, "location": [60.0, 20.0], "pass": {"end_location": [40.0, 10.0], "outcome": {"name": "Out"}}, "minute": 50},
+        {"type": {"name": "Pass"}, "location": [60.0, 20.0], "pass": {"end_location": [None, 10.0]}, "minute": 51},
+        {"type": {"name": "Shot"}, "location": [100.0, 40.0]},
+    ]
+    columns = data_pipeline.extract_pass_columns(events)
+    expected = [f for f in map(data_pipeline.extract_pass_features, events[:3]) if f is not None]
+
+    assert len(columns["distance"]) == 2
+    for i, features in enumerate(expected):
+        for name, value in features.items():
+            assert columns[name][i] == pytest.approx(value)
+
+
+def test_extract_pass_columns_empty():
+    columns = data_pipeline.extract_pass_columns([{"type": {"name": "Shot"}}])
+    assert set(columns) == set(data_pipeline.PASS_FEATURE_COLUMNS)
+    assert all(len(values) == 0 for values in columns.values())
@@ -0,0 +1,81 @@
+import pytest
+from football_stream_processor.stream.dedup import BloomFilter, EventDeduplicator
+
+
+def _events(prefix, n):
+    return [{"id": f"{prefix}-{i}"} for i in range(n)]
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_error():
+    bloom = BloomFilter(capacity=5000, error_rate=0.01)
+    for i in range(5000):
+        bloom.add(f"seen-{i}")
+    assert all(f"seen-{i}" in bloom for i in range(5000))
+    false_positives = sum(f"unseen-{i}" in bloom for i in range(20000))
+    assert false_positives / 20000 < 0.02
+    assert bloom.expected_error_rate() == pytest.approx(0.01, rel=0.2)
+
+
+def test_live_match_duplicates_are_exact():
+    dedup = EventDeduplicator(capacity=1000)
+    events = _events("a", 100)
+    assert list(dedup.filter_events(events + events[:10], match_id=1)) == events
+    assert dedup.exact_hits == 10
+    assert dedup.filter_hits == 0
+    assert dedup.stats()["live_ids"] == 100
+
+
+def test_closed_match_duplicates_are_caught_by_filter():
+    dedup = EventDeduplicator(capacity=1000)
+    events = _events("a", 100)
+    list(dedup.filter_events(events, match_id=1))
+    dedup.close_match(1)
+    assert dedup.stats()["live_ids"] == 0
+    assert not list(dedup.filter_events(events, match_id=1))
+    assert dedup.filter_hits == 100
+
+
+def test_live_matches_are_bounded():
+    dedup = EventDeduplicator(capacity=1000, max_live_matches=2)
+    for match_id in range(5):
+        list(dedup.filter_events(_events(match_id, 10), match_id))
+    assert list(dedup.live) == [3, 4]
+    assert not list(dedup.filter_events(_events(0, 10), match_id=0))
+
+
+def test_redelivery_after_eviction_and_reopen_is_a_duplicate():
+    dedup = EventDeduplicator(capacity=1000, max_live_matches=1)
+    for event_id, match_id in [("a1", "A"), ("a2", "A"), ("b1", "B"), ("a3", "A")]:
+        assert not dedup.is_duplicate({"id": event_id}, match_id)
+    # A was evicted by B and reopened by a3; its exact set only holds a3
+    assert dedup.is_duplicate({"id": "a1"}, "A")
+    assert dedup.is_duplicate({"id": "b1"}, "B")
+    assert dedup.false_positives == 0
+    assert dedup.filter_hits == 2
+    assert list(dedup.live) == ["A"]
+
+
+def test_false_positives_are_counted_on_live_matches():
+    # A tiny filter saturates quickly, so new ids of a live match collide with it
+    dedup = EventDeduplicator(capacity=10**6, error_rate=0.5)
+    dedup.filter = BloomFilter(capacity=8, error_rate=0.5)
+    unique = list(dedup.filter_events(_events("a", 200), match_id=1))
+    assert len(unique) == 200
+    assert dedup.false_positives > 0
+    assert dedup.duplicates == 0
+
+
+def test_filter_rotates_at_capacity():
+    dedup = EventDeduplicator(capacity=50)
+    list(dedup.filter_events(_events("a", 120)))
+    assert dedup.rotations == 2
+    assert dedup.filter.count <= 50
+    # Ids of the previous generation are still suppressed
+    assert dedup.is_duplicate({"id": "a-99"})
+
+
+def test_events_without_id_pass_through():
+    dedup = EventDeduplicator(capacity=10)
+    assert not dedup.is_duplicate({}, match_id=1)
+    assert not dedup.is_duplicate({}, match_id=1)
+    assert dedup.checked == 0
@@ -0,0 +1,62 @@
+from football_stream_processor.stream.log import ConsumerGroup, EventLog
+
+
+def _records(n, start=0):
+    return [{"id": f"e{i}", "type": {"name": "Pass"}, "payload": "x" * (i % 7)} for i in range(start, start + n)]
+
+
+def test_append_and_read_across_segments(tmp_path):
+    with EventLog(tmp_path, segment_bytes=2048, index_interval=256) as log:
+        log.append_many(_records(500))
+        assert len(log.segments) > 3
+        assert [record["id"] for _, record in log.read(0)] == [f"e{i}" for i in range(500)]
+        assert [offset for offset, _ in log.read(321, max_records=3)] == [321, 322, 323]
+        assert log.end_offset == 500
+
+
+def test_reopen_continues_offsets(tmp_path):
+    with EventLog(tmp_path, segment_bytes=2048) as log:
+        log.append_many(_records(100))
+    with EventLog(tmp_path, segment_bytes=2048) as log:
+        assert log.end_offset == 100
+        assert log.append({"id": "next"}) == 100
+        assert list(log.read(100)) == [(100, {"id": "next"})]
+
+
+def test_torn_tail_is_truncated_on_open(tmp_path):
+    with EventLog(tmp_path, index_interval=64) as log:
+        log.append_many(_records(20))
+        active = log.segments[-1].log_path
+    with open(active, "ab") as f:
+        f.write(b"\x10\x00\x00\x00partial")
+    with EventLog(tmp_path) as log:
+        assert log.end_offset == 20
+        assert log.append({"id": "after-crash"}) == 20
+        assert [record["id"] for _, record in log.read(18)] == ["e18", "e19", "after-crash"]
+
+
+def test_consumer_group_resumes_from_committed_offset(tmp_path):
+    with EventLog(tmp_path, segment_bytes=1024) as log:
+        log.append_many(_records(50))
+        consumer = ConsumerGroup(log, "summary")
+        assert [offset for offset, _ in consumer.poll(10)] == list(range(10))
+        consumer.commit()
+        consumer.poll(10)  # read but not committed, as if the consumer crashed here
+        assert consumer.lag == 30
+
+    with EventLog(tmp_path, segment_bytes=1024) as log:
+        consumer = ConsumerGroup(log, "summary")
+        assert consumer.committed() == 10
+        assert consumer.poll(1)[0][0] == 10
+        assert ConsumerGroup(log, "other").poll(1)[0][0] == 0
+
+
+def test_offset_for_time(tmp_path):
+    with EventLog(tmp_path, segment_bytes=512) as log:
+        for i in range(100):
+            log.append({"i": i}, timestamp=1000.0 + i)
+        assert log.offset_for_time(1042.5) == 43
+        assert log.offset_for_time(0) == 0
+        assert log.offset_for_time(5000) == 100
+        offset, timestamp, record = next(log.read(log.offset_for_time(1090), with_timestamps=True))
+        assert (offset, timestamp, record) == (90, 1090.0, {"i": 90})
@@ -0,0 +1,48 @@
+import json
+import pytest
+from football_stream_processor.utils.event_reader import iter_events, iter_events_with_offsets, read_event_range
+
+
+@pytest.fixture
+def events_file(tmp_path):
+    events = [
+        {"id": "a", "type": {"name": "Starting XI"}, "team": {"name": "Bayern München"}},
+        {"id": "b", "type": {"name": "Pass"}, "location": [1.0, 2.0], "pass": {"end_location": [3.0, 4.0]}},
+        {"id": "c", "type": {"name": "Shot"}, "shot": {"statsbomb_xg": 0.12}},
+        {"id": "d", "type": {"name": "Pass"}, "player": {"name": "Müller"}},
+    ]
+    path = tmp_path / "events.json"
+    path.write_text(json.dumps(events, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path, events
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_iter_events_matches_json_load(events_file, chunk_size):
+    path, events = events_file
+    assert list(iter_events(path, chunk_size=chunk_size)) == events
+
+
+def test_iter_events_filters_types(events_file):
+    path, events = events_file
+    assert [e["id"] for e in iter_events(path, event_types={"Pass"})] == ["b", "d"]
+
+
+def test_read_event_range_uses_byte_offsets(events_file):
+    path, events = events_file
+    offsets = list(iter_events_with_offsets(path, chunk_size=5))
+    assert [e for _, _, e in offsets] == events
+    start, end = offsets[1][0], offsets[3][1]
+    assert read_event_range(path, start, end) == events[1:]
+
+
+def test_iter_events_rejects_truncated_file(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text('[{"id": "a"}, {"id": ')
+    with pytest.raises(ValueError):
+        list(iter_events(path))
+
+
+def test_iter_events_empty_array(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_text(" [ ] ")
+    assert list(iter_events(path)) == []
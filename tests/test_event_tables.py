@@ -0,0 +1,102 @@
+import json
+import numpy as np
+import pytest
+from football_stream_processor.models.xg_model import data_pipeline
+from football_stream_processor.utils.column_store import load_columns
+from football_stream_processor.utils.event_tables import EventTable, EventTableExtractor, PassTable, build_event_tables
+
+EVENTS = [
+    {"id": "1", "index": 1, "period": 1, "timestamp": "00:00:01.000", "minute": 0, "second": 1,
+     "type": {"name": "Pass"}, "team": {"name": "A"}, "player": {"name": "P1"},
+     "location": [10.0, 10.0], "pass": {"end_location": [13.0, 14.0], "recipient": {"name": "P2"}}},
+    {"id": "2", "index": 2, "period": 1, "timestamp": "00:00:02.000", "minute": 0, "second": 2,
+     "type": {"name": "Carry"}, "team": {"name": "A"}, "player": {"name": "P2"},
+     "location": [13.0, 14.0], "carry": {"end_location": [20.0, 14.0]}},
+    {"id": "3", "index": 3, "period": 1, "timestamp": "00:00:03.000", "minute": 0, "second": 3,
+     "type": {"name": "Pressure"}, "team": {"name": "B"}, "player": {"name": "Q1"},
+     "location": [100.0, 66.0], "related_events": ["4"]},
+    {"id": "4", "index": 4, "period": 1, "timestamp": "00:00:04.000", "minute": 0, "second": 4,
+     "type": {"name": "Shot"}, "team": {"name": "A"}, "player": {"name": "P2"},
+     "location": [110.0, 40.0], "shot": {"statsbomb_xg": 0.3, "outcome": {"name": "Goal"}, "end_location": [120.0, 40.0, 1.0]}},
+    {"id": "5", "index": 5, "period": 1, "timestamp": "00:00:05.000", "minute": 0, "second": 5,
+     "type": {"name": "Ball Receipt*"}, "team": {"name": "A"}},
+]
+
+
+def test_extractor_routes_events_in_one_pass():
+    extractor = EventTableExtractor()
+    extractor.process(EVENTS, match_id=7)
+    frames = extractor.to_frames()
+
+    assert {name: len(df) for name, df in frames.items()} == {
+        "passes": 1, "carries": 1, "shots": 1, "pressures": 1, "duels": 0
+    }
+    assert frames["passes"]["distance"].iloc[0] == pytest.approx(5.0)
+    assert frames["passes"]["recipient"].iloc[0] == "P2"
+    assert frames["shots"]["statsbomb_xg"].iloc[0] == pytest.approx(0.3)
+    assert frames["pressures"]["n_related"].iloc[0] == 1
+    assert (frames["carries"]["match_id"] == 7).all()
+
+
+def test_pass_table_matches_data_pipeline_features():
+    extractor = EventTableExtractor()
+    extractor.process(EVENTS)
+    passes = extractor.to_frames()["passes"]
+    expected = data_pipeline.extract_pass_columns(EVENTS)
+
+    np.testing.assert_allclose(passes["distance"], expected["distance"])
+    np.testing.assert_allclose(passes["angle"], expected["angle"])
+    np.testing.assert_array_equal(passes["pass_outcome"], expected["pass_outcome"])
+
+
+def test_register_custom_table():
+    class ReceiptTable(EventTable):
+        name = "receipts"
+        event_types = ("Ball Receipt*",)
+        columns = []
+
+        def row(self, event):
+            return ()
+
+    extractor = EventTableExtractor(tables=[])
+    extractor.register(ReceiptTable())
+    extractor.process(EVENTS)
+    assert len(extractor.to_frames()["receipts"]) == 1
+
+    with pytest.raises(ValueError):
+        extractor.register(ReceiptTable())
+
+
+def test_build_event_tables_writes_column_stores(tmp_path):
+    events_dir = tmp_path / "events"
+    events_dir.mkdir()
+    (events_dir / "101.json").write_text(json.dumps(EVENTS))
+    (events_dir / "102.json").write_text(json.dumps(EVENTS[:2]))
+
+    tables = build_event_tables(events_dir, tmp_path / "tables", workers=2)
+
+    assert len(tables["passes"]) == 2
+    shots = load_columns(tmp_path / "tables" / "shots")
+    assert shots["match_id"].tolist() == [101]
+
+
+def test_pass_table_keeps_missing_minutes_like_data_pipeline():
+    events = [dict(EVENTS[0]), {key: value for key, value in EVENTS[0].items() if key != "minute"}]
+    extractor = EventTableExtractor(tables=[PassTable])
+    extractor.process(events)
+    minute = extractor.to_frames()["passes"]["minute"]
+
+    expected = data_pipeline.extract_pass_columns(events)["minute"]
+    assert minute.dtype == expected.dtype == np.float64
+    np.testing.assert_array_equal(minute, expected)
+
+
+def test_empty_tables_have_the_column_dtypes_of_filled_ones():
+    extractor = EventTableExtractor()
+    extractor.process(EVENTS)
+    filled = extractor.to_frames()
+    empty = EventTableExtractor().to_frames()
+
+    for name, frame in empty.items():
+        assert len(frame) == 0
+        assert frame.dtypes.to_dict() == filled[name].dtypes.to_dict(), name
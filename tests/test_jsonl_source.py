@@ -0,0 +1,99 @@
+import asyncio
+import json
+from football_stream_processor.stream.bus import EventBus
+from football_stream_processor.stream.jsonl_source import JsonLinesSource, reader_lines, socket_lines, tail_lines
+
+
+def _line(i):
+    return json.dumps({"id": f"e{i}", "period": 1, "timestamp": f"00:00:{i:02d}.000", "type": {"name": "Pass"}}) + "\n"
+
+
+async def _collect(source):
+    return [batch async for batch in source.iter_batches()]
+
+
+def test_batches_by_count_and_skips_malformed_lines(tmp_path):
+    path = tmp_path / "feed.jsonl"
+    path.write_text("".join(_line(i) for i in range(25)) + "not json\n\n")
+    source = JsonLinesSource(tail_lines(path, follow=False), batch_size=10)
+
+    batches = asyncio.run(_collect(source))
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert [e["id"] for batch in batches for e in batch] == [f"e{i}" for i in range(25)]
+    assert source.stats()["errors"] == 1
+    assert len(source.latencies) == 25
+
+
+def test_closing_batches_early_does_not_hang(tmp_path):
+    path = tmp_path / "feed.jsonl"
+    path.write_text("".join(_line(i % 60) for i in range(200)))
+    source = JsonLinesSource(tail_lines(path, follow=False), batch_size=10)
+
+    async def run():
+        batches = source.iter_batches()
+        async for batch in batches:
+            break
+        # The reader has filled the buffer by now and is waiting to queue more
+        await asyncio.sleep(0.05)
+        await asyncio.wait_for(batches.aclose(), timeout=2)
+        return batch
+
+    assert len(asyncio.run(run())) == 10
+
+
+def test_tail_follows_appended_data_and_closes_batches_by_time(tmp_path):
+    path = tmp_path / "feed.jsonl"
+    path.write_text(_line(0))
+
+    async def run():
+        async def writer():
+            await asyncio.sleep(0.05)
+            with open(path, "a") as f:
+                f.write(_line(1)[:20])
+                f.flush()
+                await asyncio.sleep(0.05)
+                f.write(_line(1)[20:] + _line(2))
+
+        source = JsonLinesSource(tail_lines(path, poll_interval=0.01, idle_timeout=0.2), batch_size=100, max_delay=0.02)
+        batches, _ = await asyncio.gather(_collect(source), writer())
+        return batches
+
+    batches = asyncio.run(run())
+    # The first event is not held back until the batch is full
+    assert [e["id"] for e in batches[0]] == ["e0"]
+    assert [e["id"] for batch in batches for e in batch] == ["e0", "e1", "e2"]
+
+
+def test_socket_source_publishes_to_bus():
+    async def run():
+        async def serve(reader, writer):
+            writer.write("".join(_line(i) for i in range(5)).encode())
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(serve, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        bus = EventBus()
+        subscription = bus.subscribe("consumer")
+        source = JsonLinesSource(socket_lines("127.0.0.1", port), batch_size=2)
+        consumer = asyncio.create_task(_drain(subscription))
+        published = await source.publish_to(bus)
+        server.close()
+        return published, await consumer
+
+    async def _drain(subscription):
+        return [item async for item in subscription]
+
+    published, items = asyncio.run(run())
+    assert published == 5
+    assert [(t, e["id"]) for t, e in items] == [(float(i), f"e{i}") for i in range(5)]
+
+
+def test_reader_lines_strips_newlines():
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"a\nb\n")
+        reader.feed_eof()
+        return [line async for line in reader_lines(reader)]
+
+    assert asyncio.run(run()) == [b"a", b"b"]
@@ -0,0 +1,70 @@
+import json
+import pytest
+from football_stream_processor.match.catalog import CATALOG_COLUMNS, MatchCatalog
+
+
+def _match(match_id, home, away, date, competition="La Liga", season="2019/2020"):
+    return {
+        "match_id": match_id,
+        "match_date": date,
+        "competition": {"competition_name": competition},
+        "season": {"season_name": season},
+        "home_team": {"home_team_name": home},
+        "away_team": {"away_team_name": away},
+    }
+
+
+@pytest.fixture
+def matches_dir(tmp_path):
+    root = tmp_path / "matches"
+    (root / "11").mkdir(parents=True)
+    (root / "43").mkdir()
+    (root / "11" / "1.json").write_text(json.dumps([
+        _match(303, "Barcelona", "Eibar", "2020-02-01"),
+        _match(301, "Sevilla", "Barcelona", "2020-01-05"),
+    ]))
+    (root / "43" / "3.json").write_text(json.dumps([
+        _match(7, "France", "Croatia", "2018-07-15", competition="FIFA World Cup", season="2018"),
+    ]))
+    return root
+
+
+def test_catalog_builds_sorted_frame(tmp_path, matches_dir):
+    catalog = MatchCatalog(catalog_dir=tmp_path / "catalog", matches_dir=matches_dir).refresh()
+
+    assert catalog.frame["match_id"].tolist() == [7, 301, 303]
+    assert catalog.lookup(301)["home_team"] == "Sevilla"
+    assert catalog.lookup(999) is None
+
+
+def test_catalog_filters(tmp_path, matches_dir):
+    catalog = MatchCatalog(catalog_dir=tmp_path / "catalog", matches_dir=matches_dir).refresh()
+
+    assert catalog.filter(competition="La Liga")["match_id"].tolist() == [301, 303]
+    assert catalog.filter(team="Barcelona", date_from="2020-01-10")["match_id"].tolist() == [303]
+    assert catalog.filter(season="2018")["match_id"].tolist() == [7]
+    assert catalog.filter(competition="Serie A").empty
+
+
+def test_catalog_refresh_only_parses_changed_files(tmp_path, matches_dir, capsys):
+    MatchCatalog(catalog_dir=tmp_path / "catalog", matches_dir=matches_dir).refresh()
+    capsys.readouterr()
+
+    (matches_dir / "43" / "3.json").write_text(json.dumps([
+        _match(7, "France", "Croatia", "2018-07-15", competition="FIFA World Cup", season="2018"),
+        _match(8, "Belgium", "England", "2018-07-14", competition="FIFA World Cup", season="2018"),
+    ]))
+    catalog = MatchCatalog(catalog_dir=tmp_path / "catalog", matches_dir=matches_dir).refresh()
+
+    assert "parsed 1 of 2 season files" in capsys.readouterr().out
+    assert catalog.lookup(8)["away_team"] == "England"
+    # Rows of the unchanged season file come from the stored columns
+    assert catalog.lookup(301)["home_team"] == "Sevilla"
+    assert catalog.frame["match_id"].tolist() == [8, 7, 301, 303]
+    assert catalog.frame.columns.tolist() == CATALOG_COLUMNS
+
+    manifest = json.loads((tmp_path / "catalog" / "manifest.json").read_text())
+    assert all(set(entry) == {"size", "mtime"} for entry in manifest["files"].values())
+
+    MatchCatalog(catalog_dir=tmp_path / "catalog", matches_dir=matches_dir).refresh()
+    assert "parsed" not in capsys.readouterr().out
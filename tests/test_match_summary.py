@@ -0,0 +1,65 @@
+import json
+from football_stream_processor.match.match_summary import (
+    MatchSummaryAccumulator, analyze_match_metrics, summarize_events
+)
+
+
+def _event(event_id, event_type, team, **extra):
+    return dict({"id": event_id, "type": {"name": event_type}, "team": {"name": team}}, **extra)
+
+
+EVENTS = [
+    _event("p1", "Pressure", "A", related_events=["m1"]),
+    _event("m1", "Miscontrol", "B", related_events=["p1"]),
+    _event("p2", "Pressure", "A", related_events=["c1", "missing"]),
+    _event("c1", "Carry", "B"),
+    _event("p3", "Pressure", "B", related_events=["d1"]),
+    _event("d1", "Dispossessed", "A"),
+    _event("s1", "Pass", "A", **{"pass": {}}),
+    _event("s2", "Pass", "A", **{"pass": {"outcome": {"name": "Incomplete"}}}),
+    _event("x1", "Shot", "B", shot={"statsbomb_xg": 0.25}),
+    {"id": "h1", "type": {"name": "Half Start"}},
+]
+
+
+def test_pressure_success_resolves_related_events_by_id():
+    summary = summarize_events(EVENTS)
+    assert summary["Pressures Applied"] == {"A": 2, "B": 1}
+    assert summary["Pressure Success Rate (%)"] == {"A": 50.0, "B": 100.0}
+    assert summary["Turnovers"] == {"B": 1, "A": 1}
+    assert summary["Pass Accuracy (%)"] == {"A": 50.0}
+    assert summary["Total xG"] == {"B": 0.25}
+
+
+def test_analyze_match_metrics_reads_file(tmp_path):
+    path = tmp_path / "1.json"
+    path.write_text(json.dumps(EVENTS))
+    assert analyze_match_metrics(path) == summarize_events(EVENTS)
+
+
+def test_accumulator_snapshot_equals_batch_summary():
+    accumulator = MatchSummaryAccumulator()
+    for event in EVENTS:
+        accumulator.update(event)
+        accumulator.snapshot()
+    assert accumulator.snapshot() == summarize_events(EVENTS)
+    assert accumulator.pending == 1  # "missing" never arrives
+
+
+def test_accumulator_resolves_related_event_arriving_first():
+    reordered = [EVENTS[1], EVENTS[0], EVENTS[5], EVENTS[4]]
+    accumulator = MatchSummaryAccumulator()
+    for event in reordered:
+        accumulator.update(event)
+    assert accumulator.snapshot() == summarize_events(reordered)
+
+
+def test_accumulator_bounds_pending_related_events():
+    accumulator = MatchSummaryAccumulator(max_pending=2)
+    for i in range(5):
+        accumulator.update(_event(f"p{i}", "Pressure", "A", related_events=[f"later{i}"]))
+    assert accumulator.pending == 2
+    assert accumulator.evicted == 3
+    accumulator.update(_event("later4", "Dispossessed", "B"))
+    accumulator.update(_event("later0", "Dispossessed", "B"))
+    assert accumulator.snapshot()["Pressure Success Rate (%)"] == {"A": 20.0}
@@ -0,0 +1,32 @@
+import json
+import pytest
+from football_stream_processor.match.multi_replay import run_multi_replay
+
+
+@pytest.fixture
+def match_files(tmp_path):
+    paths = []
+    for match_id, n_events in ((1, 40), (2, 25), (3, 10)):
+        events = [{"id": f"{match_id}-{i}", "period": 1, "timestamp": f"00:00:{i:02d}.000", "type": {"name": "Pass"},
+                   "team": {"name": "A"}, "pass": {}} for i in range(n_events)]
+        path = tmp_path / f"{match_id}.json"
+        path.write_text(json.dumps(events))
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_multi_replay_reports_all_events(match_files, workers):
+    report, per_match = run_multi_replay(match_files, workers=workers, measure_memory=True)
+    assert report["matches"] == 3
+    assert report["events"] == 75
+    assert report["events_per_sec"] > 0
+    assert report["latency_p50_ms"] <= report["latency_p99_ms"]
+    assert report["memory_per_active_match_kb"] > 0
+    assert sorted(per_match["events"].tolist()) == [10, 25, 40]
+
+
+def test_multi_replay_limits_active_matches(match_files):
+    report, _ = run_multi_replay(match_files, max_active=1)
+    assert report["max_active"] == 1
+    assert report["events"] == 75
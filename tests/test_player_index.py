@@ -0,0 +1,51 @@
+import json
+import pytest
+from football_stream_processor.match.player_index import PlayerIndex, build_player_index
+
+
+def _event(i, player_id, team_id, event_type="Pass"):
+    return {
+        "id": f"e{i}",
+        "type": {"name": event_type},
+        "team": {"id": team_id, "name": f"Team {team_id}"},
+        "player": {"id": player_id, "name": f"Player {player_id}"},
+        "location": [float(i), 10.0],
+    }
+
+
+@pytest.fixture
+def index(tmp_path):
+    events_dir = tmp_path / "events"
+    events_dir.mkdir()
+    match_1 = [_event(i, 10 + i % 3, 1) for i in range(30)] + [_event(30, 20, 2, "Shot")]
+    match_2 = [_event(i, 20, 2) for i in range(5)] + [_event(5, 10, 1, "Shot")]
+    (events_dir / "1.json").write_text(json.dumps(match_1, indent=2))
+    (events_dir / "2.json").write_text(json.dumps(match_2, indent=2))
+    (events_dir / "3.json").write_text(json.dumps([_event(0, 11, 1)]))
+
+    # A tiny gap forces several ranges per player
+    build_player_index(events_dir, tmp_path / "index", max_gap=0)
+    return PlayerIndex(tmp_path / "index", events_dir)
+
+
+def test_matches_for_player_and_team(index):
+    assert index.matches(10) == [1, 2]
+    assert index.matches(20) == [1, 2]
+    assert index.matches(2, kind="teams") == [1, 2]
+    assert index.matches(999) == []
+
+
+def test_iter_events_reads_only_player_events(index):
+    events = list(index.iter_events(10))
+    assert len(events) == 11
+    assert all(event["player"]["id"] == 10 for _, event in events)
+
+    shots = list(index.iter_events(10, event_types={"Shot"}))
+    assert [(match_id, event["id"]) for match_id, event in shots] == [(2, "e5")]
+
+    assert [m for m, _ in index.iter_events(20, match_ids=[1])] == [1]
+
+
+def test_find_by_name(index):
+    assert index.find("player 1") == [10, 11, 12]
+    assert index.find("team 2", kind="teams") == [2]
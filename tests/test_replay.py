@@ -0,0 +1,81 @@
+import asyncio
+import json
+import time
+import pytest
+from football_stream_processor.match.replay import AsyncMatchReplay, RealTimeClock, VirtualClock
+from football_stream_processor.match.simulate import MatchReplay
+
+
+def _events(n, step=0.02):
+    events = [{"id": f"e{i}", "period": 1, "timestamp": f"00:00:{i * step:06.3f}", "type": {"name": "Pass"}}
+              for i in range(n)]
+    events.append({"id": "h2", "period": 2, "timestamp": "00:00:00.000", "type": {"name": "Half Start"}})
+    return events
+
+
+@pytest.fixture
+def match_file(tmp_path):
+    path = tmp_path / "1.json"
+    path.write_text(json.dumps(_events(5)))
+    return path
+
+
+def test_virtual_clock_replays_in_order_without_waiting(tmp_path):
+    path = tmp_path / "2.json"
+    path.write_text(json.dumps(_events(2000, step=1.0)))
+
+    async def collect():
+        return [(t, e["id"]) async for t, e in AsyncMatchReplay(path, clock=VirtualClock())]
+
+    start = time.perf_counter()
+    replayed = asyncio.run(collect())
+    assert time.perf_counter() - start < 1.0
+    expected = [(t, e["id"]) for t, e in MatchReplay(path, speed=None)]
+    assert replayed == expected
+    # The second period continues the elapsed time of the first
+    assert replayed[-1][0] == replayed[-2][0]
+
+
+def test_real_time_clock_respects_speed(match_file):
+    async def replay():
+        start = asyncio.get_running_loop().time()
+        count = await AsyncMatchReplay(match_file, clock=RealTimeClock(speed=2.0)).run(lambda t, e: None)
+        return count, asyncio.get_running_loop().time() - start
+
+    count, elapsed = asyncio.run(replay())
+    assert count == 6
+    # 0.08 s of match time at 2x speed
+    assert 0.035 <= elapsed < 0.5
+
+
+def test_real_time_clock_pause_and_resume(match_file):
+    async def replay():
+        clock = RealTimeClock(speed=1.0)
+        seen = []
+
+        async def handler(t, event):
+            seen.append(event["id"])
+            if event["id"] == "e1":
+                clock.pause()
+                asyncio.get_running_loop().call_later(0.1, clock.resume)
+
+        start = asyncio.get_running_loop().time()
+        await AsyncMatchReplay(match_file, clock=clock).run(handler)
+        return seen, asyncio.get_running_loop().time() - start
+
+    seen, elapsed = asyncio.run(replay())
+    assert seen == ["e0", "e1", "e2", "e3", "e4", "h2"]
+    assert elapsed >= 0.1 + 0.06
+
+
+def test_concurrent_replays_share_one_loop(match_file):
+    async def both():
+        replays = [AsyncMatchReplay(match_file, clock=VirtualClock()) for _ in range(2)]
+        return await asyncio.gather(*(r.run(lambda t, e: None) for r in replays))
+
+    assert asyncio.run(both()) == [6, 6]
+
+
+def test_real_time_clock_rejects_non_positive_speed():
+    with pytest.raises(ValueError):
+        RealTimeClock(speed=0)
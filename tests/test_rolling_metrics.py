@@ -0,0 +1,51 @@
+import pytest
+from football_stream_processor.match.rolling_metrics import SlidingWindowAggregator, event_time, rolling_metrics
+
+
+def _event(minute, event_type, team="A", **extra):
+    return dict({"minute": minute, "second": 0, "type": {"name": event_type}, "team": {"name": team}}, **extra)
+
+
+EVENTS = [
+    _event(1, "Pass", **{"pass": {}}),
+    _event(2, "Shot", shot={"statsbomb_xg": 0.3}),
+    _event(3, "Pressure", team="B"),
+    _event(4, "Pass", **{"pass": {"outcome": {"name": "Incomplete"}}}),
+    _event(12, "Dispossessed"),
+    _event(14, "Shot", shot={"statsbomb_xg": 0.1}),
+]
+
+
+def test_rolling_metrics_match_brute_force_windows():
+    df = rolling_metrics(EVENTS, window=600, step=120)
+    assert df["time"].max() == 840
+    for row in df.itertuples(index=False):
+        in_window = [e for e in EVENTS if e["team"]["name"] == row.team and row.time - 600 < event_time(e) <= row.time]
+        xg = sum(e.get("shot", {}).get("statsbomb_xg", 0.0) for e in in_window)
+        assert row.xg == pytest.approx(xg)
+        assert row.passes == sum(e["type"]["name"] == "Pass" for e in in_window)
+        assert row.turnovers == sum(e["type"]["name"] == "Dispossessed" for e in in_window)
+
+
+def test_rolling_metrics_pass_accuracy_and_eviction():
+    df = rolling_metrics(EVENTS, window=600, step=120).set_index(["time", "team"])
+    assert df.loc[(240, "A"), "pass_accuracy"] == 50.0
+    assert df.loc[(240, "B"), "pressures"] == 1
+    # Passes at minutes 1 and 4 have left the 10 minute window by minute 16
+    assert df.loc[(840, "A"), "passes"] == 0
+    assert df.loc[(840, "A"), "xg"] == pytest.approx(0.1)
+
+
+def test_aggregator_rejects_non_positive_window():
+    with pytest.raises(ValueError):
+        SlidingWindowAggregator(window=0)
+
+
+def test_first_half_stoppage_time_does_not_reopen_windows():
+    first_half = [_event(44, "Pass", period=1, **{"pass": {}}), _event(46, "Pressure", period=1, second=30)]
+    second_half = [_event(45, "Pressure", period=2, second=10), _event(46, "Pressure", period=2)]
+    df = rolling_metrics(first_half + second_half, window=60, step=60)
+    assert df["time"].is_monotonic_increasing
+    # The second half starts where the first ended (46:30 = 2790 s), not back at 45:00, so its
+    # pressures at 45:10 and 46:00 fall at 2800 and 2850 s instead of into the 2820 window
+    assert df.groupby("time")["pressures"].sum().to_dict() == {2640: 0, 2700: 0, 2760: 0, 2820: 2, 2880: 1}
@@ -0,0 +1,45 @@
+import json
+import pytest
+from football_stream_processor.match import simulate
+from football_stream_processor.match.simulate import MatchReplay, replay_events, resolve_events_path
+
+
+def _event(i, period, timestamp, event_type="Pass"):
+    return {"id": f"e{i}", "period": period, "timestamp": timestamp, "type": {"name": event_type}}
+
+
+EVENTS = [
+    _event(0, 1, "00:00:00.000"),
+    _event(1, 1, "00:00:02.000", "Shot"),
+    _event(2, 2, "00:00:01.000"),
+]
+
+
+def test_import_does_not_load_data():
+    assert not hasattr(simulate, "events")
+
+
+def test_resolve_events_path(tmp_path):
+    assert resolve_events_path(22912).name == "22912.json"
+    assert resolve_events_path("22912") == resolve_events_path(22912)
+    assert resolve_events_path(tmp_path / "x.json") == tmp_path / "x.json"
+
+
+def test_replay_events_sleeps_scaled_gaps():
+    sleeps = []
+    replayed = list(replay_events(EVENTS, speed=2.0, sleep=sleeps.append))
+    assert [t for t, _ in replayed] == [0.0, 2.0, 3.0]
+    assert sleeps == [1.0, 0.5]
+
+
+def test_match_replay_is_lazy(tmp_path):
+    path = tmp_path / "1.json"
+    replay = MatchReplay(path, speed=None, event_types={"Shot"})
+    path.write_text(json.dumps(EVENTS))
+    assert [e["id"] for _, e in replay] == ["e1"]
+
+
+def test_match_replay_missing_file_fails_on_iteration(tmp_path):
+    replay = MatchReplay(tmp_path / "missing.json")
+    with pytest.raises(FileNotFoundError):
+        next(iter(replay))
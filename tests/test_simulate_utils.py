@@ -1,3 +1,4 @@
+import json
 import numpy as np
 from app.utils.simulate_utils import load_match_events
 
@@ -33,3 +34,28 @@ def test_load_match_events_structure():
     # Sanity check: values should be non-negative
     assert np.all(xg_team1 >= 0), "xg_team1 contains negative values"
     assert np.all(xg_team2 >= 0), "xg_team2 contains negative values"
+
+
+def test_load_match_events_times_share_the_rolling_metrics_axis(tmp_path, monkeypatch):
+    from app.utils import simulate_utils
+    from football_stream_processor.match.rolling_metrics import rolling_metrics
+
+    events = [
+        {"period": 1, "minute": 47, "second": 0, "type": {"name": "Pass"}, "team": {"name": "A"},
+         "location": [60.0, 40.0], "pass": {}},
+        {"period": 2, "minute": 45, "second": 30, "type": {"name": "Shot"}, "team": {"name": "B"},
+         "location": [110.0, 40.0], "shot": {"statsbomb_xg": 0.4}},
+    ]
+    (tmp_path / "events").mkdir()
+    (tmp_path / "events" / "900001.json").write_text(json.dumps(events))
+    monkeypatch.setattr(simulate_utils, "DATA_DIR", str(tmp_path))
+
+    passes, _, xg_team2, times = simulate_utils.load_match_events(900001)
+    # The second half starts where the first half's stoppage time ended (47:00), not at 45:00
+    assert passes[0]["time"] == 47 * 60
+    assert times == [47 * 60 + 30]
+    assert xg_team2.tolist() == [0.4]
+
+    rolling = rolling_metrics(events, window=60, step=60)
+    shot_windows = rolling[(rolling["team"] == "B") & (rolling["xg"] > 0)]["time"]
+    assert shot_windows.tolist() == [47 * 60 + 60]
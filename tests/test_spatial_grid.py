@@ -0,0 +1,59 @@
+import json
+import numpy as np
+import pytest
+from football_stream_processor.utils.spatial_grid import (
+    ZoneCounts, assign_cells, build_zone_counts, count_grid
+)
+
+
+def test_assign_cells_edges_and_off_pitch():
+    cells = assign_cells([0.0, 3.99, 4.0, 120.0, 60.0, 4.0, -1.0, np.nan, 10.0],
+                         [0.0, 0.0, 4.0, 80.0, 40.0, 4.01, 10.0, 10.0, 80.5])
+    # x bins are closed on the left; y bins are closed on the top, as in mplsoccer
+    assert cells.tolist() == [0, 0, 1, 19 * 30 + 29, 9 * 30 + 15, 30 + 1, -1, -1, -1]
+
+
+def test_count_grid_matches_mplsoccer_bin_statistic():
+    mplsoccer = pytest.importorskip("mplsoccer")
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(-5, 125, 2000), rng.uniform(-5, 85, 2000)
+    # StatsBomb coordinates are often whole or half numbers that fall on bin edges
+    grid_x, grid_y = np.meshgrid(np.arange(-1, 121.5, 0.5), np.arange(-1, 81.5, 0.5))
+    x, y = np.concatenate([x, grid_x.ravel()]), np.concatenate([y, grid_y.ravel()])
+    expected = mplsoccer.Pitch(pitch_type="statsbomb").bin_statistic(x, y, statistic="count", bins=(30, 20))
+    np.testing.assert_array_equal(count_grid(x, y), np.nan_to_num(expected["statistic"]))
+
+
+def _event(player_id, team_id, x, y):
+    return {"type": {"name": "Pass"}, "team": {"id": team_id, "name": "T"},
+            "player": {"id": player_id, "name": "P"}, "location": [x, y]}
+
+
+@pytest.fixture
+def zones(tmp_path):
+    events_dir = tmp_path / "events"
+    events_dir.mkdir()
+    match_1 = [_event(10, 1, 1.0, 1.0), _event(10, 1, 1.5, 1.5), _event(11, 1, 110.0, 70.0), _event(20, 2, 60.0, 40.0)]
+    match_2 = [_event(10, 1, 1.0, 1.0), _event(20, 2, 119.0, 79.0), {"type": {"name": "Half Start"}}]
+    (events_dir / "1.json").write_text(json.dumps(match_1))
+    (events_dir / "2.json").write_text(json.dumps(match_2))
+    build_zone_counts(events_dir, tmp_path / "zones", resolutions=((30, 20), (12, 8)), workers=2)
+    return tmp_path / "zones"
+
+
+def test_zone_counts_aggregate_players_teams_and_matches(zones):
+    counts = ZoneCounts(zones)
+    player = counts.grid("players", 10)
+    assert player.shape == (20, 30)
+    assert player[0, 0] == 3 and player.sum() == 3
+    assert counts.grid("players", 10, match_ids=[2]).sum() == 1
+    assert counts.grid("teams", 2).sum() == 2
+    assert counts.grid("matches", 1).sum() == 4
+    assert counts.grid("players", 999).sum() == 0
+    assert ZoneCounts(zones, bins=(12, 8)).grid("teams", 1).sum() == 4
+
+
+def test_region_count(zones):
+    counts = ZoneCounts(zones)
+    assert counts.region_count("teams", 1, x_range=(0, 60), y_range=(0, 80)) == 3
+    assert counts.region_count("teams", 1, x_range=(100, 120), y_range=(60, 80)) == 1
@@ -0,0 +1,102 @@
+from pathlib import Path
+import mlflow
+import numpy as np
+import optuna
+import pandas as pd
+import pytest
+from sklearn.pipeline import Pipeline
+from football_stream_processor.config import PASS_DATA_PATH
+from football_stream_processor.models.xg_model.model import get_model
+from football_stream_processor.models.xg_model.train import (StudyData, create_preprocessor, create_pruner, get_storage,
+                                                         run_study)
+from football_stream_processor.utils.column_store import save_columns
+
+
+def _pass_data(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    start_x, start_y = rng.uniform(0, 120, n), rng.uniform(0, 80, n)
+    end_x, end_y = rng.uniform(0, 120, n), rng.uniform(0, 80, n)
+    distance = np.hypot(end_x - start_x, end_y - start_y)
+    return pd.DataFrame({
+        "start_x": start_x, "start_y": start_y, "end_x": end_x, "end_y": end_y,
+        "distance": distance, "angle": np.arctan2(end_y - start_y, end_x - start_x),
+        "minute": rng.integers(1, 95, n),
+        "pass_outcome": (distance + rng.normal(0, 10, n) < 40).astype(int),
+    })
+
+
+def test_study_data_transforms_once_with_the_per_trial_split():
+    data = StudyData(_pass_data())
+    assert data.Xt_train.shape[0] == len(data.y_train) == 320
+    assert data.Xt_test.shape[0] == len(data.y_test) == 80
+    assert data.timings["load"] > 0 and data.timings["preprocess"] > 0
+
+
+def test_shared_preprocessor_matches_per_trial_pipeline():
+    data = StudyData(_pass_data())
+    params = {"n_estimators": 20, "max_depth": 3}
+    shared = data.pipeline(get_model("xgboost", **params).fit(data.Xt_train, data.y_train))
+    per_trial = Pipeline([("preprocessor", create_preprocessor()), ("classifier", get_model("xgboost", **params))])
+    per_trial.fit(data.X_train, data.y_train)
+    np.testing.assert_allclose(shared.predict_proba(data.X_test), per_trial.predict_proba(data.X_test))
+
+
+def test_timing_report_estimates_per_trial_preparation():
+    data = StudyData(_pass_data())
+    data.timings.update(load=1.0, preprocess=1.0, trials=18.0)
+    report = data.timing_report(n_trials=9)
+    assert report["prep_fraction"] == 0.1
+    assert report["per_trial_prep_fraction"] == 20 / 38
+
+
+def test_parallel_trials_share_storage_and_log_separate_runs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", f"sqlite:///{tmp_path / 'mlflow.db'}")
+    save_columns(_pass_data(), Path(PASS_DATA_PATH))
+    mlflow.set_experiment("parallel")
+    storage = str(tmp_path / "journal.log")
+    study = optuna.create_study(direction="maximize", study_name="parallel", storage=get_storage(storage))
+    data = StudyData()
+
+    with mlflow.start_run() as parent:
+        run_study(study, data, n_trials=4, workers=2, storage=storage, parent_run_id=parent.info.run_id)
+
+    assert len(study.trials) == 4
+    assert data.preparations == 3
+    runs = mlflow.search_runs(filter_string=f"tags.mlflow.parentRunId = '{parent.info.run_id}'")
+    run_ids = {trial.user_attrs["mlflow_run_id"] for trial in study.trials}
+    assert set(runs["run_id"]) == run_ids
+    for run_id in run_ids:
+        assert [a.path for a in mlflow.MlflowClient().list_artifacts(run_id)] == ["confusion_matrix.png"]
+
+
+def test_subsample_is_stratified_and_cached():
+    data = StudyData(_pass_data())
+    X, y = data.subsample(0.25)
+    assert X.shape[0] == len(y) == round(len(data.y_fit) * 0.25)
+    assert abs(y.mean() - data.y_fit.mean()) < 0.02
+    assert data.subsample(0.25)[0] is X
+
+
+def test_trials_stop_early_prune_and_use_subsamples(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", f"sqlite:///{tmp_path / 'mlflow.db'}")
+    mlflow.set_experiment("trials")
+    data = StudyData(_pass_data())
+
+    study = optuna.create_study(direction="maximize", pruner=create_pruner("none"))
+    run_study(study, data, n_trials=3, early_stopping_rounds=5, subsample_trials=1)
+    assert [t.user_attrs["fidelity"] for t in study.trials] == [0.25, 1.0, 1.0]
+    for trial in study.trials:
+        assert trial.user_attrs["rounds"] <= trial.user_attrs["best_iteration"] + 1 + 5
+
+    # Validation AUC never reaches 1.1, so every trial is pruned at its first report
+    study = optuna.create_study(direction="maximize", pruner=optuna.pruners.ThresholdPruner(lower=1.1))
+    run_study(study, data, n_trials=2)
+    assert all(t.state == optuna.trial.TrialState.PRUNED for t in study.trials)
+    assert all(t.user_attrs["rounds"] == 10 for t in study.trials)
+
+
+def test_create_pruner_rejects_unknown_name():
+    with pytest.raises(ValueError):
+        create_pruner("random")
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from football_stream_processor.utils.time_utils import (
+    MatchClock,
+    PeriodClock,
+    elapsed_seconds,
+    timestamp_to_seconds,
+    timestamps_to_seconds,
+)
+
+
+def test_timestamp_to_seconds():
+    assert timestamp_to_seconds("00:00:00.000") == 0.0
+    assert timestamp_to_seconds("01:02:03.456") == pytest.approx(3723.456)
+
+
+def test_timestamps_to_seconds_matches_scalar():
+    timestamps = ["00:00:00.000", "00:12:34.567", "00:47:59.999", "01:00:00.100"]
+    expected = [timestamp_to_seconds(t) for t in timestamps]
+    np.testing.assert_allclose(timestamps_to_seconds(timestamps), expected)
+
+
+def test_timestamps_to_seconds_irregular_format_falls_back():
+    np.testing.assert_allclose(timestamps_to_seconds(["00:00:01.5", "00:00:02.250"]), [1.5, 2.25])
+    assert timestamps_to_seconds([]).size == 0
+
+
+def test_elapsed_seconds_handles_period_reset():
+    periods = [1, 1, 2, 2]
+    timestamps = ["00:00:00.000", "00:47:00.000", "00:00:00.000", "00:10:00.000"]
+    elapsed = elapsed_seconds(periods, timestamps)
+
+    np.testing.assert_allclose(elapsed, [0.0, 2820.0, 2820.0, 3420.0])
+    assert np.all(np.diff(elapsed) >= 0)
+
+
+def test_period_clock_matches_vectorized():
+    periods = [1, 1, 2, 2, 3]
+    timestamps = ["00:00:01.000", "00:46:10.500", "00:00:02.000", "00:48:00.000", "00:01:00.000"]
+    clock = PeriodClock()
+    streamed = [clock.elapsed(p, t) for p, t in zip(periods, timestamps)]
+    np.testing.assert_allclose(streamed, elapsed_seconds(periods, timestamps))
+
+
+def test_match_clock_starts_periods_after_stoppage_time():
+    clock = MatchClock()
+    assert clock.observe(1, 2000.5) == 2000.5
+    assert clock.observe(1, 2770.0) == 2770.0
+    # 46:10 of the first half pushes the second half start past 45:00
+    assert clock.observe(2, 5.0) == 2775.0
+    assert clock.to_match_seconds(2, -3.0) == 2767.0
+    # Without stoppage time the nominal start is kept
+    assert clock.observe(3, 0.0) == 5400.0
@@ -0,0 +1,107 @@
+import random
+import pandas as pd
+import pytest
+from football_stream_processor.match.rolling_metrics import ROLLING_COLUMNS, SlidingWindowAggregator, rolling_metrics
+from football_stream_processor.stream.watermark import ReorderBuffer, event_time_key
+
+
+def _event(index, period, seconds, event_type="Pass"):
+    minute, second = divmod(int(seconds), 60)
+    return {
+        "index": index, "period": period, "timestamp": f"00:{minute:02d}:{seconds % 60:06.3f}",
+        "minute": minute + (45 if period == 2 else 0), "second": second,
+        "type": {"name": event_type}, "team": {"name": "A"}, "pass": {},
+    }
+
+
+MATCH = [_event(i, 1, i * 2.0) for i in range(200)] + [_event(200 + i, 2, i * 2.0) for i in range(200)]
+
+
+def _shuffle_locally(events, max_shift, seed=0):
+    rng = random.Random(seed)
+    keyed = sorted(enumerate(events), key=lambda item: item[0] + rng.uniform(0, max_shift))
+    return [event for _, event in keyed]
+
+
+def test_event_time_key_orders_periods_before_timestamps():
+    assert event_time_key(_event(0, 1, 300.0)) < event_time_key(_event(1, 2, 0.0))
+
+
+def test_reorder_buffer_restores_order_within_allowed_lateness():
+    buffer = ReorderBuffer(allowed_lateness=10.0)
+    released = []
+    for event in _shuffle_locally(MATCH, max_shift=4):
+        released.extend(buffer.push(event))
+    released.extend(buffer.flush())
+    assert [e["index"] for e in released] == list(range(400))
+    assert buffer.late == 0
+
+
+def test_late_events_go_to_side_output():
+    buffer = ReorderBuffer(allowed_lateness=5.0, max_late_events=1)
+    released = []
+    for event in MATCH[:50] + [MATCH[10], MATCH[5]]:
+        released.extend(buffer.push(event))
+    assert buffer.late == 2
+    assert list(buffer.late_events) == [MATCH[5]]
+    assert len(released) + len(buffer) == 50
+
+
+def test_buffer_memory_is_bounded_for_any_disorder():
+    buffer = ReorderBuffer(allowed_lateness=1e9, max_buffer=20)
+    released = []
+    for event in reversed(MATCH):
+        released.extend(buffer.push(event))
+        assert len(buffer) <= 20
+    assert buffer.forced > 0
+    assert buffer.late + len(released) + len(buffer) == len(MATCH)
+
+
+def test_watermark_finalizes_windows_without_later_events():
+    buffer = ReorderBuffer(allowed_lateness=5.0)
+    windows = SlidingWindowAggregator(window=120, step=60)
+    rows = []
+    for event in _shuffle_locally(MATCH[:100], max_shift=2):
+        for ready in buffer.push(event):
+            rows.extend(windows.update(ready))
+        rows.extend(windows.advance(buffer.watermark_time))
+    # Events reach 198 s, the watermark 193 s: windows ending at 60, 120 and 180 are final
+    assert [row["time"] for row in rows] == [60, 120, 180]
+    for ready in buffer.flush():
+        rows.extend(windows.update(ready))
+    rows.extend(windows.flush())
+    expected = rolling_metrics(MATCH[:100], window=120, step=60)
+    assert [row["passes"] for row in rows] == expected["passes"].tolist()
+
+
+def test_watermark_stays_monotonic_with_first_half_stoppage_time():
+    # The first half runs to 46:50; the second half restarts its clock at 45:00
+    first_half = [_event(i, 1, 2500 + i * 2.0) for i in range(156)]
+    second_half = [_event(156 + i, 2, i * 2.0, "Pressure") for i in range(100)]
+    match = first_half + second_half
+    buffer = ReorderBuffer(allowed_lateness=5.0)
+    windows = SlidingWindowAggregator(window=120, step=60)
+    rows, watermarks = [], []
+    for event in _shuffle_locally(match, max_shift=2):
+        for ready in buffer.push(event):
+            rows.extend(windows.update(ready))
+        watermarks.append(buffer.watermark_time)
+        rows.extend(windows.advance(buffer.watermark_time))
+    for ready in buffer.flush():
+        rows.extend(windows.update(ready))
+    rows.extend(windows.flush())
+
+    assert watermarks == sorted(watermarks)
+    assert buffer.late == 0
+    # Windows closed early by the watermark are the ones the offline computation produces
+    expected = rolling_metrics(match, window=120, step=60)
+    pd.testing.assert_frame_equal(pd.DataFrame(rows, columns=ROLLING_COLUMNS), expected)
+    # The second half starts at 2810 s, after the first half's last event
+    pressures = expected.groupby("time")["pressures"].sum()
+    assert pressures[pressures.index <= 2760].sum() == 0
+    assert pressures[2820] == 6
+
+
+def test_reorder_buffer_rejects_empty_buffer():
+    with pytest.raises(ValueError):
+        ReorderBuffer(max_buffer=0)